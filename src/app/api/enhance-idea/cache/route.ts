@@ -0,0 +1,20 @@
+import { NextResponse } from 'next/server';
+import { enhancementCache } from '@/lib/enhancementCache';
+
+// Contadores de la caché de mejoras, consultados por la suite de tests
+export async function GET() {
+  return NextResponse.json(enhancementCache.stats());
+}
+
+// Vacía la caché y reinicia los contadores; deshabilitado en producción
+export async function DELETE() {
+  if (process.env.NODE_ENV === 'production') {
+    return NextResponse.json(
+      { error: 'No disponible en producción' },
+      { status: 403 }
+    );
+  }
+
+  enhancementCache.clear();
+  return NextResponse.json(enhancementCache.stats());
+}
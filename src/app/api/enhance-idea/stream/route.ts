@@ -0,0 +1,104 @@
+import { NextRequest, NextResponse } from 'next/server';
+import OpenAI from 'openai';
+import {
+  ENHANCEMENT_MODEL,
+  ENHANCEMENT_MAX_TOKENS,
+  ENHANCEMENT_TEMPERATURE,
+  buildEnhancementMessages,
+  enhancementErrorMessage,
+  validateEnhancementInput,
+} from '@/lib/enhancePrompt';
+import {
+  ENHANCEMENT_CACHE_HEADER,
+  enhancementCache,
+  enhancementCacheKey,
+  isCacheBypassed,
+} from '@/lib/enhancementCache';
+
+const openai = new OpenAI({
+  apiKey: process.env.OPENAI_API_KEY,
+});
+
+// Variante en streaming de /api/enhance-idea: reenvía los tokens como texto plano a medida que llegan
+export async function POST(request: NextRequest) {
+  try {
+    const { title, content } = await request.json();
+
+    const validationError = validateEnhancementInput(content);
+    if (validationError) {
+      return NextResponse.json(
+        { error: validationError },
+        { status: 400 }
+      );
+    }
+
+    const cacheKey = enhancementCacheKey(title, content);
+    const bypassCache = isCacheBypassed(request.headers);
+
+    if (bypassCache) {
+      enhancementCache.recordBypass();
+    } else {
+      const cachedContent = enhancementCache.get(cacheKey);
+      if (cachedContent) {
+        return new Response(cachedContent, {
+          headers: {
+            'Content-Type': 'text/plain; charset=utf-8',
+            'Cache-Control': 'no-cache, no-transform',
+            [ENHANCEMENT_CACHE_HEADER]: 'hit',
+          },
+        });
+      }
+    }
+
+    const completion = await openai.chat.completions.create({
+      model: ENHANCEMENT_MODEL,
+      messages: buildEnhancementMessages(title, content),
+      max_tokens: ENHANCEMENT_MAX_TOKENS,
+      temperature: ENHANCEMENT_TEMPERATURE,
+      stream: true,
+    });
+
+    const encoder = new TextEncoder();
+    const stream = new ReadableStream<Uint8Array>({
+      async start(controller) {
+        let enhancedContent = '';
+        try {
+          for await (const chunk of completion) {
+            const token = chunk.choices[0]?.delta?.content;
+            if (token) {
+              enhancedContent += token;
+              controller.enqueue(encoder.encode(token));
+            }
+          }
+          // Solo se guardan respuestas completas: un stream cancelado o con error no llega aquí
+          if (enhancedContent.trim()) {
+            enhancementCache.set(cacheKey, enhancedContent.trim());
+          }
+          controller.close();
+        } catch (error) {
+          console.error('Error en streaming de OpenAI:', error);
+          controller.error(error);
+        }
+      },
+      cancel() {
+        completion.controller.abort();
+      },
+    });
+
+    return new Response(stream, {
+      headers: {
+        'Content-Type': 'text/plain; charset=utf-8',
+        'Cache-Control': 'no-cache, no-transform',
+        [ENHANCEMENT_CACHE_HEADER]: bypassCache ? 'bypass' : 'miss',
+      },
+    });
+
+  } catch (error) {
+    console.error('Error en API de OpenAI:', error);
+
+    return NextResponse.json(
+      { error: enhancementErrorMessage(error) },
+      { status: 500 }
+    );
+  }
+}
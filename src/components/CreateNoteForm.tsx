@@ -1,7 +1,7 @@
 "use client";
 
 import { useState } from "react";
-import { useNotes } from "@/hooks/useNotes";
+import { useNoteActions } from "@/hooks/useNotes";
 
 interface CreateNoteFormProps {
   onClose?: () => void;
@@ -10,7 +10,7 @@ interface CreateNoteFormProps {
 export default function CreateNoteForm({ onClose }: CreateNoteFormProps) {
   const [title, setTitle] = useState("");
   const [content, setContent] = useState("");
-  const { createNote, creating } = useNotes();
+  const { createNote, creating } = useNoteActions();
 
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
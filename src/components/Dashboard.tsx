@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useState, useCallback, useMemo } from "react";
 import { useAuth } from "@/contexts/AuthContext";
 import { useNotes } from "@/hooks/useNotes";
 import NoteEditor from "@/components/NoteEditor";
@@ -8,25 +8,29 @@ import NotesList from "@/components/NotesList";
 
 export default function Dashboard() {
   const { user, logout } = useAuth();
-  const { notes, loading, deleteNote } = useNotes();
+  const { notes, loading, loadingMore, hasMore, loadMore, pageSize, deleteNote } = useNotes();
   const [showEditor, setShowEditor] = useState(false);
   const [currentNoteId, setCurrentNoteId] = useState<string | undefined>();
+  const currentNote = useMemo(
+    () => notes.find((note) => note.id === currentNoteId),
+    [notes, currentNoteId]
+  );
 
   const handleNewNote = () => {
     setCurrentNoteId(undefined);
     setShowEditor(true);
   };
 
-  const handleEditNote = (noteId: string) => {
+  const handleEditNote = useCallback((noteId: string) => {
     setCurrentNoteId(noteId);
     setShowEditor(true);
-  };
+  }, []);
 
   const handleNoteIdChange = (noteId: string) => {
     setCurrentNoteId(noteId);
   };
 
-  const handleDeleteNote = async (noteId: string) => {
+  const handleDeleteNote = useCallback(async (noteId: string) => {
     try {
       await deleteNote(noteId);
       if (currentNoteId === noteId) {
@@ -37,7 +41,7 @@ export default function Dashboard() {
       console.error("Error al eliminar la nota:", error);
       alert("Error al eliminar la nota. Por favor, inténtalo de nuevo.");
     }
-  };
+  }, [currentNoteId, deleteNote]);
 
   return (
     <div className="min-h-screen bg-gray-50">
@@ -92,6 +96,7 @@ export default function Dashboard() {
                 <div className="sticky top-6">
                   <NoteEditor
                     noteId={currentNoteId}
+                    note={currentNote}
                     onNoteIdChange={handleNoteIdChange}
                   />
                 </div>
@@ -104,9 +109,13 @@ export default function Dashboard() {
               <NotesList
                 notes={notes}
                 loading={loading}
+                loadingMore={loadingMore}
+                hasMore={hasMore}
+                pageSize={pageSize}
                 currentNoteId={currentNoteId}
                 onNoteClick={handleEditNote}
                 onNoteDelete={handleDeleteNote}
+                onLoadMore={loadMore}
               />
             </div>
           </div>
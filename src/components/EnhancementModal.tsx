@@ -10,6 +10,7 @@ interface EnhancementModalProps {
   enhancedContent: string;
   onAccept: (enhancedContent: string) => void;
   isLoading?: boolean;
+  isStreaming?: boolean;
 }
 
 export default function EnhancementModal({
@@ -19,6 +20,7 @@ export default function EnhancementModal({
   enhancedContent,
   onAccept,
   isLoading = false,
+  isStreaming = false,
 }: EnhancementModalProps) {
   const [selectedTab, setSelectedTab] = useState<"enhanced" | "comparison">("enhanced");
 
@@ -97,9 +99,20 @@ export default function EnhancementModal({
                 </ul>
               </div>
               
-              <div className="border border-gray-200 rounded-lg p-4">
+              <div
+                className="border border-gray-200 rounded-lg p-4"
+                id="enhanced-content"
+                data-streaming={isStreaming ? "true" : "false"}
+              >
                 <MarkdownRenderer content={enhancedContent} />
               </div>
+              {/* Fuera de #enhanced-content: su texto no cuenta como contenido generado */}
+              {isStreaming && (
+                <div className="flex items-center space-x-2 text-xs text-blue-600 mt-2">
+                  <div className="animate-spin rounded-full h-3 w-3 border-b-2 border-blue-600"></div>
+                  <span>Generando...</span>
+                </div>
+              )}
             </div>
           ) : (
             <div className="p-6">
@@ -129,7 +142,7 @@ export default function EnhancementModal({
         </div>
 
         {/* Footer */}
-        {!isLoading && (
+        {!isLoading && !isStreaming && (
           <div className="px-6 py-4 border-t border-gray-200 bg-gray-50 flex justify-end space-x-3">
             <button
               onClick={onClose}
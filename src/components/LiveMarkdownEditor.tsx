@@ -141,7 +141,10 @@ export default function LiveMarkdownEditor({
           </div>
         </div>
       ) : (
-        <div className="min-h-[400px] p-4 border border-gray-200 rounded-lg hover:border-gray-300 hover:bg-gray-50 transition-all cursor-text relative">
+        <div
+          data-testid="markdown-preview"
+          className="min-h-[400px] p-4 border border-gray-200 rounded-lg hover:border-gray-300 hover:bg-gray-50 transition-all cursor-text relative"
+        >
           {value ? (
             <MarkdownRenderer content={value} />
           ) : (
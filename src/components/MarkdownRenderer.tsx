@@ -1,119 +1,291 @@
 "use client";
 
-import ReactMarkdown from "react-markdown";
+import { memo, useDeferredValue, useEffect, useMemo, useState, type ReactElement } from "react";
+import Markdown, { type Components } from "react-markdown";
 import remarkGfm from "remark-gfm";
 import rehypeHighlight from "rehype-highlight";
 
+// Bloques renderizados de inmediato; el resto de un documento largo se añade en tramos durante el tiempo ocioso
+const INITIAL_BLOCKS = 40;
+const BLOCKS_PER_IDLE_CHUNK = 80;
+const CACHE_MAX_ENTRIES = 2000;
+
+const REMARK_PLUGINS = [remarkGfm];
+const HIGHLIGHT_PLUGINS = [rehypeHighlight];
+const NO_PLUGINS: [] = [];
+
+const components: Components = {
+  // Personalizar elementos HTML
+  h1: ({ children }) => (
+    <h1 className="text-2xl font-bold text-gray-900 mb-4 mt-6 first:mt-0">
+      {children}
+    </h1>
+  ),
+  h2: ({ children }) => (
+    <h2 className="text-xl font-semibold text-gray-900 mb-3 mt-5 first:mt-0">
+      {children}
+    </h2>
+  ),
+  h3: ({ children }) => (
+    <h3 className="text-lg font-semibold text-gray-900 mb-2 mt-4 first:mt-0">
+      {children}
+    </h3>
+  ),
+  p: ({ children }) => (
+    <p className="text-gray-700 mb-3 leading-relaxed">{children}</p>
+  ),
+  strong: ({ children }) => (
+    <strong className="font-semibold text-gray-900">{children}</strong>
+  ),
+  em: ({ children }) => (
+    <em className="italic text-gray-800">{children}</em>
+  ),
+  ul: ({ children }) => (
+    <ul className="list-disc list-inside mb-3 text-gray-700 space-y-1">
+      {children}
+    </ul>
+  ),
+  ol: ({ children }) => (
+    <ol className="list-decimal list-inside mb-3 text-gray-700 space-y-1">
+      {children}
+    </ol>
+  ),
+  li: ({ children }) => (
+    <li className="text-gray-700">{children}</li>
+  ),
+  blockquote: ({ children }) => (
+    <blockquote className="border-l-4 border-blue-300 pl-4 py-2 my-3 bg-blue-50 text-gray-700 italic">
+      {children}
+    </blockquote>
+  ),
+  code: ({ children, className }) => {
+    const isInline = !className;
+    return isInline ? (
+      <code className="bg-gray-100 text-gray-800 px-1 py-0.5 rounded text-sm font-mono">
+        {children}
+      </code>
+    ) : (
+      <code className={className}>{children}</code>
+    );
+  },
+  pre: ({ children }) => (
+    <pre className="bg-gray-900 text-gray-100 p-4 rounded-lg overflow-x-auto mb-3">
+      {children}
+    </pre>
+  ),
+  a: ({ children, href }) => (
+    <a
+      href={href}
+      target="_blank"
+      rel="noopener noreferrer"
+      className="text-blue-600 hover:text-blue-800 underline"
+    >
+      {children}
+    </a>
+  ),
+  table: ({ children }) => (
+    <div className="overflow-x-auto mb-3">
+      <table className="min-w-full border border-gray-300">
+        {children}
+      </table>
+    </div>
+  ),
+  thead: ({ children }) => (
+    <thead className="bg-gray-50">{children}</thead>
+  ),
+  th: ({ children }) => (
+    <th className="border border-gray-300 px-3 py-2 text-left font-semibold text-gray-900">
+      {children}
+    </th>
+  ),
+  td: ({ children }) => (
+    <td className="border border-gray-300 px-3 py-2 text-gray-700">
+      {children}
+    </td>
+  ),
+  hr: () => (
+    <hr className="border-gray-300 my-6" />
+  ),
+};
+
+export interface MarkdownMetrics {
+  blocksParsed: number;
+  cacheHits: number;
+  parseMs: number;
+  lastParseMs: number;
+}
+
+// Métricas de render acumuladas en la página (la suite de tests las lee de window)
+const metrics: MarkdownMetrics = { blocksParsed: 0, cacheHits: 0, parseMs: 0, lastParseMs: 0 };
+if (typeof window !== "undefined") {
+  (window as any).__notedeaMarkdownMetrics = metrics;
+}
+
+// Resultado del parseo por contenido del bloque (y si lleva resaltado), con expulsión LRU
+const renderCache = new Map<string, ReactElement>();
+
+const hasCode = (block: string) => /^\s*(```|~~~)/m.test(block);
+
+// Definiciones de enlaces por referencia ("[ref]: url") y de notas al pie ("[^1]: texto")
+const LINK_DEFINITION = /^ {0,3}\[(?!\^)[^\]]+\]:[ \t]*\S/;
+const FOOTNOTE_DEFINITION = /^ {0,3}\[\^[^\]]+\]:/m;
+
+/**
+ * Divide el documento en bloques separados por líneas en blanco, sin partir bloques de código
+ * y uniendo las líneas sangradas al bloque anterior (continuaciones de elementos de lista).
+ */
+export function splitMarkdownBlocks(content: string): string[] {
+  const blocks: string[] = [];
+  let current: string[] = [];
+  let fence: string | null = null;
+
+  for (const line of content.split("\n")) {
+    const fenceMatch = line.match(/^\s*(`{3,}|~{3,})/);
+    if (fenceMatch) {
+      if (fence === null) {
+        fence = fenceMatch[1][0];
+      } else if (fenceMatch[1][0] === fence) {
+        fence = null;
+      }
+    }
+
+    if (fence === null && line.trim() === "") {
+      if (current.length > 0) {
+        blocks.push(current.join("\n"));
+        current = [];
+      }
+      continue;
+    }
+
+    if (current.length === 0 && blocks.length > 0 && /^\s+\S/.test(line)) {
+      current = [blocks.pop()!, ""];
+    }
+    current.push(line);
+  }
+
+  if (current.length > 0) {
+    blocks.push(current.join("\n"));
+  }
+  return blocks;
+}
+
+/**
+ * Definiciones de enlaces por referencia del documento (fuera de bloques de código). Valen para
+ * todo el documento, así que se añaden a cada bloque para que "[texto][ref]" se resuelva aunque
+ * la definición esté en otro bloque.
+ */
+export function extractLinkDefinitions(content: string): string {
+  const definitions: string[] = [];
+  let fence: string | null = null;
+
+  for (const line of content.split("\n")) {
+    const fenceMatch = line.match(/^\s*(`{3,}|~{3,})/);
+    if (fenceMatch) {
+      if (fence === null) {
+        fence = fenceMatch[1][0];
+      } else if (fenceMatch[1][0] === fence) {
+        fence = null;
+      }
+      continue;
+    }
+    if (fence === null && LINK_DEFINITION.test(line)) {
+      definitions.push(line);
+    }
+  }
+  return definitions.join("\n");
+}
+
+function renderBlock(block: string, highlight: boolean, definitions: string): ReactElement {
+  const withHighlight = highlight && hasCode(block);
+  const key = `${withHighlight ? "h" : "p"}:${block}\u0000${definitions}`;
+
+  const cached = renderCache.get(key);
+  if (cached) {
+    metrics.cacheHits++;
+    renderCache.delete(key);
+    renderCache.set(key, cached);
+    return cached;
+  }
+
+  // Markdown es un componente síncrono sin hooks: llamarlo directamente permite cachear y medir el parseo
+  const start = performance.now();
+  const element = Markdown({
+    children: definitions ? `${block}\n\n${definitions}` : block,
+    remarkPlugins: REMARK_PLUGINS,
+    rehypePlugins: withHighlight ? HIGHLIGHT_PLUGINS : NO_PLUGINS,
+    components,
+  });
+  metrics.lastParseMs = performance.now() - start;
+  metrics.parseMs += metrics.lastParseMs;
+  metrics.blocksParsed++;
+
+  renderCache.set(key, element);
+  if (renderCache.size > CACHE_MAX_ENTRIES) {
+    renderCache.delete(renderCache.keys().next().value!);
+  }
+  return element;
+}
+
+const MarkdownBlock = memo(function MarkdownBlock({
+  block,
+  highlight,
+  definitions,
+}: {
+  block: string;
+  highlight: boolean;
+  definitions: string;
+}) {
+  return renderBlock(block, highlight, definitions);
+});
+
+const scheduleIdle = (callback: () => void): (() => void) => {
+  if (typeof window.requestIdleCallback === "function") {
+    const handle = window.requestIdleCallback(callback);
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = setTimeout(callback, 1);
+  return () => clearTimeout(handle);
+};
+
 interface MarkdownRendererProps {
   content: string;
   className?: string;
 }
 
-export default function MarkdownRenderer({ 
+function MarkdownRenderer({ 
   content, 
   className = "" 
 }: MarkdownRendererProps) {
+  // Con el valor diferido React prioriza la entrada de texto y vuelve a renderizar el Markdown después
+  const deferredContent = useDeferredValue(content);
+  const { blocks, definitions } = useMemo(() => {
+    // Las notas al pie se numeran y se listan al final del documento: con ellas se parsea entero
+    if (FOOTNOTE_DEFINITION.test(deferredContent)) {
+      return { blocks: [deferredContent], definitions: "" };
+    }
+    return {
+      blocks: splitMarkdownBlocks(deferredContent),
+      definitions: extractLinkDefinitions(deferredContent),
+    };
+  }, [deferredContent]);
+  const [visibleBlocks, setVisibleBlocks] = useState(INITIAL_BLOCKS);
+  // El resaltado de sintaxis es lo más costoso: se aplica cuando el navegador queda libre
+  const [highlight, setHighlight] = useState(false);
+
+  useEffect(() => scheduleIdle(() => setHighlight(true)), []);
+
+  useEffect(() => {
+    if (visibleBlocks >= blocks.length) return;
+    return scheduleIdle(() => setVisibleBlocks((count) => count + BLOCKS_PER_IDLE_CHUNK));
+  }, [visibleBlocks, blocks.length]);
+
   return (
     <div className={`prose prose-sm max-w-none ${className}`}>
-      <ReactMarkdown
-        remarkPlugins={[remarkGfm]}
-        rehypePlugins={[rehypeHighlight]}
-        components={{
-          // Personalizar elementos HTML
-          h1: ({ children }) => (
-            <h1 className="text-2xl font-bold text-gray-900 mb-4 mt-6 first:mt-0">
-              {children}
-            </h1>
-          ),
-          h2: ({ children }) => (
-            <h2 className="text-xl font-semibold text-gray-900 mb-3 mt-5 first:mt-0">
-              {children}
-            </h2>
-          ),
-          h3: ({ children }) => (
-            <h3 className="text-lg font-semibold text-gray-900 mb-2 mt-4 first:mt-0">
-              {children}
-            </h3>
-          ),
-          p: ({ children }) => (
-            <p className="text-gray-700 mb-3 leading-relaxed">{children}</p>
-          ),
-          strong: ({ children }) => (
-            <strong className="font-semibold text-gray-900">{children}</strong>
-          ),
-          em: ({ children }) => (
-            <em className="italic text-gray-800">{children}</em>
-          ),
-          ul: ({ children }) => (
-            <ul className="list-disc list-inside mb-3 text-gray-700 space-y-1">
-              {children}
-            </ul>
-          ),
-          ol: ({ children }) => (
-            <ol className="list-decimal list-inside mb-3 text-gray-700 space-y-1">
-              {children}
-            </ol>
-          ),
-          li: ({ children }) => (
-            <li className="text-gray-700">{children}</li>
-          ),
-          blockquote: ({ children }) => (
-            <blockquote className="border-l-4 border-blue-300 pl-4 py-2 my-3 bg-blue-50 text-gray-700 italic">
-              {children}
-            </blockquote>
-          ),
-          code: ({ children, className }) => {
-            const isInline = !className;
-            return isInline ? (
-              <code className="bg-gray-100 text-gray-800 px-1 py-0.5 rounded text-sm font-mono">
-                {children}
-              </code>
-            ) : (
-              <code className={className}>{children}</code>
-            );
-          },
-          pre: ({ children }) => (
-            <pre className="bg-gray-900 text-gray-100 p-4 rounded-lg overflow-x-auto mb-3">
-              {children}
-            </pre>
-          ),
-          a: ({ children, href }) => (
-            <a
-              href={href}
-              target="_blank"
-              rel="noopener noreferrer"
-              className="text-blue-600 hover:text-blue-800 underline"
-            >
-              {children}
-            </a>
-          ),
-          table: ({ children }) => (
-            <div className="overflow-x-auto mb-3">
-              <table className="min-w-full border border-gray-300">
-                {children}
-              </table>
-            </div>
-          ),
-          thead: ({ children }) => (
-            <thead className="bg-gray-50">{children}</thead>
-          ),
-          th: ({ children }) => (
-            <th className="border border-gray-300 px-3 py-2 text-left font-semibold text-gray-900">
-              {children}
-            </th>
-          ),
-          td: ({ children }) => (
-            <td className="border border-gray-300 px-3 py-2 text-gray-700">
-              {children}
-            </td>
-          ),
-          hr: () => (
-            <hr className="border-gray-300 my-6" />
-          ),
-        }}
-      >
-        {content}
-      </ReactMarkdown>
+      {blocks.slice(0, visibleBlocks).map((block, index) => (
+        <MarkdownBlock key={index} block={block} highlight={highlight} definitions={definitions} />
+      ))}
     </div>
   );
 }
+
+export default memo(MarkdownRenderer);
@@ -1,16 +1,17 @@
 "use client";
 
+import { memo } from "react";
 import { Note } from "@/types/note";
 import MarkdownRenderer from "./MarkdownRenderer";
 
 interface NoteCardProps {
   note: Note;
   isSelected?: boolean;
-  onClick?: () => void;
+  onClick?: (noteId: string) => void;
   onDelete?: (noteId: string) => void;
 }
 
-export default function NoteCard({
+function NoteCard({
   note,
   isSelected = false,
   onClick,
@@ -56,7 +57,7 @@ export default function NoteCard({
 
   return (
     <div
-      onClick={onClick}
+      onClick={() => onClick?.(note.id)}
       className={`bg-white p-4 rounded-lg shadow-sm border cursor-pointer transition-all hover:shadow-md ${
         isSelected
           ? "border-indigo-500 ring-2 ring-indigo-200"
@@ -65,7 +66,8 @@ export default function NoteCard({
       data-testid={`note-card-${note.id}`}
     >
       <div className="flex justify-between items-start mb-2">
-        <h4 className="font-medium text-gray-900 truncate">
+        {/* elementtiming permite medir desde los tests cuándo se pinta la primera tarjeta */}
+        <h4 className="font-medium text-gray-900 truncate" {...{ elementtiming: "note-card" }}>
           {note.title || "Sin título"}
         </h4>
         <span className="text-xs text-gray-500 whitespace-nowrap ml-2">
@@ -135,3 +137,6 @@ export default function NoteCard({
     </div>
   );
 }
+
+// Con la sincronización incremental solo cambia la referencia de las notas modificadas
+export default memo(NoteCard);
@@ -1,8 +1,7 @@
 "use client";
 
 import { useAutoSave } from "@/hooks/useAutoSave";
-import { useNotes } from "@/hooks/useNotes";
-import { useEffect, useState } from "react";
+import { useEffect } from "react";
 import { Note } from "@/types/note";
 import LiveMarkdownEditor from "./LiveMarkdownEditor";
 import EnhancementModal from "./EnhancementModal";
@@ -10,6 +9,8 @@ import { useIdeaEnhancement } from "@/hooks/useIdeaEnhancement";
 
 interface NoteEditorProps {
   noteId?: string;
+  // Nota seleccionada en la lista: puede estar en una página que solo ha cargado el Dashboard
+  note?: Note;
   initialTitle?: string;
   initialContent?: string;
   onNoteIdChange?: (noteId: string) => void;
@@ -17,21 +18,12 @@ interface NoteEditorProps {
 
 export default function NoteEditor({
   noteId,
+  note,
   initialTitle,
   initialContent,
   onNoteIdChange,
 }: NoteEditorProps) {
-  const { notes } = useNotes();
-  const [currentNote, setCurrentNote] = useState<Note | null>(null);
-
-  useEffect(() => {
-    if (noteId && notes.length > 0) {
-      const note = notes.find((n) => n.id === noteId);
-      setCurrentNote(note || null);
-    } else {
-      setCurrentNote(null);
-    }
-  }, [noteId, notes]);
+  const currentNote = noteId && note?.id === noteId ? note : null;
 
   const {
     title,
@@ -39,7 +31,9 @@ export default function NoteEditor({
     setTitle,
     setContent,
     isSaving,
+    isOffline,
     lastSaved,
+    saveError,
     noteId: currentNoteId,
   } = useAutoSave({
     delay: 1000,
@@ -60,6 +54,7 @@ export default function NoteEditor({
     acceptEnhancement,
     closeModal,
     isLoading: isEnhancing,
+    isStreaming: isEnhancementStreaming,
     isModalOpen,
     enhancementResult,
     error: enhancementError,
@@ -87,13 +82,24 @@ export default function NoteEditor({
         <div className="flex items-center justify-between">
           <div className="flex items-center space-x-4">
             <div className="flex items-center space-x-2">
-              {isSaving ? (
-                <div className="flex items-center space-x-2 text-blue-600">
+              {isSaving && isOffline ? (
+                <div
+                  className="text-xs text-amber-600"
+                  data-testid="offline-pending-indicator"
+                >
+                  Sin conexión: cambios pendientes de sincronizar
+                </div>
+              ) : isSaving ? (
+                <div className="flex items-center space-x-2 text-blue-600" data-testid="saving-indicator">
                   <div className="animate-spin rounded-full h-3 w-3 border-b-2 border-blue-600"></div>
                   <span className="text-xs">Guardando...</span>
                 </div>
+              ) : saveError ? (
+                <div className="text-xs text-red-600" data-testid="save-error-indicator">
+                  {saveError}
+                </div>
               ) : lastSaved ? (
-                <div className="text-xs text-gray-500">
+                <div className="text-xs text-gray-500" data-testid="save-indicator">
                   Guardado a las {formatTime(lastSaved)}
                 </div>
               ) : (
@@ -107,7 +113,7 @@ export default function NoteEditor({
             {content && content.trim().length >= 10 && (
               <button
                 onClick={handleEnhanceIdea}
-                disabled={isEnhancing || isSaving}
+                disabled={isEnhancing || isEnhancementStreaming || isSaving}
                 id="enhance-idea-button"
                 className="flex items-center space-x-2 px-3 py-1.5 text-xs font-medium text-white bg-gradient-to-r from-purple-600 to-blue-600 rounded-md hover:from-purple-700 hover:to-blue-700 disabled:opacity-50 disabled:cursor-not-allowed transition-all"
               >
@@ -189,6 +195,7 @@ console.log('¡Hola mundo!');
         enhancedContent={enhancementResult?.enhancedContent || ""}
         onAccept={acceptEnhancement}
         isLoading={isEnhancing}
+        isStreaming={isEnhancementStreaming}
       />
     </div>
   );
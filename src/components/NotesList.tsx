@@ -1,23 +1,59 @@
 "use client";
 
+import { useEffect, useRef, useState } from "react";
 import { Note } from "@/types/note";
 import NoteCard from "@/components/NoteCard";
 
+// Altura fija de cada fila (tarjeta + separación): permite calcular la ventana visible sin medir el DOM
+const ROW_HEIGHT = 176;
+// Filas extra renderizadas por encima y por debajo de la ventana visible
+const OVERSCAN = 4;
+
 interface NotesListProps {
   notes: Note[];
   loading: boolean;
+  loadingMore?: boolean;
+  hasMore?: boolean;
+  pageSize?: number;
   currentNoteId?: string;
   onNoteClick: (noteId: string) => void;
   onNoteDelete?: (noteId: string) => void;
+  onLoadMore?: () => void;
 }
 
 export default function NotesList({
   notes,
   loading,
+  loadingMore = false,
+  hasMore = false,
+  pageSize,
   currentNoteId,
   onNoteClick,
   onNoteDelete,
+  onLoadMore,
 }: NotesListProps) {
+  const scrollRef = useRef<HTMLDivElement>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(800);
+
+  useEffect(() => {
+    const element = scrollRef.current;
+    if (!element) return;
+
+    const observer = new ResizeObserver(() => setViewportHeight(element.clientHeight));
+    observer.observe(element);
+    setViewportHeight(element.clientHeight);
+    return () => observer.disconnect();
+  }, [loading, notes.length === 0]);
+
+  // Pide la siguiente página cuando la ventana visible se acerca al final de lo cargado
+  useEffect(() => {
+    const visibleEnd = scrollTop + viewportHeight;
+    if (hasMore && !loadingMore && onLoadMore && visibleEnd >= (notes.length - OVERSCAN) * ROW_HEIGHT) {
+      onLoadMore();
+    }
+  }, [scrollTop, viewportHeight, notes.length, hasMore, loadingMore, onLoadMore]);
+
   if (loading) {
     return (
       <div className="text-center py-12">
@@ -48,27 +84,55 @@ export default function NotesList({
     );
   }
 
+  const firstIndex = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+  const lastIndex = Math.min(notes.length, Math.ceil((scrollTop + viewportHeight) / ROW_HEIGHT) + OVERSCAN);
+
   return (
     <div className="space-y-4">
       <div className="flex items-center justify-between mb-4">
         <h3 className="text-lg font-medium text-gray-900">
-          {notes.length} {notes.length === 1 ? "idea" : "ideas"}
+          {notes.length}
+          {hasMore ? "+" : ""} {notes.length === 1 ? "idea" : "ideas"}
         </h3>
         <span className="text-sm text-gray-500">
           Ordenadas por fecha de actualización
         </span>
       </div>
 
-      <div className="space-y-3">
-        {notes.map((note) => (
-          <NoteCard
-            key={note.id}
-            note={note}
-            isSelected={currentNoteId === note.id}
-            onClick={() => onNoteClick(note.id)}
-            onDelete={onNoteDelete}
-          />
-        ))}
+      {/* Solo las filas dentro de la ventana visible existen en el DOM */}
+      <div
+        ref={scrollRef}
+        onScroll={(e) => setScrollTop(e.currentTarget.scrollTop)}
+        className="overflow-y-auto"
+        style={{ maxHeight: "calc(100vh - 220px)" }}
+        data-testid="notes-list"
+        data-loaded-count={notes.length}
+        data-page-size={pageSize ?? notes.length}
+        data-has-more={hasMore}
+      >
+        <div className="relative" style={{ height: notes.length * ROW_HEIGHT }}>
+          {notes.slice(firstIndex, lastIndex).map((note, offset) => (
+            <div
+              key={note.id}
+              className="absolute inset-x-0 overflow-hidden pb-3"
+              style={{ top: (firstIndex + offset) * ROW_HEIGHT, height: ROW_HEIGHT }}
+              data-index={firstIndex + offset}
+            >
+              <NoteCard
+                note={note}
+                isSelected={currentNoteId === note.id}
+                onClick={onNoteClick}
+                onDelete={onNoteDelete}
+              />
+            </div>
+          ))}
+        </div>
+
+        {loadingMore && (
+          <div className="text-center py-4 text-sm text-gray-500" data-testid="notes-list-loading-more">
+            Cargando más ideas...
+          </div>
+        )}
       </div>
     </div>
   );
@@ -2,7 +2,8 @@
 
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
-import { useNotes } from '@/hooks/useNotes';
+import { useNoteActions } from '@/hooks/useNotes';
+import { noteWriteQueue } from '@/services/noteWriteQueue';
 import { CreateNoteData } from '@/types/note';
 
 interface UseAutoSaveOptions {
@@ -19,14 +20,18 @@ export const useAutoSave = ({
   noteId
 }: UseAutoSaveOptions = {}) => {
   const { user } = useAuth();
-  const { saveNote } = useNotes();
+  const { queueSave } = useNoteActions();
   const [title, setTitle] = useState(initialTitle);
   const [content, setContent] = useState(initialContent);
   const [isSaving, setIsSaving] = useState(false);
   const [lastSaved, setLastSaved] = useState<Date | null>(null);
+  const [saveError, setSaveError] = useState<string | null>(null);
+  const [isOffline, setIsOffline] = useState(false);
   const [currentNoteId, setCurrentNoteId] = useState(noteId);
   
   const saveTimeoutRef = useRef<NodeJS.Timeout | null>(null);
+  // Guardados encolados aún sin confirmar: isSaving no vuelve a false hasta que se confirman todos
+  const pendingSavesRef = useRef(0);
   const isInitialRender = useRef(true);
 
   useEffect(() => {
@@ -47,9 +52,16 @@ export const useAutoSave = ({
     }
   }, [noteId, currentNoteId]);
 
+  useEffect(() => {
+    return noteWriteQueue.subscribe((stats) => {
+      setIsOffline(!stats.connected && stats.pendingNotes > 0);
+    });
+  }, []);
+
   const saveNoteData = useCallback(async (titleToSave: string, contentToSave: string) => {
     if (!user || (!titleToSave.trim() && !contentToSave.trim())) return;
 
+    pendingSavesRef.current++;
     setIsSaving(true);
     try {
       const noteData: CreateNoteData = {
@@ -57,19 +69,27 @@ export const useAutoSave = ({
         content: contentToSave.trim(),
       };
 
-      const resultNoteId = await saveNote(currentNoteId || null, noteData);
+      // El id llega de inmediato (también sin conexión): las siguientes ediciones no crean otra nota
+      const { noteId: resultNoteId, saved } = queueSave(currentNoteId || null, noteData);
       
       if (!currentNoteId) {
         setCurrentNoteId(resultNoteId);
       }
       
+      await saved;
       setLastSaved(new Date());
+      setSaveError(null);
     } catch (error) {
+      // Los cambios siguen en la cola persistente y se reenviarán al reconectar
       console.error('Error saving note:', error);
+      setSaveError('No se pudieron sincronizar los cambios; se reintentará automáticamente');
     } finally {
-      setIsSaving(false);
+      pendingSavesRef.current--;
+      if (pendingSavesRef.current === 0) {
+        setIsSaving(false);
+      }
     }
-  }, [user, currentNoteId, saveNote]);
+  }, [user, currentNoteId, queueSave]);
 
   useEffect(() => {
     if (isInitialRender.current) {
@@ -107,7 +127,9 @@ export const useAutoSave = ({
     setTitle,
     setContent,
     isSaving,
+    isOffline,
     lastSaved,
+    saveError,
     noteId: currentNoteId,
     forceSave,
   };
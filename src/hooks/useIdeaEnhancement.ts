@@ -1,9 +1,10 @@
 "use client";
 
-import { useState } from "react";
+import { useRef, useState } from "react";
 
 interface UseIdeaEnhancementProps {
   onEnhancementAccepted?: (enhancedContent: string) => void;
+  stream?: boolean;
 }
 
 interface EnhancementResult {
@@ -12,11 +13,14 @@ interface EnhancementResult {
   originalTitle: string;
 }
 
-export function useIdeaEnhancement({ onEnhancementAccepted }: UseIdeaEnhancementProps = {}) {
+export function useIdeaEnhancement({ onEnhancementAccepted, stream = true }: UseIdeaEnhancementProps = {}) {
   const [isLoading, setIsLoading] = useState(false);
+  const [isStreaming, setIsStreaming] = useState(false);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [enhancementResult, setEnhancementResult] = useState<EnhancementResult | null>(null);
   const [error, setError] = useState<string | null>(null);
+  // Petición en curso: se cancela al cerrar el modal o al empezar otra mejora
+  const abortControllerRef = useRef<AbortController | null>(null);
 
   const enhanceIdea = async (title: string, content: string) => {
     // Validar entrada vacía con más detalle
@@ -31,13 +35,18 @@ export function useIdeaEnhancement({ onEnhancementAccepted }: UseIdeaEnhancement
       return;
     }
 
+    abortControllerRef.current?.abort();
+    const controller = new AbortController();
+    abortControllerRef.current = controller;
+
     setIsLoading(true);
     setError(null);
     setIsModalOpen(true);
 
     try {
-      const response = await fetch("/api/enhance-idea", {
+      const response = await fetch(stream ? "/api/enhance-idea/stream" : "/api/enhance-idea", {
         method: "POST",
+        signal: controller.signal,
         headers: {
           "Content-Type": "application/json",
         },
@@ -49,14 +58,54 @@ export function useIdeaEnhancement({ onEnhancementAccepted }: UseIdeaEnhancement
         throw new Error(errorData.error || "Error al mejorar la idea");
       }
 
-      const result: EnhancementResult = await response.json();
-      setEnhancementResult(result);
+      if (!stream || !response.body) {
+        const result: EnhancementResult = await response.json();
+        setEnhancementResult(result);
+        return;
+      }
+
+      // Renderizar los tokens a medida que llegan: el spinner solo se muestra hasta el primero
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let enhancedContent = "";
+      setIsStreaming(true);
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (controller.signal.aborted) return;
+        if (done) break;
+
+        enhancedContent += decoder.decode(value, { stream: true });
+        setIsLoading(false);
+        setEnhancementResult({
+          enhancedContent,
+          originalContent: content,
+          originalTitle: title,
+        });
+      }
+
+      enhancedContent += decoder.decode();
+      if (!enhancedContent.trim()) {
+        throw new Error("No se pudo generar contenido mejorado");
+      }
+
+      setEnhancementResult({
+        enhancedContent: enhancedContent.trim(),
+        originalContent: content,
+        originalTitle: title,
+      });
     } catch (err) {
+      // Cancelada a propósito: el modal ya está cerrado o hay otra mejora en marcha
+      if (controller.signal.aborted) return;
       console.error("Error al mejorar idea:", err);
       setError(err instanceof Error ? err.message : "Error desconocido");
       setIsModalOpen(false);
     } finally {
-      setIsLoading(false);
+      if (abortControllerRef.current === controller) {
+        abortControllerRef.current = null;
+        setIsLoading(false);
+        setIsStreaming(false);
+      }
     }
   };
 
@@ -68,6 +117,10 @@ export function useIdeaEnhancement({ onEnhancementAccepted }: UseIdeaEnhancement
   };
 
   const closeModal = () => {
+    abortControllerRef.current?.abort();
+    abortControllerRef.current = null;
+    setIsLoading(false);
+    setIsStreaming(false);
     setIsModalOpen(false);
     setEnhancementResult(null);
     setError(null);
@@ -78,6 +131,7 @@ export function useIdeaEnhancement({ onEnhancementAccepted }: UseIdeaEnhancement
     acceptEnhancement,
     closeModal,
     isLoading,
+    isStreaming,
     isModalOpen,
     enhancementResult,
     error,
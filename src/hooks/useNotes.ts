@@ -1,33 +1,30 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useCallback, useSyncExternalStore } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { notesService } from '@/services/notesService';
-import { Note, CreateNoteData } from '@/types/note';
+import { notesStore, NotesState } from '@/services/notesStore';
+import { CreateNoteData } from '@/types/note';
 
-export const useNotes = () => {
+// Lee una parte del store compartido: el componente solo se renderiza si cambia lo seleccionado.
+// El selector debe devolver valores del estado (no objetos nuevos en cada llamada).
+export const useNotesSelector = <T>(selector: (state: NotesState) => T): T => {
   const { user } = useAuth();
-  const [notes, setNotes] = useState<Note[]>([]);
-  const [loading, setLoading] = useState(true);
-  const [creating, setCreating] = useState(false);
 
   useEffect(() => {
-    if (!user) {
-      setNotes([]);
-      setLoading(false);
-      return;
-    }
+    notesStore.setUser(user ? user.uid : null);
+  }, [user]);
 
-    setLoading(true);
-    const unsubscribe = notesService.subscribeToUserNotes(user.uid, (userNotes) => {
-      setNotes(userNotes);
-      setLoading(false);
-    });
+  const getSelection = () => selector(notesStore.getSnapshot());
+  return useSyncExternalStore(notesStore.subscribe, getSelection, getSelection);
+};
 
-    return unsubscribe;
-  }, [user]);
+// Operaciones sobre las notas sin suscribirse a la lista (p. ej. desde useAutoSave)
+export const useNoteActions = () => {
+  const { user } = useAuth();
+  const [creating, setCreating] = useState(false);
 
-  const createNote = async (noteData: CreateNoteData) => {
+  const createNote = useCallback(async (noteData: CreateNoteData) => {
     if (!user) throw new Error('Usuario no autenticado');
     
     setCreating(true);
@@ -39,9 +36,9 @@ export const useNotes = () => {
     } finally {
       setCreating(false);
     }
-  };
+  }, [user]);
 
-  const updateNote = async (noteId: string, updates: Partial<CreateNoteData>) => {
+  const updateNote = useCallback(async (noteId: string, updates: Partial<CreateNoteData>) => {
     if (!user) throw new Error('Usuario no autenticado');
     
     try {
@@ -50,9 +47,9 @@ export const useNotes = () => {
       console.error('Error updating note:', error);
       throw error;
     }
-  };
+  }, [user]);
 
-  const saveNote = async (noteId: string | null, noteData: CreateNoteData) => {
+  const saveNote = useCallback(async (noteId: string | null, noteData: CreateNoteData) => {
     if (!user) throw new Error('Usuario no autenticado');
     
     try {
@@ -61,9 +58,15 @@ export const useNotes = () => {
       console.error('Error saving note:', error);
       throw error;
     }
-  };
+  }, [user]);
+
+  const queueSave = useCallback((noteId: string | null, noteData: CreateNoteData) => {
+    if (!user) throw new Error('Usuario no autenticado');
 
-  const deleteNote = async (noteId: string) => {
+    return notesService.queueSave(user.uid, noteId, noteData);
+  }, [user]);
+
+  const deleteNote = useCallback(async (noteId: string) => {
     if (!user) throw new Error('Usuario no autenticado');
     
     try {
@@ -72,15 +75,36 @@ export const useNotes = () => {
       console.error('Error deleting note:', error);
       throw error;
     }
-  };
+  }, [user]);
 
   return {
-    notes,
-    loading,
     creating,
     createNote,
     updateNote,
     saveNote,
+    queueSave,
     deleteNote,
   };
 };
+
+export const useNotes = () => {
+  const { notes, loading, loadingMore, limit } = useNotesSelector((state) => state);
+  const actions = useNoteActions();
+
+  // Si la última página llegó completa puede haber notas más antiguas en el servidor
+  const hasMore = notes.length >= limit;
+
+  const loadMore = useCallback(() => {
+    notesStore.loadMore();
+  }, []);
+
+  return {
+    notes,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    pageSize: limit,
+    ...actions,
+  };
+};
@@ -0,0 +1,59 @@
+import type { ChatCompletionMessageParam } from 'openai/resources/chat/completions';
+
+export const ENHANCEMENT_MODEL = 'gpt-4o-mini';
+export const ENHANCEMENT_MAX_TOKENS = 1500;
+export const ENHANCEMENT_TEMPERATURE = 0.7;
+
+export function validateEnhancementInput(content: unknown): string | null {
+  if (typeof content !== 'string' || content.trim().length === 0) {
+    return 'El contenido no puede estar vacío';
+  }
+
+  if (content.trim().length < 10) {
+    return 'El contenido es muy corto para procesar';
+  }
+
+  return null;
+}
+
+export function buildEnhancementMessages(title: string | undefined, content: string): ChatCompletionMessageParam[] {
+  const prompt = `Eres un asistente experto en mejorar ideas y contenido en español. Tu tarea es tomar una idea y mejorarla manteniendo el formato Markdown.
+
+INSTRUCCIONES:
+- Mantén la esencia y el propósito original de la idea
+- Mejora la claridad, estructura y coherencia
+- Agrega detalles útiles y ejemplos cuando sea apropiado
+- Usa formato Markdown para organizar mejor el contenido
+- Mantén un tono profesional pero accesible
+- Si la idea es muy corta, expándela con contexto relevante
+- Si es muy larga, organízala mejor con encabezados y secciones
+
+Título original: ${title || 'Sin título'}
+
+Contenido original:
+${content}
+
+Por favor, devuelve una versión mejorada de esta idea en formato Markdown:`;
+
+  return [
+    {
+      role: "system",
+      content: "Eres un asistente experto en mejorar ideas y contenido en español. Respondes únicamente con el contenido mejorado en formato Markdown, sin explicaciones adicionales."
+    },
+    {
+      role: "user",
+      content: prompt
+    }
+  ];
+}
+
+export function enhancementErrorMessage(error: unknown): string {
+  if (error instanceof Error) {
+    // Error específico de OpenAI
+    if (error.message.includes('API key')) {
+      return 'Clave de API de OpenAI no configurada correctamente';
+    }
+    return `Error al procesar la solicitud: ${error.message}`;
+  }
+  return 'Error interno del servidor';
+}
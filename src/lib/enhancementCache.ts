@@ -0,0 +1,106 @@
+import { createHash } from 'crypto';
+import { ENHANCEMENT_MAX_TOKENS, ENHANCEMENT_MODEL, ENHANCEMENT_TEMPERATURE } from '@/lib/enhancePrompt';
+
+export const ENHANCEMENT_CACHE_HEADER = 'x-enhancement-cache';
+export const ENHANCEMENT_CACHE_BYPASS = 'bypass';
+
+const DEFAULT_TTL_MS = 60 * 60 * 1000;
+const DEFAULT_MAX_ENTRIES = 500;
+
+// Un valor mal escrito daría NaN, con el que nada caduca ni se expulsa: se usa el valor por defecto
+function positiveNumberFromEnv(value: string | undefined, fallback: number): number {
+  const parsed = Number(value);
+  return value !== undefined && Number.isFinite(parsed) && parsed > 0 ? parsed : fallback;
+}
+
+interface CacheEntry {
+  value: string;
+  expiresAt: number;
+}
+
+export interface EnhancementCacheStats {
+  hits: number;
+  misses: number;
+  bypasses: number;
+  evictions: number;
+  size: number;
+  maxEntries: number;
+  ttlMs: number;
+}
+
+// Caché LRU con TTL: un Map conserva el orden de inserción, así que el primer elemento es el menos usado
+class EnhancementCache {
+  private entries = new Map<string, CacheEntry>();
+  private counters = { hits: 0, misses: 0, bypasses: 0, evictions: 0 };
+
+  constructor(private ttlMs: number, private maxEntries: number) {}
+
+  get(key: string): string | null {
+    const entry = this.entries.get(key);
+    if (!entry || entry.expiresAt <= Date.now()) {
+      if (entry) {
+        this.entries.delete(key);
+      }
+      this.counters.misses++;
+      return null;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.counters.hits++;
+    return entry.value;
+  }
+
+  set(key: string, value: string) {
+    if (this.maxEntries <= 0) {
+      return;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+
+    while (this.entries.size > this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value as string;
+      this.entries.delete(oldestKey);
+      this.counters.evictions++;
+    }
+  }
+
+  recordBypass() {
+    this.counters.bypasses++;
+  }
+
+  clear() {
+    this.entries.clear();
+    this.counters = { hits: 0, misses: 0, bypasses: 0, evictions: 0 };
+  }
+
+  stats(): EnhancementCacheStats {
+    return {
+      ...this.counters,
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      ttlMs: this.ttlMs,
+    };
+  }
+}
+
+// Una sola instancia por proceso: cada ruta se empaqueta por separado y HMR vuelve a evaluar el
+// módulo en desarrollo, así que se guarda en globalThis para que enhance-idea y /cache compartan caché
+const globalForCache = globalThis as typeof globalThis & { __notedeaEnhancementCache?: EnhancementCache };
+
+export const enhancementCache = globalForCache.__notedeaEnhancementCache ??= new EnhancementCache(
+  positiveNumberFromEnv(process.env.ENHANCEMENT_CACHE_TTL_MS, DEFAULT_TTL_MS),
+  positiveNumberFromEnv(process.env.ENHANCEMENT_CACHE_MAX_ENTRIES, DEFAULT_MAX_ENTRIES)
+);
+
+// La clave incluye los parámetros del modelo para no servir respuestas de una configuración anterior
+export function enhancementCacheKey(title: string | undefined, content: string): string {
+  return createHash('sha256')
+    .update(JSON.stringify([ENHANCEMENT_MODEL, ENHANCEMENT_MAX_TOKENS, ENHANCEMENT_TEMPERATURE, title || '', content]))
+    .digest('hex');
+}
+
+export function isCacheBypassed(headers: Headers): boolean {
+  return headers.get(ENHANCEMENT_CACHE_HEADER)?.toLowerCase() === ENHANCEMENT_CACHE_BYPASS;
+}
@@ -1,6 +1,6 @@
 import { initializeApp } from 'firebase/app';
-import { getAuth } from 'firebase/auth';
-import { getDatabase } from 'firebase/database';
+import { getAuth, connectAuthEmulator } from 'firebase/auth';
+import { getDatabase, connectDatabaseEmulator } from 'firebase/database';
 
 const firebaseConfig = {
   apiKey: process.env.NEXT_PUBLIC_FIREBASE_API_KEY,
@@ -15,4 +15,26 @@ const firebaseConfig = {
 const app = initializeApp(firebaseConfig);
 export const auth = getAuth(app);
 export const database = getDatabase(app);
+
+// Emuladores locales de Firebase (usados por la suite de tests para ejecuciones herméticas)
+const authEmulatorUrl = process.env.NEXT_PUBLIC_FIREBASE_AUTH_EMULATOR_URL;
+const databaseEmulatorHost = process.env.NEXT_PUBLIC_FIREBASE_DATABASE_EMULATOR_HOST;
+
+if (authEmulatorUrl) {
+  connectAuthEmulator(auth, authEmulatorUrl, { disableWarnings: true });
+}
+
+if (databaseEmulatorHost) {
+  const [host, port] = databaseEmulatorHost.split(':');
+  connectDatabaseEmulator(database, host, Number(port));
+}
+
+if (typeof window !== 'undefined') {
+  // Expuesto para la suite de tests: comprueba que la app usa los emuladores que ella ha arrancado
+  (window as any).__notedeaFirebaseBackend = {
+    authEmulatorUrl: authEmulatorUrl || null,
+    databaseEmulatorHost: databaseEmulatorHost || null,
+  };
+}
+
 export default app;
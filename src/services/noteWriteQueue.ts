@@ -0,0 +1,251 @@
+import { ref, update, onValue, serverTimestamp } from 'firebase/database';
+import { database } from '@/lib/firebase';
+
+const NOTES_PATH = 'notes';
+const STORAGE_KEY_PREFIX = 'notedea:pendingWrites:';
+// Ventana en la que se acumulan ediciones de varias notas antes de enviarlas juntas
+const FLUSH_DELAY_MS = 200;
+const RETRY_DELAYS_MS = [1000, 2000, 5000, 10000, 30000];
+
+// Campos pendientes por nota: { noteId: { title: '...', content: '...' } }
+type PendingWrites = Record<string, Record<string, unknown>>;
+
+interface Waiter {
+  noteId: string;
+  resolve: () => void;
+  reject: (error: unknown) => void;
+}
+
+export interface WriteQueueStats {
+  enqueued: number;
+  flushes: number;
+  failures: number;
+  pendingNotes: number;
+  connected: boolean;
+}
+
+type Listener = (stats: WriteQueueStats) => void;
+
+/**
+ * Cola de escrituras de notas persistida en localStorage. Las ediciones de una misma nota se
+ * fusionan y se envían en lotes con una única actualización multi-ruta; lo que no se confirma
+ * sobrevive a recargas y se reenvía al recuperar la conexión.
+ */
+class NoteWriteQueue {
+  private userId: string | null = null;
+  private pending: PendingWrites = {};
+  private waiters: Waiter[] = [];
+  // Notas borradas: sus escrituras se descartan aunque lleguen después (p. ej. un auto-guardado programado)
+  private discarded = new Set<string>();
+  private flushing = false;
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private retryAttempt = 0;
+  private unsubscribeConnected: (() => void) | null = null;
+  private listeners = new Set<Listener>();
+  private stats = { enqueued: 0, flushes: 0, failures: 0 };
+  private connected = false;
+
+  resume(userId: string) {
+    if (this.userId === userId) return;
+    this.suspend();
+
+    this.userId = userId;
+    this.pending = this.load();
+    // Al reconectar se reenvía inmediatamente lo pendiente, sin esperar al siguiente reintento
+    this.unsubscribeConnected = onValue(ref(database, '.info/connected'), (snapshot) => {
+      this.connected = snapshot.val() === true;
+      if (this.connected) {
+        this.retryAttempt = 0;
+        this.scheduleFlush(0);
+      }
+      this.notify();
+    });
+    this.scheduleFlush(0);
+  }
+
+  suspend() {
+    this.unsubscribeConnected?.();
+    this.unsubscribeConnected = null;
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    this.waiters.splice(0).forEach((waiter) => waiter.reject(new Error('Sesión cerrada')));
+    this.userId = null;
+    this.pending = {};
+    this.discarded.clear();
+    this.notify();
+  }
+
+  /** Encola campos de una nota; la promesa se resuelve cuando el servidor confirma la escritura */
+  enqueue(userId: string, noteId: string, fields: Record<string, unknown>): Promise<void> {
+    if (this.userId !== userId) {
+      this.resume(userId);
+    }
+    if (this.discarded.has(noteId)) {
+      return Promise.resolve();
+    }
+
+    this.pending[noteId] = { ...this.pending[noteId], ...fields };
+    this.stats.enqueued++;
+    this.persist();
+    this.notify();
+
+    const saved = new Promise<void>((resolve, reject) => {
+      this.waiters.push({ noteId, resolve, reject });
+    });
+    this.scheduleFlush(FLUSH_DELAY_MS);
+    return saved;
+  }
+
+  /**
+   * Olvida las escrituras pendientes de una nota que se va a borrar: si se enviaran después del
+   * borrado volverían a crear la nota solo con los campos editados. Sus esperas se dan por resueltas.
+   */
+  discard(noteId: string) {
+    this.discarded.add(noteId);
+    delete this.pending[noteId];
+    this.persist();
+    this.waiters = this.waiters.filter((waiter) => {
+      if (waiter.noteId !== noteId) return true;
+      waiter.resolve();
+      return false;
+    });
+    this.notify();
+  }
+
+  hasPendingWrites(noteId?: string): boolean {
+    return noteId ? noteId in this.pending : Object.keys(this.pending).length > 0;
+  }
+
+  subscribe(listener: Listener): () => void {
+    this.listeners.add(listener);
+    listener(this.getStats());
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  getStats(): WriteQueueStats {
+    return {
+      ...this.stats,
+      pendingNotes: Object.keys(this.pending).length,
+      connected: this.connected,
+    };
+  }
+
+  private scheduleFlush(delay: number) {
+    if (this.flushTimer || this.flushing) return;
+    this.flushTimer = setTimeout(() => {
+      this.flushTimer = null;
+      this.flush();
+    }, delay);
+  }
+
+  private async flush() {
+    const userId = this.userId;
+    if (!userId || this.flushing || Object.keys(this.pending).length === 0) return;
+
+    this.flushing = true;
+    const batch = JSON.parse(JSON.stringify(this.pending)) as PendingWrites;
+    const batchWaiters = this.waiters.splice(0);
+
+    const updates: Record<string, unknown> = {};
+    Object.entries(batch).forEach(([noteId, fields]) => {
+      Object.entries(fields).forEach(([field, value]) => {
+        updates[`${NOTES_PATH}/${userId}/${noteId}/${field}`] = value;
+      });
+      updates[`${NOTES_PATH}/${userId}/${noteId}/updatedAt`] = serverTimestamp();
+    });
+
+    try {
+      await update(ref(database), updates);
+      this.stats.flushes++;
+      this.retryAttempt = 0;
+      if (this.userId === userId) {
+        this.acknowledge(batch);
+      }
+      batchWaiters.forEach((waiter) => waiter.resolve());
+    } catch (error) {
+      console.error('Error al sincronizar escrituras pendientes:', error);
+      this.stats.failures++;
+      // Las notas borradas mientras se enviaba el lote ya no están en la cola: no se reintentan
+      const retryWaiters = batchWaiters.filter((waiter) => {
+        if (!this.discarded.has(waiter.noteId)) return true;
+        waiter.resolve();
+        return false;
+      });
+      if (this.retryAttempt >= RETRY_DELAYS_MS.length) {
+        // Se conserva en localStorage: se reintentará con la próxima edición o reconexión
+        this.retryAttempt = 0;
+        retryWaiters.forEach((waiter) => waiter.reject(error));
+      } else {
+        this.waiters.unshift(...retryWaiters);
+        this.flushing = false;
+        this.scheduleFlush(RETRY_DELAYS_MS[this.retryAttempt++]);
+        this.notify();
+        return;
+      }
+    }
+
+    this.flushing = false;
+    this.notify();
+    // Ediciones llegadas mientras se enviaba el lote
+    if (this.waiters.length > 0) {
+      this.scheduleFlush(FLUSH_DELAY_MS);
+    }
+  }
+
+  // Quita de la cola solo los campos que no se han vuelto a editar mientras se enviaba el lote
+  private acknowledge(batch: PendingWrites) {
+    Object.entries(batch).forEach(([noteId, fields]) => {
+      const current = this.pending[noteId];
+      if (!current) return;
+      Object.entries(fields).forEach(([field, value]) => {
+        if (JSON.stringify(current[field]) === JSON.stringify(value)) {
+          delete current[field];
+        }
+      });
+      if (Object.keys(current).length === 0) {
+        delete this.pending[noteId];
+      }
+    });
+    this.persist();
+  }
+
+  private storageKey() {
+    return `${STORAGE_KEY_PREFIX}${this.userId}`;
+  }
+
+  private load(): PendingWrites {
+    try {
+      return JSON.parse(localStorage.getItem(this.storageKey()) || '{}');
+    } catch {
+      return {};
+    }
+  }
+
+  private persist() {
+    if (!this.userId) return;
+    try {
+      if (Object.keys(this.pending).length > 0) {
+        localStorage.setItem(this.storageKey(), JSON.stringify(this.pending));
+      } else {
+        localStorage.removeItem(this.storageKey());
+      }
+    } catch (error) {
+      console.error('No se pudo persistir la cola de escrituras:', error);
+    }
+  }
+
+  private notify() {
+    const stats = this.getStats();
+    this.listeners.forEach((listener) => listener(stats));
+    if (typeof window !== 'undefined') {
+      // Expuesto para la suite de tests
+      (window as any).__notedeaWriteQueue = stats;
+    }
+  }
+}
+
+export const noteWriteQueue = new NoteWriteQueue();
@@ -4,16 +4,62 @@ import {
   set, 
   remove, 
   onValue, 
-  off,
+  onChildAdded,
+  onChildChanged,
+  onChildRemoved,
   serverTimestamp,
   query,
   orderByChild,
-  equalTo
+  equalTo,
+  limitToLast
 } from 'firebase/database';
 import { database } from '@/lib/firebase';
+import { noteWriteQueue } from '@/services/noteWriteQueue';
 import { Note, CreateNoteData } from '@/types/note';
 
 const NOTES_PATH = 'notes';
+export const NOTES_PAGE_SIZE = 50;
+
+// Últimos valores escritos o recibidos de cada nota: permiten enviar solo los campos que cambian
+const knownNotes = new Map<string, CreateNoteData>();
+// Suscripciones abiertas con subscribeToUserNotes; el store de notas debería mantener como máximo una
+let activeSubscriptions = 0;
+const noteKey = (userId: string, noteId: string) => `${userId}/${noteId}`;
+
+const changedFields = (known: CreateNoteData | undefined, noteData: Partial<CreateNoteData>) => {
+  const changes: Partial<CreateNoteData> = {};
+  (Object.keys(noteData) as (keyof CreateNoteData)[]).forEach((field) => {
+    if (noteData[field] !== undefined && known?.[field] !== noteData[field]) {
+      changes[field] = noteData[field];
+    }
+  });
+  return changes;
+};
+
+const toNote = (id: string, noteData: any): Note => ({
+  id,
+  title: noteData.title || '',
+  content: noteData.content || '',
+  userId: noteData.userId,
+  createdAt: noteData.createdAt ? new Date(noteData.createdAt) : new Date(),
+  updatedAt: noteData.updatedAt ? new Date(noteData.updatedAt) : new Date(),
+});
+
+// Posición de inserción en una lista ordenada por updatedAt descendente (búsqueda binaria)
+const sortedIndex = (notes: Note[], note: Note): number => {
+  const time = note.updatedAt.getTime();
+  let low = 0;
+  let high = notes.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (notes[mid].updatedAt.getTime() > time) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  return low;
+};
 
 export const notesService = {
   async createNote(userId: string, noteData: CreateNoteData): Promise<string> {
@@ -26,69 +72,150 @@ export const notesService = {
       createdAt: serverTimestamp(),
       updatedAt: serverTimestamp(),
     });
+    knownNotes.set(noteKey(userId, newNoteRef.key!), { ...noteData });
     
     return newNoteRef.key!;
   },
 
+  // Escritura parcial: solo los campos modificados, conservando userId y createdAt
   async updateNote(userId: string, noteId: string, updates: Partial<CreateNoteData>): Promise<void> {
-    const noteRef = ref(database, `${NOTES_PATH}/${userId}/${noteId}`);
-    await set(noteRef, {
-      ...updates,
-      updatedAt: serverTimestamp(),
-    });
+    await this.queueSave(userId, noteId, updates).saved;
   },
 
   async saveNote(userId: string, noteId: string, noteData: CreateNoteData): Promise<void> {
-    const noteRef = ref(database, `${NOTES_PATH}/${userId}/${noteId}`);
-    await set(noteRef, {
-      ...noteData,
-      userId,
-      updatedAt: serverTimestamp(),
-    });
+    await this.queueSave(userId, noteId, noteData).saved;
   },
 
   async upsertNote(userId: string, noteId: string | null, noteData: CreateNoteData): Promise<string> {
-    if (noteId) {
-      await this.saveNote(userId, noteId, noteData);
-      return noteId;
-    } else {
-      return await this.createNote(userId, noteData);
+    const queued = this.queueSave(userId, noteId, noteData);
+    await queued.saved;
+    return queued.noteId;
+  },
+
+  // Encola la escritura en la cola persistente y devuelve el id de inmediato, también sin conexión;
+  // saved se resuelve cuando el servidor la confirma
+  queueSave(
+    userId: string,
+    noteId: string | null,
+    noteData: Partial<CreateNoteData>
+  ): { noteId: string; saved: Promise<void> } {
+    if (!noteId) {
+      // push() sin valor solo genera la clave en el cliente, no escribe nada
+      const newNoteId = push(ref(database, `${NOTES_PATH}/${userId}`)).key!;
+      knownNotes.set(noteKey(userId, newNoteId), { title: '', content: '', ...noteData });
+      return {
+        noteId: newNoteId,
+        saved: noteWriteQueue.enqueue(userId, newNoteId, {
+          ...noteData,
+          userId,
+          createdAt: serverTimestamp(),
+        }),
+      };
     }
+
+    const key = noteKey(userId, noteId);
+    const known = knownNotes.get(key);
+    const changes = changedFields(known, noteData);
+    if (Object.keys(changes).length === 0) {
+      return { noteId, saved: Promise.resolve() };
+    }
+
+    // Las siguientes ediciones se comparan con lo ya encolado, no con lo confirmado
+    knownNotes.set(key, { title: '', content: '', ...known, ...changes });
+    return {
+      noteId,
+      // Si la nota aún no se conoce, se asegura el propietario sin tocar createdAt
+      saved: noteWriteQueue.enqueue(userId, noteId, known ? changes : { ...changes, userId }),
+    };
   },
 
   async deleteNote(userId: string, noteId: string): Promise<void> {
+    // Primero se descartan las ediciones sin enviar, para que un envío posterior no resucite la nota
+    noteWriteQueue.discard(noteId);
     const noteRef = ref(database, `${NOTES_PATH}/${userId}/${noteId}`);
     await remove(noteRef);
+    knownNotes.delete(noteKey(userId, noteId));
   },
 
-  subscribeToUserNotes(userId: string, callback: (notes: Note[]) => void): () => void {
-    const userNotesRef = ref(database, `${NOTES_PATH}/${userId}`);
-    
-    const handleData = (snapshot: any) => {
-      const notes: Note[] = [];
-      if (snapshot.exists()) {
-        const data = snapshot.val();
-        Object.keys(data).forEach((key) => {
-          const noteData = data[key];
-          notes.push({
-            id: key,
-            title: noteData.title || '',
-            content: noteData.content || '',
-            userId: noteData.userId,
-            createdAt: noteData.createdAt ? new Date(noteData.createdAt) : new Date(),
-            updatedAt: noteData.updatedAt ? new Date(noteData.updatedAt) : new Date(),
-          });
-        });
-        
-        notes.sort((a, b) => b.updatedAt.getTime() - a.updatedAt.getTime());
+  // Suscripción a las `limit` notas más recientes, ordenadas por el servidor según updatedAt
+  subscribeToUserNotes(
+    userId: string,
+    callback: (notes: Note[]) => void,
+    limit: number = NOTES_PAGE_SIZE
+  ): () => void {
+    const userNotesRef = query(
+      ref(database, `${NOTES_PATH}/${userId}`),
+      orderByChild('updatedAt'),
+      limitToLast(limit)
+    );
+    // Lista ordenada que se parchea con cada evento; las notas no modificadas conservan su identidad
+    const notes: Note[] = [];
+    let initialLoadDone = false;
+    let emitScheduled = false;
+
+    // Agrupa los eventos de un mismo tick en una sola notificación
+    const emit = () => {
+      if (!initialLoadDone || emitScheduled) return;
+      emitScheduled = true;
+      queueMicrotask(() => {
+        emitScheduled = false;
+        callback(notes.slice());
+      });
+    };
+
+    const rememberNote = (id: string, noteData: any) => {
+      knownNotes.set(noteKey(userId, id), {
+        title: noteData.title || '',
+        content: noteData.content || '',
+      });
+    };
+
+    const removeNote = (id: string) => {
+      const index = notes.findIndex((note) => note.id === id);
+      if (index !== -1) {
+        notes.splice(index, 1);
       }
-      callback(notes);
     };
 
-    onValue(userNotesRef, handleData);
+    const insertNote = (note: Note) => {
+      notes.splice(sortedIndex(notes, note), 0, note);
+    };
+
+    const unsubscribers = [
+      onChildAdded(userNotesRef, (snapshot) => {
+        rememberNote(snapshot.key!, snapshot.val());
+        insertNote(toNote(snapshot.key!, snapshot.val()));
+        emit();
+      }),
+      onChildChanged(userNotesRef, (snapshot) => {
+        rememberNote(snapshot.key!, snapshot.val());
+        removeNote(snapshot.key!);
+        insertNote(toNote(snapshot.key!, snapshot.val()));
+        emit();
+      }),
+      onChildRemoved(userNotesRef, (snapshot) => {
+        knownNotes.delete(noteKey(userId, snapshot.key!));
+        removeNote(snapshot.key!);
+        emit();
+      }),
+    ];
+
+    // El evento value llega después de todos los child_added iniciales: marca el fin de la carga
+    // (también cuando el usuario no tiene notas). Comparte la sincronización con los listeners de hijos.
+    const unsubscribeInitialLoad = onValue(userNotesRef, () => {
+      initialLoadDone = true;
+      emit();
+    }, { onlyOnce: true });
 
+    activeSubscriptions++;
     return () => {
-      off(userNotesRef, 'value', handleData);
+      activeSubscriptions--;
+      unsubscribeInitialLoad();
+      unsubscribers.forEach((unsubscribe) => unsubscribe());
     };
   },
+
+  getActiveSubscriptionCount(): number {
+    return activeSubscriptions;
+  },
 };
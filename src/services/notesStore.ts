@@ -0,0 +1,139 @@
+import { notesService, NOTES_PAGE_SIZE } from '@/services/notesService';
+import { noteWriteQueue } from '@/services/noteWriteQueue';
+import { Note } from '@/types/note';
+
+export interface NotesState {
+  userId: string | null;
+  notes: Note[];
+  loading: boolean;
+  loadingMore: boolean;
+  limit: number;
+}
+
+export interface NotesStoreStats {
+  listeners: number;
+  subscriptions: number;
+  updates: number;
+  lastUpdateMs: number;
+  totalUpdateMs: number;
+}
+
+type Listener = () => void;
+
+/**
+ * Estado de las notas del usuario compartido por todos los componentes. Mantiene una única
+ * suscripción a Firebase mientras haya algún consumidor y reparte cada cambio a todos ellos; el
+ * estado es inmutable, así que cada consumidor se vuelve a renderizar solo si cambia lo que selecciona.
+ */
+class NotesStore {
+  private state: NotesState = {
+    userId: null,
+    notes: [],
+    loading: true,
+    loadingMore: false,
+    limit: NOTES_PAGE_SIZE,
+  };
+  private listeners = new Set<Listener>();
+  private unsubscribeNotes: (() => void) | null = null;
+  // Suscripción de la ventana anterior, que sigue abierta hasta que llegan los datos de la ampliada
+  private unsubscribePrevious: (() => void) | null = null;
+  // Descarta notificaciones de una suscripción ya cerrada (pueden llegar en un microtask posterior)
+  private generation = 0;
+  private stats = { updates: 0, lastUpdateMs: 0, totalUpdateMs: 0 };
+
+  setUser(userId: string | null) {
+    if (this.state.userId === userId && (userId || !this.state.loading)) return;
+    this.disconnect();
+
+    if (!userId) {
+      noteWriteQueue.suspend();
+      this.setState({ userId: null, notes: [], loading: false, loadingMore: false, limit: NOTES_PAGE_SIZE });
+      return;
+    }
+
+    // Reenvía lo que quedó pendiente en localStorage (p. ej. ediciones sin conexión antes de recargar)
+    noteWriteQueue.resume(userId);
+    this.setState({ userId, notes: [], loading: true, loadingMore: false, limit: NOTES_PAGE_SIZE });
+    this.connect();
+  }
+
+  // Amplía la ventana de la consulta; cargar más no muestra el spinner de carga
+  loadMore() {
+    const { notes, limit, loadingMore } = this.state;
+    if (notes.length < limit || loadingMore) return;
+
+    // Sin cerrar todavía la consulta anterior: Firebase conserva en caché las notas que ya tiene
+    // en lugar de liberarlas y volver a descargar la ventana entera
+    this.releasePrevious();
+    this.unsubscribePrevious = this.unsubscribeNotes;
+    this.unsubscribeNotes = null;
+    this.setState({ ...this.state, loadingMore: true, limit: limit + NOTES_PAGE_SIZE });
+    this.connect();
+  }
+
+  subscribe = (listener: Listener): (() => void) => {
+    this.listeners.add(listener);
+    this.connect();
+    this.publishStats();
+    return () => {
+      this.listeners.delete(listener);
+      if (this.listeners.size === 0) {
+        this.disconnect();
+      }
+      this.publishStats();
+    };
+  };
+
+  getSnapshot = (): NotesState => this.state;
+
+  getStats(): NotesStoreStats {
+    return {
+      ...this.stats,
+      listeners: this.listeners.size,
+      subscriptions: notesService.getActiveSubscriptionCount(),
+    };
+  }
+
+  private connect() {
+    const { userId, limit } = this.state;
+    if (this.unsubscribeNotes || !userId || this.listeners.size === 0) return;
+
+    const generation = ++this.generation;
+    this.unsubscribeNotes = notesService.subscribeToUserNotes(userId, (notes) => {
+      if (generation !== this.generation) return;
+      this.releasePrevious();
+      this.setState({ ...this.state, notes, loading: false, loadingMore: false });
+    }, limit);
+  }
+
+  private disconnect() {
+    this.generation++;
+    this.releasePrevious();
+    this.unsubscribeNotes?.();
+    this.unsubscribeNotes = null;
+  }
+
+  private releasePrevious() {
+    this.unsubscribePrevious?.();
+    this.unsubscribePrevious = null;
+  }
+
+  private setState(state: NotesState) {
+    this.state = state;
+    const start = performance.now();
+    this.listeners.forEach((listener) => listener());
+    this.stats.lastUpdateMs = performance.now() - start;
+    this.stats.totalUpdateMs += this.stats.lastUpdateMs;
+    this.stats.updates++;
+    this.publishStats();
+  }
+
+  private publishStats() {
+    if (typeof window !== 'undefined') {
+      // Expuesto para la suite de tests
+      (window as any).__notedeaNotesStore = this.getStats();
+    }
+  }
+}
+
+export const notesStore = new NotesStore();
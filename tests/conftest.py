@@ -1,26 +1,53 @@
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 import os
-from datetime import datetime
-import subprocess
-import sys
+import json
 import time
+from dotenv import load_dotenv
+from tests.pages.base_page import BASE_URL
+from tests.utils.browser_pool import BrowserPool, merge_pool_stats, format_pool_summary
+from tests.utils.browser_profiles import (
+    DEFAULT_PROFILE,
+    PROFILES,
+    build_chrome_options,
+    apply_runtime_settings,
+    process_tree_rss,
+)
+from tests.utils.driver_resolver import ChromeDriverResolver
+from tests.utils.auth_session import AuthSessionCache
+from tests.utils.firebase_emulator import FirebaseEmulator
+from tests.utils.openai_stub import OpenAIStub
+from tests.utils.screenshot_writer import get_screenshot_writer, close_screenshot_writer
+from tests.utils.step_timer import recorder, render_timeline_html, render_aggregates_html
+from tests.utils.note_seeder import close_connection_pools
+from tests.utils.duration_history import (
+    DurationHistory,
+    RunDurations,
+    estimate_durations,
+    predict_makespan,
+    format_schedule_summary,
+)
+from tests.utils.trace_capture import (
+    enable_performance_logging,
+    start_trace,
+    collect_trace,
+    write_trace,
+    summarize_trace,
+    render_trace_summary_html,
+)
+from tests.utils.test_data import TestDataGenerator
 
-@pytest.fixture(scope="function")
-def driver():
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--allow-running-insecure-content")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
+# Misma configuración de Firebase que usa la app de Next.js
+load_dotenv(".env.local")
+
+run_durations = RunDurations()
+
+def create_driver(profile, driver_path, trace=False, cache_slot=0):
+    chrome_options = build_chrome_options(profile, cache_slot)
+    if trace:
+        enable_performance_logging(chrome_options)
     
     driver = None
     max_retries = 3
@@ -28,60 +55,315 @@ def driver():
     for attempt in range(max_retries):
         try:
             print(f"Intentando inicializar ChromeDriver (intento {attempt + 1}/{max_retries})...")
-            driver = webdriver.Chrome(options=chrome_options)
+            driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             break
             
         except Exception as e:
             print(f"Error al inicializar ChromeDriver: {e}")
+            # Un driver que no se puede ejecutar o que no corresponde al Chrome instalado no se arregla reintentando
+            if not os.access(driver_path, os.X_OK) or "only supports Chrome version" in str(e):
+                raise Exception(f"No se pudo inicializar ChromeDriver ({driver_path}): {e}")
             if attempt == max_retries - 1:
-                try:
-                    subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "webdriver-manager"], check=True)
-                    
-                    from webdriver_manager.chrome import ChromeDriverManager
-                    
-                    driver_path = ChromeDriverManager().install()
-                    print(f"ChromeDriver instalado en: {driver_path}")
-                    
-                    service = Service(driver_path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                    break
-                    
-                except Exception as e2:
-                    print(f"Error con webdriver-manager: {e2}")
-                    raise Exception(f"No se pudo inicializar ChromeDriver después de {max_retries} intentos: {e2}")
+                raise Exception(f"No se pudo inicializar ChromeDriver ({driver_path}) después de {max_retries} intentos: {e}")
             
             time.sleep(2)
     
-    if not driver:
-        raise Exception("No se pudo inicializar ChromeDriver")
+    # Sin espera implícita: las comprobaciones de ausencia responden al momento y las esperas son explícitas
+    apply_runtime_settings(driver, profile)
+    
+    print(f"✅ ChromeDriver inicializado correctamente (perfil {profile})")
+    return driver
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-profile",
+        default=os.environ.get("NOTEDEA_BROWSER_PROFILE", DEFAULT_PROFILE),
+        choices=sorted(PROFILES),
+        help="Perfil de Chrome para la ejecución (también NOTEDEA_BROWSER_PROFILE)",
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=os.environ.get("NOTEDEA_BENCHMARK") == "1",
+        help="Ejecuta también los tests marcados como benchmark (también NOTEDEA_BENCHMARK=1)",
+    )
+    parser.addoption(
+        "--firebase-emulator",
+        action="store_true",
+        default=os.environ.get("NOTEDEA_FIREBASE_EMULATOR") == "1",
+        help="Usa los emuladores locales de Firebase en lugar del proyecto real (también NOTEDEA_FIREBASE_EMULATOR=1)",
+    )
+    parser.addoption(
+        "--openai-stub",
+        action="store_true",
+        default=os.environ.get("NOTEDEA_OPENAI_STUB") == "1",
+        help="Arranca un servidor local compatible con OpenAI para /api/enhance-idea (también NOTEDEA_OPENAI_STUB=1)",
+    )
+    parser.addoption(
+        "--browser-trace",
+        action="store_true",
+        default=os.environ.get("NOTEDEA_BROWSER_TRACE") == "1",
+        help="Graba una traza de Chrome por test y la adjunta al informe HTML (también NOTEDEA_BROWSER_TRACE=1)",
+    )
+    parser.addoption(
+        "--no-duration-scheduler",
+        action="store_true",
+        default=os.environ.get("NOTEDEA_DURATION_SCHEDULER") == "0",
+        help="Con xdist, usa el reparto por defecto en lugar del basado en duraciones históricas "
+             "(también NOTEDEA_DURATION_SCHEDULER=0)",
+    )
+
+def pytest_collection_modifyitems(config, items):
+    skip_benchmark = pytest.mark.skip(reason="benchmark desactivado (usa --benchmark)")
+    skip_openai = pytest.mark.skip(reason="requiere el stub de OpenAI (usa --openai-stub)")
+    for item in items:
+        if "benchmark" in item.keywords and not config.getoption("benchmark"):
+            item.add_marker(skip_benchmark)
+        # Sin el stub estos tests llamarían a la API real de OpenAI
+        if item.get_closest_marker("requires_openai_stub") and not config.getoption("openai_stub"):
+            item.add_marker(skip_openai)
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    profile = request.config.getoption("browser_profile")
+    try:
+        driver_path = ChromeDriverResolver().resolve(build_chrome_options(profile))
+    except Exception as e:
+        pytest.exit(str(e), returncode=3)
+    
+    trace = request.config.getoption("browser_trace")
+    pool = BrowserPool(
+        lambda slot: create_driver(profile, driver_path, trace, cache_slot=slot),
+        BASE_URL,
+        size=int(os.environ.get("NOTEDEA_POOL_SIZE", "1")),
+        max_uses=int(os.environ.get("NOTEDEA_POOL_MAX_USES", "10")),
+        rss_probe=lambda driver: process_tree_rss(driver.service.process.pid),
+    )
+    pool.warm_up()
     
-    driver.implicitly_wait(15)
+    yield pool
     
-    print("✅ ChromeDriver inicializado correctamente")
+    pool.close()
+    # En modo paralelo cada worker envía sus estadísticas al proceso principal
+    if hasattr(request.config, "workeroutput"):
+        request.config.workeroutput["browser_pool"] = pool.stats()
+    else:
+        request.config._browser_pool_stats.append(pool.stats())
+    print("✅ Pool de navegadores cerrado correctamente")
+
+@pytest.fixture(scope="function")
+def driver(request, browser_pool):
+    driver = browser_pool.acquire()
+    # La traza se recoge en pytest_runtest_makereport, con el navegador aún abierto
+    if request.config.getoption("browser_trace"):
+        start_trace(driver)
     
     yield driver
     
+    browser_pool.release(driver)
+
+@pytest.fixture(scope="session")
+def firebase_emulator(request):
+    if not request.config.getoption("firebase_emulator"):
+        return None
+    # Los workers de xdist usan los emuladores que arrancó el proceso principal
+    return getattr(request.config, "_firebase_emulator", None) or FirebaseEmulator.from_env()
+
+@pytest.fixture(autouse=True)
+def clean_firebase_state(firebase_emulator):
+    # En paralelo cada worker solo limpia las notas de su usuario (ver AuthSessionCache.clear_notes)
+    if firebase_emulator and not os.environ.get("PYTEST_XDIST_WORKER"):
+        firebase_emulator.reset()
+
+@pytest.fixture(scope="session")
+def openai_stub(request):
+    # Solo el proceso principal tiene acceso a los contadores del stub
+    return getattr(request.config, "_openai_stub", None)
+
+@pytest.fixture(scope="session")
+def auth_session(browser_pool, firebase_emulator):
+    session = AuthSessionCache(
+        BASE_URL,
+        TestDataGenerator.generate_email(),
+        TestDataGenerator.generate_password(),
+        emulator=firebase_emulator,
+    )
+    
+    driver = browser_pool.acquire()
     try:
-        driver.quit()
-        print("✅ ChromeDriver cerrado correctamente")
-    except:
-        pass
-
-@pytest.fixture
-def screenshot_on_failure(request, driver):
-    yield
-    if request.node.rep_call.failed:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        test_name = request.node.name
-        screenshot_path = f"screenshots/{test_name}_{timestamp}.png"
-        os.makedirs("screenshots", exist_ok=True)
-        driver.save_screenshot(screenshot_path)
-        print(f"Screenshot saved: {screenshot_path}")
+        session.sign_up(driver)
+    finally:
+        browser_pool.release(driver)
+    
+    return session
+
+@pytest.fixture(scope="function")
+def authenticated_driver(driver, auth_session):
+    auth_session.open_dashboard(driver)
+    return driver
+
+@pytest.fixture(scope="function")
+def note_seeder(authenticated_driver, auth_session):
+    # Borra al terminar todas las notas que el test haya sembrado, en una sola actualización
+    seeder = auth_session.note_seeder(authenticated_driver)
+    yield seeder
+    seeder.teardown()
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     setattr(item, "rep_" + rep.when, rep)
+    
+    if rep.when == "call" and item.config.pluginmanager.hasplugin("html"):
+        from pytest_html import extras
+        timeline = recorder.timeline(item.nodeid)
+        rep.extras = getattr(rep, "extras", []) + [
+            extras.html(render_timeline_html(timeline)),
+            extras.json(timeline, name="Pasos"),
+        ]
+    elif rep.when == "teardown":
+        recorder.finish_test()
+    
+    driver = item.funcargs.get("driver") if rep.when == "call" else None
+    if driver and item.config.getoption("browser_trace"):
+        attach_browser_trace(item, rep, driver)
+    
+    # El navegador sigue abierto en este punto: se captura el fallo aunque la política sea on-failure o sampled
+    driver = item.funcargs.get("driver") if rep.when == "call" and rep.failed else None
+    if driver:
+        try:
+            get_screenshot_writer().capture(driver, f"{item.name}_failure", force=True)
+        except WebDriverException as e:
+            print(f"⚠️ No se pudo capturar el screenshot del fallo: {e}")
+        
+        # Errores de la consola recibidos durante el test (el registro se vacía al devolver el navegador al pool)
+        events = getattr(driver, "_notedea_events", None)
+        console = events.console_messages(levels=("error", "exception", "warning")) if events else []
+        if console:
+            rep.sections.append((
+                "Consola del navegador",
+                "\n".join(f"[{message['level']}] {message['text']}" for message in console),
+            ))
+
+
+def attach_browser_trace(item, rep, driver):
+    try:
+        trace_events, network_events, metrics = collect_trace(driver)
+    except WebDriverException as e:
+        print(f"⚠️ No se pudo recoger la traza del navegador: {e}")
+        return
+    
+    summary = summarize_trace(trace_events, network_events, metrics)
+    trace_path = write_trace(item.nodeid, trace_events)
+    print(f"🔬 Traza del navegador guardada en {trace_path}")
+    
+    if item.config.pluginmanager.hasplugin("html"):
+        from pytest_html import extras
+        report_dir = os.path.dirname(os.path.abspath(item.config.getoption("htmlpath") or "."))
+        trace_link = os.path.relpath(os.path.abspath(trace_path), report_dir)
+        rep.extras = getattr(rep, "extras", []) + [
+            extras.html(render_trace_summary_html(summary, trace_link)),
+            extras.json({key: value for key, value in summary.items() if key != "waterfall"}, name="Traza"),
+        ]
+
+def pytest_runtest_setup(item):
+    recorder.start_test(item.nodeid)
+
+def pytest_runtest_logreport(report):
+    # Con xdist los informes de los workers llegan también al proceso principal, que es quien los guarda
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        run_durations.add(report)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption("no_duration_scheduler"):
+        return None
+    from tests.utils.duration_scheduler import DurationScheduling, DurationFileScheduling
+    # Con loadfile (npm run test:parallel) se ordenan ficheros enteros; con load, tests sueltos
+    scheduler_cls = {"load": DurationScheduling, "loadfile": DurationFileScheduling}.get(config.getoption("dist"))
+    return scheduler_cls(config, log, DurationHistory().load()) if scheduler_cls else None
+
+def pytest_collection_finish(session):
+    # Sin xdist el makespan previsto es la suma de las duraciones (con xdist lo calcula el planificador)
+    if session.items and not os.environ.get("PYTEST_XDIST_WORKER"):
+        history = DurationHistory().load()
+        nodeids = [item.nodeid for item in session.items]
+        makespan, per_worker = predict_makespan(list(estimate_durations(nodeids, history).values()), 1)
+        session.config._duration_schedule = {
+            "tests": len(nodeids),
+            "known": sum(1 for nodeid in nodeids if nodeid in history),
+            "workers": 1,
+            "makespan": makespan,
+            "per_worker": per_worker,
+        }
+
+def pytest_configure(config):
+    config._browser_pool_stats = []
+    config._session_started = time.perf_counter()
+    
+    # Los emuladores se arrancan una sola vez, en el proceso principal (también con xdist)
+    if config.getoption("firebase_emulator") and not hasattr(config, "workeroutput"):
+        config._firebase_emulator = FirebaseEmulator.from_env()
+        config._firebase_emulator.start()
+        if os.environ.get("NOTEDEA_EMULATOR_SEED"):
+            config._firebase_emulator.seed_from_file(os.environ["NOTEDEA_EMULATOR_SEED"])
+    
+    # La app debe arrancarse con OPENAI_BASE_URL apuntando al stub (npm run dev:mock-ai)
+    if config.getoption("openai_stub") and not hasattr(config, "workeroutput"):
+        config._openai_stub = OpenAIStub.from_env()
+        config._openai_stub.start()
+
+def pytest_unconfigure(config):
+    stub = getattr(config, "_openai_stub", None)
+    if stub:
+        stub.stop()
+    emulator = getattr(config, "_firebase_emulator", None)
+    if emulator:
+        emulator.stop()
+        print("✅ Emuladores de Firebase detenidos")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    stats = getattr(node, "workeroutput", {}).get("browser_pool")
+    if stats:
+        node.config._browser_pool_stats.append(stats)
+    recorder.merge(getattr(node, "workeroutput", {}).get("step_timings", {}))
+
+def pytest_sessionfinish(session, exitstatus):
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["step_timings"] = recorder.timelines
+    else:
+        session.config._wall_time = time.perf_counter() - session.config._session_started
+        DurationHistory().record(run_durations.per_test())
+    
+    if not hasattr(session.config, "workeroutput") and recorder.timelines:
+        timings_path = os.environ.get("NOTEDEA_TIMINGS_JSON", "reports/timings.json")
+        os.makedirs(os.path.dirname(timings_path) or ".", exist_ok=True)
+        with open(timings_path, "w") as f:
+            json.dump({"tests": recorder.timelines, "methods": recorder.aggregates()}, f, indent=2)
+    
+    close_connection_pools()
+    
+    # Esperar a que el hilo de fondo termine de escribir los screenshots pendientes
+    summary = close_screenshot_writer()
+    if summary:
+        session.config._screenshot_summary = summary
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    if recorder.timelines:
+        postfix.append(render_aggregates_html(recorder.aggregates()))
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if getattr(config, "_screenshot_summary", None):
+        terminalreporter.write_line(config._screenshot_summary)
+    if getattr(config, "_duration_schedule", None) and run_durations.workers:
+        summary = format_schedule_summary(config._duration_schedule, run_durations.workers, config._wall_time)
+        for line in summary.splitlines():
+            terminalreporter.write_line(line)
+    if config._browser_pool_stats:
+        profile = config.getoption("browser_profile")
+        for line in format_pool_summary(merge_pool_stats(config._browser_pool_stats), profile).splitlines():
+            terminalreporter.write_line(line)
@@ -1,14 +1,128 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 import os
-from datetime import datetime
+import time
+from tests.utils.driver_events import get_driver_events
+from tests.utils.screenshot_writer import get_screenshot_writer
+from tests.utils.step_timer import instrument_class, instrument_driver
 
+BASE_URL = os.environ.get("NOTEDEA_BASE_URL", "http://localhost:3000")
+
+# Resuelve en cuanto React ha confirmado el valor del input: las props que React guardó en el
+# nodo en su último commit (__reactProps$...) contienen el valor esperado y el DOM lo refleja.
+# Se comprueba en cada frame, sin retardos fijos.
+REACT_VALUE_COMMITTED_SCRIPT = """
+const element = arguments[0];
+const expected = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+
+const nextFrame = (callback) => {
+    if (document.hidden) {
+        setTimeout(callback, 16);
+    } else {
+        requestAnimationFrame(callback);
+    }
+};
+
+const committedValue = () => {
+    const propsKey = Object.keys(element).find((key) => key.startsWith('__reactProps$'));
+    return propsKey ? element[propsKey].value : element.value;
+};
+
+const check = () => {
+    const elapsed = performance.now() - start;
+    if (element.value === expected && committedValue() === expected) {
+        done({ committed: true, elapsed: elapsed });
+    } else if (elapsed > timeoutMs) {
+        done({ committed: false, elapsed: elapsed });
+    } else {
+        nextFrame(check);
+    }
+};
+
+check();
+"""
+
+# Se inyecta antes de que cargue la página: las tareas largas no quedan en el buffer del navegador
+LONG_TASK_OBSERVER_SCRIPT = """
+window.__notedeaLongTasks = [];
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+            window.__notedeaLongTasks.push({ start: entry.startTime, duration: entry.duration });
+        }
+    }).observe({ type: 'longtask' });
+} catch (e) {
+    window.__notedeaLongTasks = null;
+}
+"""
+
+# Espera al evento load y a un margen para que el LCP se asiente; tiempos en ms desde el inicio de la navegación.
+# El TBT suma lo que excede de 50 ms cada tarea larga posterior al FCP.
+WEB_VITALS_SCRIPT = """
+const settleMs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+let lcp = null;
+const lcpObserver = new PerformanceObserver((list) => {
+    const entries = list.getEntries();
+    const last = entries[entries.length - 1];
+    lcp = last.renderTime || last.loadTime || last.startTime;
+});
+lcpObserver.observe({ type: 'largest-contentful-paint', buffered: true });
+
+const collect = () => {
+    lcpObserver.disconnect();
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const fcpEntry = performance.getEntriesByName('first-contentful-paint')[0];
+    const fcp = fcpEntry ? fcpEntry.startTime : null;
+    const longTasks = window.__notedeaLongTasks;
+    const scripts = performance.getEntriesByType('resource')
+        .filter((entry) => entry.initiatorType === 'script' || /\\.m?js(\\?|$)/.test(entry.name));
+    done({
+        ttfb: navigation ? navigation.responseStart : null,
+        dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : null,
+        load: navigation ? navigation.loadEventEnd : null,
+        fcp: fcp,
+        lcp: lcp,
+        tbt: longTasks && fcp !== null
+            ? longTasks.filter((task) => task.start >= fcp).reduce((total, task) => total + Math.max(0, task.duration - 50), 0)
+            : null,
+        long_tasks: longTasks ? longTasks.length : null,
+        js_bytes: scripts.reduce((total, entry) => total + (entry.transferSize || entry.encodedBodySize), 0),
+        js_requests: scripts.length,
+    });
+};
+
+const waitForLoad = () => {
+    const navigation = performance.getEntriesByType('navigation')[0];
+    if (navigation && navigation.loadEventEnd > 0) {
+        setTimeout(collect, settleMs);
+    } else if (performance.now() - start > timeoutMs) {
+        collect();
+    } else {
+        setTimeout(waitForLoad, 50);
+    }
+};
+waitForLoad();
+"""
+
+WEB_VITALS_TIMINGS = ("ttfb", "dom_content_loaded", "load", "fcp", "lcp", "tbt")
+
+@instrument_class
 class BasePage:
     def __init__(self, driver):
-        self.driver = driver
+        self.driver = instrument_driver(driver)
         self.wait = WebDriverWait(driver, 10)
-        self.base_url = "http://localhost:3000"
+        self.events = get_driver_events(driver)
+        self.base_url = BASE_URL
+        self.readiness_waits = []
+        self.page_loads = []
     
     def navigate_to(self, path=""):
         url = f"{self.base_url}{path}"
@@ -26,12 +140,66 @@ class BasePage:
         wait = WebDriverWait(self.driver, timeout)
         return wait.until(EC.text_to_be_present_in_element(locator, text))
     
+    def wait_for_dom_text(self, selector, text=None, timeout=10):
+        """Espera, por evento de mutación del DOM, a que exista `selector` con el texto indicado"""
+        return self.events.wait_for_dom(self.events.watch_dom(selector, text), timeout)
+    
+    def accept_dialog(self, since, timeout=10):
+        if not self.events.wait_for_dialog(timeout, since):
+            raise TimeoutException("No se abrió el diálogo de confirmación")
+        self.driver.switch_to.alert.accept()
+    
+    def dismiss_dialog(self, since, timeout=10):
+        if not self.events.wait_for_dialog(timeout, since):
+            raise TimeoutException("No se abrió el diálogo de confirmación")
+        self.driver.switch_to.alert.dismiss()
+    
+    def wait_for_react_value(self, element, expected, timeout=3, label="react_value"):
+        start = time.perf_counter()
+        self.driver.set_script_timeout(timeout + 5)
+        result = self.driver.execute_async_script(
+            REACT_VALUE_COMMITTED_SCRIPT, element, expected, timeout * 1000
+        )
+        waited = time.perf_counter() - start
+        self.readiness_waits.append({
+            "step": label,
+            "committed": result["committed"],
+            "waited": waited,
+        })
+        print(f"⏱️ {label}: {waited * 1000:.0f} ms hasta el commit de React")
+        return result["committed"]
+    
+    def measure_page_load(self, path="", ready_locator=None, cold=True, settle=0.5, timeout=15):
+        """Carga la página desde cero y devuelve navigation timing, FCP, LCP, TBT y bytes de JS (tiempos en segundos)"""
+        if cold:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        observer = self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": LONG_TASK_OBSERVER_SCRIPT}
+        )
+        try:
+            self.navigate_to(path)
+            if ready_locator:
+                self.wait_for_element(ready_locator, timeout=timeout)
+            self.driver.set_script_timeout(timeout + settle + 5)
+            result = self.driver.execute_async_script(WEB_VITALS_SCRIPT, settle * 1000, timeout * 1000)
+        finally:
+            self.driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument", {"identifier": observer["identifier"]}
+            )
+        
+        vitals = {
+            key: value / 1000 if key in WEB_VITALS_TIMINGS and value is not None else value
+            for key, value in result.items()
+        }
+        vitals["path"] = path or "/"
+        self.page_loads.append(vitals)
+        print(f"🚦 {vitals['path']}: FCP {(vitals['fcp'] or 0) * 1000:.0f} ms, LCP {(vitals['lcp'] or 0) * 1000:.0f} ms, "
+              f"TBT {(vitals['tbt'] or 0) * 1000:.0f} ms, JS {vitals['js_bytes'] / 1024:.0f} KB")
+        return vitals
+    
     def take_screenshot(self, test_name):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = f"screenshots/{test_name}_{timestamp}.png"
-        os.makedirs("screenshots", exist_ok=True)
-        self.driver.save_screenshot(screenshot_path)
-        return screenshot_path
+        # La escritura a disco ocurre en segundo plano; devuelve None si la política la omite
+        return get_screenshot_writer().capture(self.driver, test_name)
     
     def scroll_to_element(self, element):
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
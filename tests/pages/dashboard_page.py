@@ -1,8 +1,328 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from dataclasses import dataclass, field
 from .base_page import BasePage
+from tests.utils.step_timer import instrument_class
 
+# Registra en la página el instante del último evento input y el de las transiciones del
+# indicador de auto-guardado ("Guardando..." y "Guardado a las ..."), sin depender del polling
+AUTO_SAVE_PROBE_SCRIPT = """
+if (!window.__notedeaAutoSaveProbe) {
+    const probe = { lastInput: null, saving: null, saved: null };
+    const shown = (testId) => document.querySelector(`[data-testid="${testId}"]`) !== null;
+
+    document.addEventListener('input', () => {
+        probe.lastInput = performance.now();
+        probe.saving = null;
+        probe.saved = null;
+    }, true);
+
+    new MutationObserver(() => {
+        if (probe.lastInput === null) return;
+        const now = performance.now();
+        if (probe.saving === null && shown('saving-indicator')) {
+            probe.saving = now;
+        } else if (probe.saving !== null && probe.saved === null && !shown('saving-indicator') && shown('save-indicator')) {
+            probe.saved = now;
+        }
+    }).observe(document.body, { childList: true, subtree: true, characterData: true });
+
+    window.__notedeaAutoSaveProbe = probe;
+}
+"""
+
+# Cuenta los bytes que la app envía por WebSocket (la conexión de Realtime Database) desde la última llamada
+WEBSOCKET_BYTES_PROBE_SCRIPT = """
+if (!window.__notedeaWebSocketSend) {
+    const send = WebSocket.prototype.send;
+    const encoder = new TextEncoder();
+    window.__notedeaWebSocketSend = send;
+    WebSocket.prototype.send = function (data) {
+        window.__notedeaSentBytes += typeof data === 'string'
+            ? encoder.encode(data).length
+            : (data.byteLength ?? data.size ?? 0);
+        return send.call(this, data);
+    };
+}
+window.__notedeaSentBytes = 0;
+"""
+
+# Registra el clic en "Enhance Idea", el primer token visible en el modal y el fin del streaming
+ENHANCEMENT_PROBE_SCRIPT = """
+const probe = { clicked: null, firstToken: null, complete: null };
+window.__notedeaEnhancementProbe = probe;
+
+document.addEventListener('click', (event) => {
+    if (probe.clicked === null && event.target.closest('#enhance-idea-button')) {
+        probe.clicked = performance.now();
+    }
+}, true);
+
+const observer = new MutationObserver(() => {
+    if (probe.clicked === null) return;
+    const container = document.getElementById('enhanced-content');
+    if (!container) return;
+    const now = performance.now();
+    if (probe.firstToken === null && container.textContent.trim().length > 0) {
+        probe.firstToken = now;
+    }
+    if (probe.firstToken !== null && container.dataset.streaming === 'false') {
+        probe.complete = now;
+        observer.disconnect();
+    }
+});
+observer.observe(document.body, { childList: true, subtree: true, characterData: true, attributes: true });
+"""
+
+ENHANCEMENT_RESULT_SCRIPT = """
+const timeoutMs = arguments[0];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+const check = () => {
+    const probe = window.__notedeaEnhancementProbe;
+    if (probe.complete !== null || performance.now() - start > timeoutMs) {
+        done(Object.assign({}, probe));
+    } else {
+        setTimeout(check, 25);
+    }
+};
+check();
+"""
+
+# Espera a que la primera tarjeta de la lista muestre el título indicado
+FIRST_NOTE_TITLE_SCRIPT = """
+const title = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+const matches = () => {
+    const card = document.querySelector("[data-testid^='note-card-']");
+    return card !== null && card.querySelector('h4').textContent === title;
+};
+if (matches()) {
+    done(0);
+} else {
+    const observer = new MutationObserver(() => {
+        if (matches()) {
+            observer.disconnect();
+            done(performance.now() - start);
+        }
+    });
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    setTimeout(() => {
+        observer.disconnect();
+        done(null);
+    }, timeoutMs);
+}
+"""
+
+# Escrituras encoladas en localStorage por la cola offline de la app, por nota
+PENDING_WRITES_SCRIPT = """
+const pending = {};
+for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (key.startsWith('notedea:pendingWrites:')) {
+        Object.assign(pending, JSON.parse(localStorage.getItem(key)));
+    }
+}
+return pending;
+"""
+
+# Instante (ms desde el inicio de la navegación) en que se pintó la primera tarjeta, según Element Timing;
+# si el navegador no lo reporta se usa el momento en que se detectó en el DOM
+FIRST_NOTE_PAINT_SCRIPT = """
+const timeoutMs = arguments[0];
+const done = arguments[arguments.length - 1];
+let paintedAt = null;
+let seenAt = null;
+const observer = new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+        if (entry.identifier === 'note-card' && paintedAt === null) {
+            paintedAt = entry.renderTime || entry.loadTime;
+        }
+    }
+});
+observer.observe({ type: 'element', buffered: true });
+const start = performance.now();
+const check = () => {
+    if (seenAt === null && document.querySelector("[data-testid^='note-card-']")) {
+        seenAt = performance.now();
+    }
+    if (paintedAt !== null || (seenAt !== null && performance.now() - seenAt > 1000)) {
+        observer.disconnect();
+        done(paintedAt ?? seenAt);
+    } else if (performance.now() - start > timeoutMs) {
+        observer.disconnect();
+        done(null);
+    } else {
+        setTimeout(check, 25);
+    }
+};
+check();
+"""
+
+# Estado completo del dashboard en una sola llamada al navegador: tarjetas, lista, editor,
+# indicadores de guardado y modal de mejora
+DASHBOARD_SNAPSHOT_SCRIPT = """
+const list = document.querySelector("[data-testid='notes-list']");
+const cards = Array.from(document.querySelectorAll("[data-testid^='note-card-']"));
+const titleInput = document.getElementById('note-title-input');
+const contentTextarea = document.getElementById('note-content-textarea');
+const enhanceButton = document.getElementById('enhance-idea-button');
+const modal = document.getElementById('enhancement-modal');
+const enhancedContent = document.getElementById('enhanced-content');
+const savedIndicator = document.querySelector("[data-testid='save-indicator']");
+const saveError = document.querySelector("[data-testid='save-error-indicator']");
+return {
+    url: location.href,
+    notes: cards.map((card) => ({
+        id: card.dataset.testid.replace('note-card-', ''),
+        title: card.querySelector('h4') ? card.querySelector('h4').textContent : '',
+    })),
+    list_state: {
+        loaded: list ? Number(list.dataset.loadedCount) : 0,
+        page_size: list ? Number(list.dataset.pageSize) : 0,
+        has_more: list ? list.dataset.hasMore === 'true' : false,
+        rendered: cards.length,
+        scroll_top: list ? list.scrollTop : 0,
+    },
+    editor: titleInput ? {
+        title: titleInput.value,
+        content: contentTextarea ? contentTextarea.value : null,
+        enhance_available: enhanceButton !== null,
+        enhance_enabled: enhanceButton !== null && !enhanceButton.disabled,
+    } : null,
+    indicators: {
+        saving: document.querySelector("[data-testid='saving-indicator']") !== null,
+        saved: savedIndicator ? savedIndicator.textContent : null,
+        offline_pending: document.querySelector("[data-testid='offline-pending-indicator']") !== null,
+        save_error: saveError ? saveError.textContent : null,
+    },
+    modal: modal ? {
+        streaming: enhancedContent ? enhancedContent.dataset.streaming === 'true' : false,
+        content: enhancedContent ? enhancedContent.textContent : null,
+    } : null,
+};
+"""
+
+# Por cada tecla, tiempo desde el evento hasta el siguiente fotograma pintado (requestAnimationFrame + tarea)
+INPUT_PAINT_PROBE_SCRIPT = """
+const probe = { latencies: [] };
+window.__notedeaInputPaintProbe = probe;
+document.addEventListener('keydown', (event) => {
+    const start = event.timeStamp;
+    requestAnimationFrame(() => setTimeout(() => {
+        probe.latencies.push(performance.now() - start);
+    }, 0));
+}, true);
+"""
+
+INPUT_PAINT_RESULT_SCRIPT = """
+const expected = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+const check = () => {
+    const probe = window.__notedeaInputPaintProbe;
+    if (probe.latencies.length >= expected || performance.now() - start > timeoutMs) {
+        done(probe.latencies);
+    } else {
+        setTimeout(check, 25);
+    }
+};
+check();
+"""
+
+# Sale del modo edición con Esc y mide hasta que la vista previa Markdown está pintada; devuelve
+# milisegundos y bloques parseados/cacheados por MarkdownRenderer durante ese render
+PREVIEW_RENDER_SCRIPT = """
+const textarea = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const metrics = window.__notedeaMarkdownMetrics || { blocksParsed: 0, cacheHits: 0 };
+const parsedBefore = metrics.blocksParsed;
+const hitsBefore = metrics.cacheHits;
+const start = performance.now();
+const check = () => {
+    const preview = document.querySelector("[data-testid='markdown-preview'] .prose");
+    if (preview && preview.childElementCount > 0) {
+        setTimeout(() => done({
+            ms: performance.now() - start,
+            blocks_parsed: metrics.blocksParsed - parsedBefore,
+            cache_hits: metrics.cacheHits - hitsBefore,
+        }), 0);
+    } else if (performance.now() - start > timeoutMs) {
+        done(null);
+    } else {
+        requestAnimationFrame(check);
+    }
+};
+textarea.dispatchEvent(new KeyboardEvent('keydown', { key: 'Escape', bubbles: true, cancelable: true }));
+requestAnimationFrame(check);
+"""
+
+AUTO_SAVE_RESULT_SCRIPT = """
+const timeoutMs = arguments[0];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+const check = () => {
+    const probe = window.__notedeaAutoSaveProbe;
+    if (probe.saved !== null || performance.now() - start > timeoutMs) {
+        done(Object.assign({}, probe));
+    } else {
+        setTimeout(check, 25);
+    }
+};
+check();
+"""
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Foto del dashboard devuelta por DashboardPage.snapshot(); no se actualiza sola"""
+    url: str
+    notes: list
+    list_state: dict
+    editor: dict = None
+    indicators: dict = field(default_factory=dict)
+    modal: dict = None
+    
+    @property
+    def note_ids(self):
+        return [note["id"] for note in self.notes]
+    
+    @property
+    def note_titles(self):
+        return [note["title"] for note in self.notes]
+    
+    @property
+    def note_count(self):
+        """Tarjetas en el DOM: con la lista virtualizada, solo las de la ventana visible"""
+        return len(self.notes)
+    
+    @property
+    def editor_open(self):
+        return self.editor is not None
+    
+    @property
+    def title_value(self):
+        return self.editor["title"] if self.editor else None
+    
+    @property
+    def content_value(self):
+        return self.editor["content"] if self.editor else None
+    
+    @property
+    def enhance_available(self):
+        return bool(self.editor and self.editor["enhance_available"])
+    
+    @property
+    def modal_open(self):
+        return self.modal is not None
+
+
+@instrument_class
 class DashboardPage(BasePage):
     def __init__(self, driver):
         super().__init__(driver)
@@ -14,12 +334,14 @@ class DashboardPage(BasePage):
         self.content_textarea = (By.ID, "note-content-textarea")
         self.enhance_button = (By.ID, "enhance-idea-button")
         self.note_cards = (By.CSS_SELECTOR, "[data-testid^='note-card-']")
+        self.notes_list = (By.CSS_SELECTOR, "[data-testid='notes-list']")
         self.delete_buttons = (By.CSS_SELECTOR, "[data-testid^='delete-note-']")
-        self.save_indicator = (By.XPATH, "//span[contains(text(), 'Guardado a las')]")
-        self.saving_indicator = (By.XPATH, "//span[contains(text(), 'Guardando')]")
+        self.save_indicator = (By.CSS_SELECTOR, "[data-testid='save-indicator']")
+        self.saving_indicator = (By.CSS_SELECTOR, "[data-testid='saving-indicator']")
         self.enhancement_modal = (By.ID, "enhancement-modal")
         self.accept_enhancement_button = (By.ID, "accept-enhancement-button")
         self.cancel_enhancement_button = (By.ID, "cancel-enhancement-button")
+        self.offline_pending_indicator = (By.CSS_SELECTOR, "[data-testid='offline-pending-indicator']")
     
     def click_new_idea(self):
         new_idea_btn = self.wait_for_clickable(self.new_idea_button)
@@ -39,8 +361,10 @@ class DashboardPage(BasePage):
             const element = arguments[0];
             const value = arguments[1];
             
-            // Establecer valor
-            element.value = value;
+            // Establecer valor con el setter nativo: asignar element.value actualiza también el
+            // _valueTracker de React, que entonces no ve cambio y no llama a onChange
+            const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+            setValue.call(element, value);
             
             // Disparar eventos de React
             const inputEvent = new Event('input', { 
@@ -56,15 +380,12 @@ class DashboardPage(BasePage):
             element.dispatchEvent(changeEvent);
         """, title_element, title)
         
-        # Verificar que el título se estableció
-        import time
-        time.sleep(0.5)
-        
-        actual_value = title_element.get_attribute("value")
-        if title not in actual_value:
+        # Esperar a que React confirme el valor en lugar de un retardo fijo
+        if not self.wait_for_react_value(title_element, title, label="fill_title"):
             # Si no funcionó, intentar de nuevo con send_keys
             title_element.clear()
             title_element.send_keys(title)
+            self.wait_for_react_value(title_element, title, label="fill_title_fallback")
     
     def fill_content(self, content):
         """Rellena el contenido del textarea simulando tipeo de usuario real"""
@@ -143,81 +464,218 @@ class DashboardPage(BasePage):
         
         result = self.driver.execute_script(script, content_element, content)
         
-        # Dar tiempo para que React procese todos los eventos
-        import time
-        time.sleep(1)
+        # Esperar a que React procese los eventos y confirme el nuevo valor
+        committed = self.wait_for_react_value(content_element, content, label="fill_content")
         
         # Verificar que el contenido se estableció correctamente
         actual_value = content_element.get_attribute("value")
-        print(f"📝 Contenido establecido: '{actual_value}'")
+        print(f"📝 Contenido establecido: '{actual_value[:80]}' ({len(actual_value)} caracteres)")
         
-        if actual_value != content:
+        if not committed or actual_value != content:
             print(f"⚠️ Fallback: usando send_keys como respaldo")
             content_element.clear()
             content_element.send_keys(content)
-            time.sleep(0.5)
+            self.wait_for_react_value(content_element, content, label="fill_content_fallback")
+    
+    def measure_typing_latency(self, text, timeout=30):
+        """Escribe text al final del contenido tecla a tecla y devuelve la latencia entrada → pintado de cada tecla (s)"""
+        content_element = self.wait_for_element(self.content_textarea)
+        self.driver.execute_script("""
+            const textarea = arguments[0];
+            textarea.focus();
+            textarea.setSelectionRange(textarea.value.length, textarea.value.length);
+        """, content_element)
+        self.driver.execute_script(INPUT_PAINT_PROBE_SCRIPT)
+        
+        for character in text:
+            content_element.send_keys(character)
+        
+        self.driver.set_script_timeout(timeout + 5)
+        latencies = self.driver.execute_async_script(INPUT_PAINT_RESULT_SCRIPT, len(text), timeout * 1000)
+        return [latency / 1000 for latency in latencies]
+    
+    def measure_preview_render(self, timeout=30):
+        """Cierra el editor con Esc y mide el render de la vista previa (ms y bloques parseados/cacheados)"""
+        content_element = self.wait_for_element(self.content_textarea)
+        self.driver.set_script_timeout(timeout + 5)
+        return self.driver.execute_async_script(PREVIEW_RENDER_SCRIPT, content_element, timeout * 1000)
+    
+    def get_markdown_metrics(self):
+        return self.driver.execute_script("return window.__notedeaMarkdownMetrics || null")
     
     def wait_for_auto_save(self, timeout=20):
-        try:
-            # Primero verificar si está guardando
-            print("🔄 Esperando a que comience el guardado...")
-            self.wait_for_element(self.saving_indicator, timeout=5)
+        # Los indicadores se observan con un MutationObserver en la página: la espera termina con el cambio
+        print("🔄 Esperando a que comience el guardado...")
+        if self.wait_for_dom_text(self.saving_indicator[1], timeout=5):
             print("✅ Proceso de guardado iniciado")
-            
-            # Luego esperar a que termine y muestre el indicador de guardado
-            self.wait_for_element(self.save_indicator, timeout)
+        else:
+            # Puede haber sido tan rápido que el indicador ya no esté
+            print("⚠️ No se vio el indicador de guardado, verificando estado...")
+        
+        if self.wait_for_dom_text(self.save_indicator[1], timeout=timeout):
             print("✅ Nota guardada exitosamente")
             return True
-        except TimeoutException:
-            print("⚠️ Timeout esperando auto-save, verificando estado...")
-            # Verificar si ya está guardado (puede haber sido muy rápido)
-            try:
-                self.driver.find_element(*self.save_indicator)
-                print("✅ Nota ya estaba guardada")
-                return True
-            except:
-                print("❌ No se pudo confirmar el guardado")
-                return False
+        print("❌ No se pudo confirmar el guardado")
+        return False
+    
+    def measure_auto_save_latency(self, content, timeout=20, field="content"):
+        """Mide desde la última pulsación hasta "Guardando" y de ahí hasta "Guardado a las" (en segundos)
+        y los bytes enviados a la base de datos. field indica si se edita el contenido o el título."""
+        self.driver.execute_script(AUTO_SAVE_PROBE_SCRIPT)
+        self.driver.execute_script(WEBSOCKET_BYTES_PROBE_SCRIPT)
+        if field == "title":
+            self.fill_title(content)
+        else:
+            self.fill_content(content)
+        
+        self.driver.set_script_timeout(timeout + 5)
+        probe = self.driver.execute_async_script(AUTO_SAVE_RESULT_SCRIPT, timeout * 1000)
+        if probe["lastInput"] is None or probe["saving"] is None or probe["saved"] is None:
+            print("❌ No se observó el ciclo completo de auto-guardado")
+            return None
+        
+        return {
+            "to_saving": (probe["saving"] - probe["lastInput"]) / 1000,
+            "to_saved": (probe["saved"] - probe["saving"]) / 1000,
+            "total": (probe["saved"] - probe["lastInput"]) / 1000,
+            "bytes_sent": self.driver.execute_script("return window.__notedeaSentBytes"),
+        }
     
     def get_note_cards(self):
+        """Tarjetas presentes en el DOM: con la lista virtualizada, solo las de la ventana visible"""
         try:
             return self.driver.find_elements(*self.note_cards)
         except NoSuchElementException:
             return []
     
+    def snapshot(self):
+        return DashboardSnapshot(**self.driver.execute_script(DASHBOARD_SNAPSHOT_SCRIPT))
+    
+    def wait_for_snapshot(self, condition, timeout=10):
+        """Repite la foto hasta que cumpla la condición y la devuelve; TimeoutException si no llega a cumplirla"""
+        def ready(driver):
+            snapshot = self.snapshot()
+            return snapshot if condition(snapshot) else False
+        
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(ready)
+    
+    def get_notes_list_state(self):
+        """Notas cargadas, tamaño de página, si quedan más en el servidor y tarjetas renderizadas"""
+        return self.snapshot().list_state
+    
+    def scroll_notes_list(self, pixels):
+        list_element = self.wait_for_element(self.notes_list)
+        self.driver.execute_script("arguments[0].scrollTop += arguments[1];", list_element, pixels)
+    
+    def scroll_notes_list_to_end(self):
+        list_element = self.wait_for_element(self.notes_list)
+        self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", list_element)
+    
+    def load_more_notes(self, timeout=20):
+        """Desplaza la lista hasta el final y espera a que llegue la siguiente página; devuelve las notas cargadas"""
+        loaded_before = self.get_notes_list_state()["loaded"]
+        self.scroll_notes_list_to_end()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda driver: self.get_notes_list_state()["loaded"] > loaded_before
+            )
+        except TimeoutException:
+            pass
+        return self.get_notes_list_state()["loaded"]
+    
+    def measure_first_note_paint(self, timeout=30):
+        """Recarga el dashboard y devuelve los segundos desde la navegación hasta pintar la primera tarjeta"""
+        self.driver.refresh()
+        self.driver.set_script_timeout(timeout + 5)
+        painted_at = self.driver.execute_async_script(FIRST_NOTE_PAINT_SCRIPT, timeout * 1000)
+        return painted_at / 1000 if painted_at is not None else None
+    
+    def count_dom_nodes(self):
+        return self.driver.execute_script("return document.getElementsByTagName('*').length")
+    
+    def get_note_ids(self):
+        return self.snapshot().note_ids
+    
+    def is_offline_pending_visible(self):
+        try:
+            return self.wait_for_element(self.offline_pending_indicator, timeout=10).is_displayed()
+        except TimeoutException:
+            return False
+    
+    def get_pending_writes(self):
+        return self.driver.execute_script(PENDING_WRITES_SCRIPT)
+    
+    def get_write_queue_stats(self):
+        return self.driver.execute_script("return window.__notedeaWriteQueue || null")
+    
+    def get_notes_store_stats(self):
+        """Consumidores del store de notas, suscripciones abiertas a Firebase y coste de repartir las actualizaciones"""
+        return self.driver.execute_script("return window.__notedeaNotesStore || null")
+    
+    def wait_for_pending_writes_flushed(self, timeout=30):
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda driver: not driver.execute_script(PENDING_WRITES_SCRIPT)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def wait_for_first_note_title(self, title, timeout=20):
+        """Espera a que la nota más reciente de la lista tenga el título indicado; devuelve False si no ocurre"""
+        self.driver.set_script_timeout(timeout + 5)
+        return self.driver.execute_async_script(FIRST_NOTE_TITLE_SCRIPT, title, timeout * 1000) is not None
+    
     def click_note_card(self, index=0):
-        note_cards = self.get_note_cards()
-        if len(note_cards) > index:
-            note_cards[index].click()
+        # Sin espera implícita: se espera explícitamente a que la lista tenga la tarjeta
+        try:
+            note_id = self.wait_for_snapshot(lambda snapshot: len(snapshot.note_ids) > index).note_ids[index]
+        except TimeoutException:
+            return
+        self.driver.find_element(By.CSS_SELECTOR, f"[data-testid='note-card-{note_id}']").click()
     
     def delete_note(self, index=0):
-        delete_buttons = self.driver.find_elements(*self.delete_buttons)
-        if len(delete_buttons) > index:
-            delete_buttons[index].click()
-            
-            self.wait.until(EC.alert_is_present())
-            alert = self.driver.switch_to.alert
-            alert.accept()
+        """Borra la tarjeta `index` confirmando el diálogo; devuelve la foto del dashboard sin ella"""
+        note_ids = self.snapshot().note_ids
+        if len(note_ids) <= index:
+            return self.snapshot()
+        
+        since = self.events.mark()
+        self.driver.find_element(By.CSS_SELECTOR, f"[data-testid='delete-note-{note_ids[index]}']").click()
+        self.accept_dialog(since)
+        return self.wait_for_snapshot(lambda snapshot: note_ids[index] not in snapshot.note_ids)
     
     def cancel_delete_note(self, index=0):
-        delete_buttons = self.driver.find_elements(*self.delete_buttons)
-        if len(delete_buttons) > index:
-            delete_buttons[index].click()
-            
-            self.wait.until(EC.alert_is_present())
-            alert = self.driver.switch_to.alert
-            alert.dismiss()
+        """Pulsa borrar en la tarjeta `index` y cancela el diálogo; devuelve la foto del dashboard"""
+        note_ids = self.snapshot().note_ids
+        if len(note_ids) > index:
+            since = self.events.mark()
+            self.driver.find_element(By.CSS_SELECTOR, f"[data-testid='delete-note-{note_ids[index]}']").click()
+            self.dismiss_dialog(since)
+        return self.snapshot()
     
     def click_enhance_idea(self):
         enhance_btn = self.wait_for_clickable(self.enhance_button)
         enhance_btn.click()
     
+    def measure_enhancement_latency(self, timeout=60):
+        """Hace clic en "Enhance Idea" y mide el tiempo hasta el primer token y hasta el final (en segundos)"""
+        self.driver.execute_script(ENHANCEMENT_PROBE_SCRIPT)
+        self.click_enhance_idea()
+        
+        self.driver.set_script_timeout(timeout + 5)
+        probe = self.driver.execute_async_script(ENHANCEMENT_RESULT_SCRIPT, timeout * 1000)
+        if probe["clicked"] is None or probe["firstToken"] is None or probe["complete"] is None:
+            print("❌ No se observó la mejora completa en el modal")
+            return None
+        
+        return {
+            "time_to_first_token": (probe["firstToken"] - probe["clicked"]) / 1000,
+            "time_to_complete": (probe["complete"] - probe["clicked"]) / 1000,
+        }
+    
     def is_enhance_button_available(self):
-        try:
-            self.driver.find_element(*self.enhance_button)
-            return True
-        except NoSuchElementException:
-            return False
+        return self.snapshot().enhance_available
     
     def wait_for_enhancement_modal(self, timeout=15):
         try:
@@ -239,9 +697,7 @@ class DashboardPage(BasePage):
         logout_btn.click()
     
     def get_title_value(self):
-        title_element = self.wait_for_element(self.title_input)
-        return title_element.get_attribute("value")
+        return self.wait_for_snapshot(lambda snapshot: snapshot.editor_open).title_value
     
     def get_content_value(self):
-        content_element = self.wait_for_element(self.content_textarea)
-        return content_element.get_attribute("value")
+        return self.wait_for_snapshot(lambda snapshot: snapshot.content_value is not None).content_value
@@ -2,7 +2,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
+from tests.utils.step_timer import instrument_class
 
+@instrument_class
 class LoginPage(BasePage):
     def __init__(self, driver):
         super().__init__(driver)
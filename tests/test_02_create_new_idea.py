@@ -1,27 +1,11 @@
 import pytest
-from tests.pages.login_page import LoginPage
 from tests.pages.dashboard_page import DashboardPage
 from tests.utils.test_data import TestDataGenerator
 
 class TestCreateNewIdea:
     
-    def setup_method(self):
-        self.test_email = TestDataGenerator.generate_email()
-        self.test_password = TestDataGenerator.generate_password()
-    
-    def authenticate_user(self, driver):
-        login_page = LoginPage(driver)
-        login_page.navigate_to_login()
-        login_page.toggle_to_signup()
-        login_page.fill_email(self.test_email)
-        login_page.fill_password(self.test_password)
-        login_page.click_submit()
-        login_page.wait_for_redirect_to_dashboard()
-    
-    def test_happy_path_create_new_idea(self, driver):
-        self.authenticate_user(driver)
-        
-        dashboard_page = DashboardPage(driver)
+    def test_happy_path_create_new_idea(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
         dashboard_page.take_screenshot("create_happy_01_dashboard")
         
         dashboard_page.click_new_idea()
@@ -41,8 +25,7 @@ class TestCreateNewIdea:
         
         assert save_success
         
-        note_cards = dashboard_page.get_note_cards()
-        assert len(note_cards) > 0
+        assert dashboard_page.snapshot().note_count > 0
     
     def test_negative_create_without_authentication(self, driver):
         dashboard_page = DashboardPage(driver)
@@ -52,10 +35,8 @@ class TestCreateNewIdea:
         current_url = dashboard_page.get_current_url()
         assert "/notes" not in current_url
     
-    def test_boundary_minimal_content(self, driver):
-        self.authenticate_user(driver)
-        
-        dashboard_page = DashboardPage(driver)
+    def test_boundary_minimal_content(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
         dashboard_page.click_new_idea()
         dashboard_page.take_screenshot("create_boundary_01_new_editor")
         
@@ -68,13 +49,10 @@ class TestCreateNewIdea:
         
         assert save_success
         
-        note_cards = dashboard_page.get_note_cards()
-        assert len(note_cards) > 0
+        assert dashboard_page.snapshot().note_count > 0
     
-    def test_boundary_empty_title_with_content(self, driver):
-        self.authenticate_user(driver)
-        
-        dashboard_page = DashboardPage(driver)
+    def test_boundary_empty_title_with_content(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
         dashboard_page.click_new_idea()
         dashboard_page.take_screenshot("create_boundary_empty_title_01_new_editor")
         
@@ -87,5 +65,4 @@ class TestCreateNewIdea:
         
         assert save_success
         
-        note_cards = dashboard_page.get_note_cards()
-        assert len(note_cards) > 0
+        assert dashboard_page.snapshot().note_count > 0
@@ -1,23 +1,9 @@
 import pytest
-from tests.pages.login_page import LoginPage
 from tests.pages.dashboard_page import DashboardPage
-from tests.utils.test_data import TestDataGenerator
 
 class TestEditExistingIdea:
     
-    def setup_method(self):
-        self.test_email = TestDataGenerator.generate_email()
-        self.test_password = TestDataGenerator.generate_password()
-    
-    def authenticate_and_create_note(self, driver):
-        login_page = LoginPage(driver)
-        login_page.navigate_to_login()
-        login_page.toggle_to_signup()
-        login_page.fill_email(self.test_email)
-        login_page.fill_password(self.test_password)
-        login_page.click_submit()
-        login_page.wait_for_redirect_to_dashboard()
-        
+    def create_initial_note(self, driver):
         dashboard_page = DashboardPage(driver)
         dashboard_page.click_new_idea()
         dashboard_page.fill_title("Nota inicial para editar")
@@ -25,8 +11,8 @@ class TestEditExistingIdea:
         dashboard_page.wait_for_auto_save()
         return dashboard_page
     
-    def test_happy_path_edit_existing_idea(self, driver):
-        dashboard_page = self.authenticate_and_create_note(driver)
+    def test_happy_path_edit_existing_idea(self, authenticated_driver):
+        dashboard_page = self.create_initial_note(authenticated_driver)
         dashboard_page.take_screenshot("edit_happy_01_note_created")
         
         dashboard_page.click_note_card(0)
@@ -46,11 +32,9 @@ class TestEditExistingIdea:
         
         assert save_success
         
-        saved_title = dashboard_page.get_title_value()
-        saved_content = dashboard_page.get_content_value()
-        
-        assert saved_title == new_title
-        assert saved_content == new_content
+        snapshot = dashboard_page.snapshot()
+        assert snapshot.title_value == new_title
+        assert snapshot.content_value == new_content
     
     def test_negative_edit_without_authentication(self, driver):
         dashboard_page = DashboardPage(driver)
@@ -60,16 +44,8 @@ class TestEditExistingIdea:
         current_url = dashboard_page.get_current_url()
         assert "/notes" not in current_url
     
-    def test_boundary_edit_nonexistent_note(self, driver):
-        login_page = LoginPage(driver)
-        login_page.navigate_to_login()
-        login_page.toggle_to_signup()
-        login_page.fill_email(self.test_email)
-        login_page.fill_password(self.test_password)
-        login_page.click_submit()
-        login_page.wait_for_redirect_to_dashboard()
-        
-        dashboard_page = DashboardPage(driver)
+    def test_boundary_edit_nonexistent_note(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
         dashboard_page.navigate_to("/notes/nonexistent-note-123")
         dashboard_page.take_screenshot("edit_boundary_01_nonexistent_note")
         
@@ -77,8 +53,8 @@ class TestEditExistingIdea:
         
         assert "/notes" in current_url and "nonexistent-note-123" not in current_url
     
-    def test_boundary_clear_all_content(self, driver):
-        dashboard_page = self.authenticate_and_create_note(driver)
+    def test_boundary_clear_all_content(self, authenticated_driver):
+        dashboard_page = self.create_initial_note(authenticated_driver)
         dashboard_page.click_note_card(0)
         dashboard_page.take_screenshot("edit_boundary_clear_01_note_opened")
         
@@ -91,8 +67,6 @@ class TestEditExistingIdea:
         
         assert save_success
         
-        saved_title = dashboard_page.get_title_value()
-        saved_content = dashboard_page.get_content_value()
-        
-        assert saved_title == ""
-        assert saved_content == ""
+        snapshot = dashboard_page.snapshot()
+        assert snapshot.title_value == ""
+        assert snapshot.content_value == ""
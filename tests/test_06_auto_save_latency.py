@@ -0,0 +1,43 @@
+import os
+import pytest
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import summarize, format_summary, write_benchmark_report
+
+CONTENT_SIZES = [100, 1000, 10000]
+EDITS_PER_SIZE = int(os.environ.get("NOTEDEA_AUTOSAVE_EDITS", "5"))
+TOTAL_P95_BUDGET = float(os.environ.get("NOTEDEA_AUTOSAVE_P95_BUDGET_MS", "4000")) / 1000
+
+@pytest.mark.benchmark
+class TestAutoSaveLatency:
+    
+    def test_benchmark_auto_save_latency_by_content_size(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
+        dashboard_page.click_new_idea()
+        dashboard_page.fill_title("Benchmark de auto-guardado")
+        assert dashboard_page.wait_for_auto_save(), "No se completó el auto-guardado"
+        
+        results = {}
+        for size in CONTENT_SIZES:
+            base_content = TestDataGenerator.generate_note_content(size)
+            samples = []
+            for edit in range(EDITS_PER_SIZE):
+                # Cada edición cambia el contenido para que el hook vuelva a programar el guardado
+                sample = dashboard_page.measure_auto_save_latency(f"{base_content} #{edit}")
+                assert sample is not None, f"Auto-guardado no completado ({size} caracteres, edición {edit})"
+                samples.append(sample)
+            
+            results[size] = {
+                key: summarize([sample[key] for sample in samples])
+                for key in ("to_saving", "to_saved", "total")
+            }
+            print(format_summary(f"{size} caracteres, pulsación → Guardando", results[size]["to_saving"]))
+            print(format_summary(f"{size} caracteres, Guardando → Guardado", results[size]["to_saved"]))
+        
+        dashboard_page.take_screenshot("benchmark_auto_save_01_done")
+        write_benchmark_report("auto_save_latency", {"sizes": results})
+        
+        for size, stats in results.items():
+            assert stats["total"]["p95"] <= TOTAL_P95_BUDGET, (
+                f"p95 de auto-guardado con {size} caracteres: {stats['total']['p95']:.2f}s"
+            )
@@ -0,0 +1,118 @@
+import os
+import uuid
+import pytest
+from tests.pages.base_page import BASE_URL
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import format_summary, summarize, write_benchmark_report
+from tests.utils.load_test import request_json, run_load
+
+CONCURRENCY_LEVELS = [int(level) for level in os.environ.get("NOTEDEA_LOAD_CONCURRENCY", "1,4,16").split(",")]
+REQUESTS_PER_LEVEL = int(os.environ.get("NOTEDEA_LOAD_REQUESTS", "32"))
+MAX_ERROR_RATE = float(os.environ.get("NOTEDEA_LOAD_MAX_ERROR_RATE", "0.01"))
+CACHE_SAMPLES = int(os.environ.get("NOTEDEA_CACHE_SAMPLES", "3"))
+
+ENHANCE_URL = f"{BASE_URL}/api/enhance-idea"
+CACHE_STATS_URL = f"{BASE_URL}/api/enhance-idea/cache"
+# Sin esta cabecera las peticiones repetidas saldrían de la caché y no medirían la ruta completa
+BYPASS_CACHE = {"x-enhancement-cache": "bypass"}
+
+
+def get_cache_stats():
+    status, _, stats, _ = request_json("GET", CACHE_STATS_URL)
+    assert status == 200, f"No se pudieron leer los contadores de la caché (status {status})"
+    return stats
+
+
+@pytest.mark.requires_openai_stub
+class TestEnhanceIdeaCache:
+    
+    def test_repeated_enhancement_is_served_from_cache(self, openai_stub):
+        # Títulos únicos: otros tests (o workers) no pueden haber calentado estas entradas
+        payloads = [
+            {
+                "title": f"{TestDataGenerator.generate_note_title()} {uuid.uuid4().hex[:8]}",
+                "content": TestDataGenerator.generate_note_content(200),
+            }
+            for _ in range(CACHE_SAMPLES)
+        ]
+        stats_before = get_cache_stats()
+        requests_before = openai_stub.requests if openai_stub else 0
+        
+        miss_latencies, hit_latencies = [], []
+        for payload in payloads:
+            status, headers, miss_body, latency = request_json("POST", ENHANCE_URL, payload)
+            assert status == 200
+            assert headers.get("x-enhancement-cache") == "miss"
+            miss_latencies.append(latency)
+            
+            status, headers, hit_body, latency = request_json("POST", ENHANCE_URL, payload)
+            assert status == 200
+            assert headers.get("x-enhancement-cache") == "hit"
+            assert hit_body["enhancedContent"] == miss_body["enhancedContent"]
+            hit_latencies.append(latency)
+        
+        stats_after = get_cache_stats()
+        assert stats_after["hits"] - stats_before["hits"] >= CACHE_SAMPLES
+        assert stats_after["misses"] - stats_before["misses"] >= CACHE_SAMPLES
+        if openai_stub:
+            assert openai_stub.requests - requests_before == CACHE_SAMPLES
+        
+        miss_stats, hit_stats = summarize(miss_latencies), summarize(hit_latencies)
+        print(format_summary("Latencia sin caché", miss_stats))
+        print(format_summary("Latencia con caché", hit_stats))
+        assert hit_stats["p50"] < miss_stats["p50"] / 2, "La caché no acelera las peticiones repetidas"
+    
+    def test_bypass_header_skips_cache(self, openai_stub):
+        payload = {
+            "title": f"Idea sin caché {uuid.uuid4().hex[:8]}",
+            "content": TestDataGenerator.generate_note_content(100),
+        }
+        status, headers, _, _ = request_json("POST", ENHANCE_URL, payload)
+        assert status == 200
+        assert headers.get("x-enhancement-cache") == "miss"
+        
+        stats_before = get_cache_stats()
+        requests_before = openai_stub.requests if openai_stub else 0
+        
+        status, headers, _, _ = request_json("POST", ENHANCE_URL, payload, headers=BYPASS_CACHE)
+        assert status == 200
+        assert headers.get("x-enhancement-cache") == "bypass"
+        
+        assert get_cache_stats()["bypasses"] - stats_before["bypasses"] >= 1
+        if openai_stub:
+            assert openai_stub.requests - requests_before == 1
+
+@pytest.mark.benchmark
+class TestEnhanceIdeaLoad:
+    
+    def test_benchmark_enhance_idea_concurrency(self, openai_stub):
+        payloads = [
+            {
+                "title": TestDataGenerator.generate_note_title(),
+                "content": TestDataGenerator.generate_note_content(100 * (i + 1)),
+            }
+            for i in range(8)
+        ]
+        requests_before = openai_stub.requests if openai_stub else 0
+        
+        results = []
+        for concurrency in CONCURRENCY_LEVELS:
+            result = run_load(ENHANCE_URL, payloads, concurrency, REQUESTS_PER_LEVEL, headers=BYPASS_CACHE)
+            results.append(result)
+            print(f"⚡ Concurrencia {concurrency}: {result['throughput']:.2f} req/s, "
+                  f"errores {result['error_rate'] * 100:.1f}% {result['error_statuses']}")
+            print(format_summary(f"Latencia con concurrencia {concurrency}", result["latency"]))
+        
+        write_benchmark_report("enhance_idea_load", {
+            "openai_stub": openai_stub is not None,
+            "levels": results,
+        })
+        
+        if openai_stub:
+            # Comprueba que la app realmente está apuntando al stub y no a OpenAI
+            assert openai_stub.requests - requests_before == REQUESTS_PER_LEVEL * len(CONCURRENCY_LEVELS)
+        
+        for result in results:
+            assert result["error_rate"] <= MAX_ERROR_RATE, (
+                f"Tasa de errores {result['error_rate']:.2%} con concurrencia {result['concurrency']}"
+            )
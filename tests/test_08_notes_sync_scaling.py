@@ -0,0 +1,53 @@
+import os
+import time
+import pytest
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import summarize, format_summary, write_benchmark_report
+
+NOTE_COUNTS = [int(count) for count in os.environ.get("NOTEDEA_SYNC_NOTE_COUNTS", "200,1000").split(",")]
+UPDATES_PER_COUNT = int(os.environ.get("NOTEDEA_SYNC_UPDATES", "5"))
+UPDATE_P95_BUDGET = float(os.environ.get("NOTEDEA_SYNC_P95_BUDGET_MS", "1500")) / 1000
+
+@pytest.mark.benchmark
+class TestNotesSyncScaling:
+    
+    def test_benchmark_dashboard_update_latency_by_note_count(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        
+        results = {}
+        for count in NOTE_COUNTS:
+            auth_session.clear_notes(authenticated_driver)
+            
+            start = time.perf_counter()
+            auth_session.seed_notes(authenticated_driver, TestDataGenerator.generate_notes(count))
+            initial_render = time.perf_counter() - start
+            
+            samples = []
+            for update in range(UPDATES_PER_COUNT):
+                # Se actualiza la nota más antigua: tiene que subir al principio de la lista
+                note_id = f"seed-{count - 1 - update:05d}"
+                title = f"Actualizada {update} con {count} notas"
+                
+                start = time.perf_counter()
+                auth_session.notes_request(authenticated_driver, "PATCH", {
+                    "title": title,
+                    "updatedAt": int(time.time() * 1000),
+                }, note_id=note_id)
+                assert dashboard_page.wait_for_first_note_title(title), (
+                    f"El dashboard no reflejó la actualización {update} con {count} notas"
+                )
+                samples.append(time.perf_counter() - start)
+            
+            results[count] = {"initial_render": initial_render, "update": summarize(samples)}
+            print(f"📥 {count} notas sembradas y renderizadas en {initial_render:.2f}s")
+            print(format_summary(f"{count} notas, escritura → lista actualizada", results[count]["update"]))
+        
+        dashboard_page.take_screenshot("benchmark_notes_sync_01_done")
+        auth_session.clear_notes(authenticated_driver, timeout=60)
+        write_benchmark_report("notes_sync_scaling", {"note_counts": results})
+        
+        for count, stats in results.items():
+            assert stats["update"]["p95"] <= UPDATE_P95_BUDGET, (
+                f"p95 de actualización con {count} notas: {stats['update']['p95']:.2f}s"
+            )
@@ -0,0 +1,52 @@
+import os
+import pytest
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import summarize, format_summary, write_benchmark_report
+
+NOTE_SIZES = [int(size) for size in os.environ.get("NOTEDEA_PAYLOAD_SIZES", "1000,10000,100000,1000000").split(",")]
+EDITS_PER_SIZE = int(os.environ.get("NOTEDEA_PAYLOAD_EDITS", "3"))
+# Editar el título no debe reenviar el contenido: el tamaño de la escritura no depende de la nota
+TITLE_EDIT_BYTES_BUDGET = int(os.environ.get("NOTEDEA_TITLE_EDIT_BYTES_BUDGET", "2048"))
+
+@pytest.mark.benchmark
+class TestAutoSavePayload:
+    
+    def test_benchmark_auto_save_bytes_and_latency_by_note_size(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
+        
+        results = {}
+        for size in NOTE_SIZES:
+            dashboard_page.click_new_idea()
+            dashboard_page.fill_title(f"Nota de {size} caracteres")
+            content = TestDataGenerator.generate_note_content(size)[:size]
+            assert dashboard_page.measure_auto_save_latency(content) is not None, (
+                f"No se guardó la nota inicial de {size} caracteres"
+            )
+            
+            samples = {"title": [], "content": []}
+            for edit in range(EDITS_PER_SIZE):
+                samples["title"].append(dashboard_page.measure_auto_save_latency(
+                    f"Nota de {size} caracteres #{edit}", field="title"
+                ))
+                # Edición de un carácter al final del contenido
+                samples["content"].append(dashboard_page.measure_auto_save_latency(f"{content}{edit}"))
+            
+            results[size] = {}
+            for field, field_samples in samples.items():
+                assert None not in field_samples, f"Auto-guardado no completado ({size} caracteres, {field})"
+                results[size][field] = {
+                    "bytes_sent": summarize([sample["bytes_sent"] for sample in field_samples]),
+                    "total": summarize([sample["total"] for sample in field_samples]),
+                }
+                print(format_summary(f"{size} caracteres, edición de {field}", results[size][field]["total"]))
+                print(f"📤 {size} caracteres, edición de {field}: "
+                      f"{results[size][field]['bytes_sent']['p50']:.0f} bytes enviados (p50)")
+        
+        dashboard_page.take_screenshot("benchmark_auto_save_payload_01_done")
+        write_benchmark_report("auto_save_payload", {"sizes": results})
+        
+        for size, stats in results.items():
+            assert stats["title"]["bytes_sent"]["max"] <= TITLE_EDIT_BYTES_BUDGET, (
+                f"Editar el título de una nota de {size} caracteres envió {stats['title']['bytes_sent']['max']} bytes"
+            )
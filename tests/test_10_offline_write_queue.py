@@ -0,0 +1,125 @@
+import os
+import time
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import write_benchmark_report
+from tests.utils.network_conditions import apply_preset, cut_database_connection, restore_network
+
+THROTTLE_PRESET = os.environ.get("NOTEDEA_THROTTLE_PRESET", "flaky")
+THROTTLED_EDITS = int(os.environ.get("NOTEDEA_THROTTLED_EDITS", "8"))
+
+class TestOfflineWriteQueue:
+    
+    def create_saved_note(self, dashboard_page, title):
+        dashboard_page.click_new_idea()
+        dashboard_page.fill_title(title)
+        dashboard_page.fill_content(TestDataGenerator.generate_note_content(100))
+        assert dashboard_page.wait_for_auto_save(), "No se completó el auto-guardado"
+        assert dashboard_page.wait_for_pending_writes_flushed()
+        return dashboard_page.get_note_ids()[0]
+    
+    def assert_note_synced(self, auth_session, driver, note_id, title, content):
+        note = auth_session.notes_request(driver, "GET", note_id=note_id)
+        assert note["title"] == title
+        assert note["content"] == content
+        # La escritura parcial conserva los metadatos de la nota
+        assert note["createdAt"] <= note["updatedAt"]
+        assert note["userId"]
+    
+    def test_offline_edits_are_synced_after_reconnect(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        title = "Idea editada sin conexión"
+        note_id = self.create_saved_note(dashboard_page, title)
+        
+        cut_database_connection(authenticated_driver)
+        content = TestDataGenerator.generate_note_content(200)
+        dashboard_page.fill_content(content)
+        
+        assert dashboard_page.is_offline_pending_visible()
+        assert dashboard_page.get_pending_writes()[note_id]["content"] == content
+        dashboard_page.take_screenshot("offline_queue_01_pending")
+        
+        restore_network(authenticated_driver)
+        assert dashboard_page.wait_for_pending_writes_flushed(), "La cola no se vació al recuperar la conexión"
+        self.assert_note_synced(auth_session, authenticated_driver, note_id, title, content)
+        dashboard_page.take_screenshot("offline_queue_02_synced")
+    
+    def test_pending_edits_survive_reload(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        title = "Idea que sobrevive a la recarga"
+        note_id = self.create_saved_note(dashboard_page, title)
+        
+        cut_database_connection(authenticated_driver)
+        content = TestDataGenerator.generate_note_content(300)
+        dashboard_page.fill_content(content)
+        assert dashboard_page.is_offline_pending_visible()
+        
+        # La base de datos sigue cortada tras recargar: lo pendiente solo puede venir de localStorage
+        authenticated_driver.refresh()
+        dashboard_page.wait_for_element(dashboard_page.new_idea_button)
+        assert dashboard_page.get_pending_writes()[note_id]["content"] == content
+        
+        restore_network(authenticated_driver)
+        assert dashboard_page.wait_for_pending_writes_flushed(), "Las ediciones pendientes no se reenviaron"
+        self.assert_note_synced(auth_session, authenticated_driver, note_id, title, content)
+    
+    def test_note_deleted_offline_is_not_recreated(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        note_id = self.create_saved_note(dashboard_page, "Idea borrada sin conexión")
+        
+        cut_database_connection(authenticated_driver)
+        dashboard_page.fill_content(TestDataGenerator.generate_note_content(200))
+        assert dashboard_page.is_offline_pending_visible()
+        assert note_id in dashboard_page.get_pending_writes()
+        
+        dashboard_page.delete_note(dashboard_page.get_note_ids().index(note_id))
+        assert note_id not in dashboard_page.get_pending_writes()
+        dashboard_page.take_screenshot("offline_queue_03_deleted")
+        
+        restore_network(authenticated_driver)
+        assert dashboard_page.wait_for_pending_writes_flushed()
+        # El borrado llega al servidor tras reconectar; después ninguna escritura de la cola debe recrear la nota
+        WebDriverWait(authenticated_driver, 15, poll_frequency=0.5).until(
+            lambda driver: auth_session.notes_request(driver, "GET", note_id=note_id) is None
+        )
+        # Se vuelve a comprobar pasada la ventana de envío de la cola y el primer reintento
+        time.sleep(1.5)
+        assert auth_session.notes_request(authenticated_driver, "GET", note_id=note_id) is None
+    
+    @pytest.mark.benchmark
+    def test_benchmark_throttled_auto_save_coalesces_writes(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        title = "Idea con red lenta"
+        note_id = self.create_saved_note(dashboard_page, title)
+        stats_before = dashboard_page.get_write_queue_stats()
+        
+        apply_preset(authenticated_driver, THROTTLE_PRESET)
+        base_content = TestDataGenerator.generate_note_content(500)
+        start = time.perf_counter()
+        for edit in range(THROTTLED_EDITS):
+            content = f"{base_content} #{edit}"
+            dashboard_page.fill_content(content)
+            # Algo más que el debounce del auto-guardado: cada edición llega a encolarse
+            time.sleep(1.2)
+        
+        assert dashboard_page.wait_for_pending_writes_flushed(timeout=60)
+        elapsed = time.perf_counter() - start
+        restore_network(authenticated_driver)
+        
+        stats_after = dashboard_page.get_write_queue_stats()
+        enqueued = stats_after["enqueued"] - stats_before["enqueued"]
+        flushes = stats_after["flushes"] - stats_before["flushes"]
+        print(f"📶 {THROTTLE_PRESET}: {enqueued} guardados encolados en {flushes} escrituras, "
+              f"{THROTTLED_EDITS / elapsed:.2f} ediciones/s hasta sincronizar")
+        write_benchmark_report("offline_write_queue", {
+            "preset": THROTTLE_PRESET,
+            "edits": THROTTLED_EDITS,
+            "enqueued": enqueued,
+            "flushes": flushes,
+            "elapsed": elapsed,
+        })
+        
+        self.assert_note_synced(auth_session, authenticated_driver, note_id, title, content)
+        assert 0 < flushes <= enqueued
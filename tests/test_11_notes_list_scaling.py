@@ -0,0 +1,49 @@
+import os
+import pytest
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import write_benchmark_report
+
+NOTE_COUNT = int(os.environ.get("NOTEDEA_SCALING_NOTE_COUNT", "10000"))
+FIRST_PAINT_BUDGET = float(os.environ.get("NOTEDEA_FIRST_PAINT_BUDGET_MS", "4000")) / 1000
+DOM_NODE_BUDGET = int(os.environ.get("NOTEDEA_DOM_NODE_BUDGET", "3000"))
+# Con la lista virtualizada las tarjetas del DOM dependen de la altura de la ventana, no de las notas
+RENDERED_CARDS_BUDGET = int(os.environ.get("NOTEDEA_RENDERED_CARDS_BUDGET", "30"))
+
+@pytest.mark.benchmark
+class TestNotesListScaling:
+    
+    def test_benchmark_first_render_with_many_notes(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        auth_session.seed_notes(authenticated_driver, TestDataGenerator.generate_notes(NOTE_COUNT), timeout=120)
+        
+        first_paint = dashboard_page.measure_first_note_paint()
+        assert first_paint is not None, "No se pintó ninguna tarjeta"
+        auth_session.wait_for_note_count(authenticated_driver, NOTE_COUNT, timeout=60)
+        state = dashboard_page.get_notes_list_state()
+        dom_nodes = dashboard_page.count_dom_nodes()
+        print(f"🖼️ {NOTE_COUNT} notas: primera tarjeta en {first_paint:.2f}s, "
+              f"{state['rendered']} tarjetas y {dom_nodes} nodos en el DOM")
+        dashboard_page.take_screenshot("notes_list_scaling_01_first_page")
+        
+        # Al llegar al final de la lista se carga otra página sin aumentar las tarjetas renderizadas
+        loaded = dashboard_page.load_more_notes()
+        after_scroll = dashboard_page.get_notes_list_state()
+        dashboard_page.take_screenshot("notes_list_scaling_02_next_page")
+        
+        write_benchmark_report("notes_list_scaling", {
+            "note_count": NOTE_COUNT,
+            "first_paint": first_paint,
+            "dom_nodes": dom_nodes,
+            "first_page": state,
+            "after_scroll": after_scroll,
+        })
+        auth_session.clear_notes(authenticated_driver, timeout=60)
+        
+        assert state["has_more"]
+        assert state["loaded"] == state["page_size"]
+        assert loaded > state["loaded"]
+        assert first_paint <= FIRST_PAINT_BUDGET, f"Primera tarjeta en {first_paint:.2f}s"
+        assert dom_nodes <= DOM_NODE_BUDGET, f"{dom_nodes} nodos en el DOM"
+        assert state["rendered"] <= RENDERED_CARDS_BUDGET
+        assert after_scroll["rendered"] <= RENDERED_CARDS_BUDGET
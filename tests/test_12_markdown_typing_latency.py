@@ -0,0 +1,49 @@
+import os
+import pytest
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import summarize, format_summary, write_benchmark_report
+
+DOCUMENT_LINES = int(os.environ.get("NOTEDEA_TYPING_DOCUMENT_LINES", "5000"))
+TYPED_TEXT = os.environ.get("NOTEDEA_TYPING_TEXT", " texto escrito tecla a tecla")
+INPUT_PAINT_P95_BUDGET = float(os.environ.get("NOTEDEA_INPUT_PAINT_P95_BUDGET_MS", "100")) / 1000
+
+@pytest.mark.benchmark
+class TestMarkdownTypingLatency:
+    
+    def test_benchmark_typing_into_long_markdown_note(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
+        dashboard_page.click_new_idea()
+        dashboard_page.fill_title(f"Documento de {DOCUMENT_LINES} líneas")
+        dashboard_page.fill_content(TestDataGenerator.generate_markdown_document(DOCUMENT_LINES))
+        assert dashboard_page.wait_for_auto_save(), "No se completó el auto-guardado"
+        
+        # Mientras se escribe solo está montado el textarea: esta latencia no incluye el render de Markdown
+        latencies = dashboard_page.measure_typing_latency(TYPED_TEXT)
+        assert len(latencies) == len(TYPED_TEXT), "No se midieron todas las pulsaciones"
+        assert dashboard_page.get_content_value().endswith(TYPED_TEXT)
+        
+        # La vista previa se monta al salir del modo edición: primero en frío y después tras una
+        # edición más, en la que los bloques sin cambios salen de la caché del renderer
+        preview_cold = dashboard_page.measure_preview_render()
+        assert preview_cold is not None, "No se pintó la vista previa"
+        dashboard_page.wait_for_element(dashboard_page.content_area).click()
+        dashboard_page.measure_typing_latency(TYPED_TEXT[:1])
+        preview_warm = dashboard_page.measure_preview_render()
+        assert preview_warm is not None, "No se pintó la vista previa tras editar"
+        
+        stats = summarize(latencies)
+        metrics = dashboard_page.get_markdown_metrics()
+        print(format_summary(f"Entrada → pintado con {DOCUMENT_LINES} líneas", stats))
+        print(f"🖼️ Vista previa: {preview_cold['ms']:.0f}ms en frío, {preview_warm['ms']:.0f}ms tras editar")
+        print(f"🧮 Métricas de Markdown: {metrics}")
+        dashboard_page.take_screenshot("benchmark_markdown_typing_01_done")
+        write_benchmark_report("markdown_typing_latency", {
+            "document_lines": DOCUMENT_LINES,
+            "keystrokes": len(TYPED_TEXT),
+            "input_to_paint": stats,
+            "preview_render": {"cold": preview_cold, "after_edit": preview_warm},
+            "markdown_metrics": metrics,
+        })
+        
+        assert stats["p95"] <= INPUT_PAINT_P95_BUDGET, f"p95 entrada → pintado: {stats['p95'] * 1000:.0f}ms"
@@ -0,0 +1,40 @@
+import os
+import pytest
+from tests.pages.login_page import LoginPage
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.benchmark import write_benchmark_report
+from tests.utils.web_vitals import load_budgets, median_page_load, check_budgets, BUDGETS_PATH
+
+# La mediana de varias cargas en frío amortigua el ruido de una sola navegación
+PAGE_LOADS = int(os.environ.get("NOTEDEA_WEB_VITALS_RUNS", "3"))
+
+# Los presupuestos de web_vitals_budgets.json son para el build de producción (npm run build && npm run start):
+# con next dev los bundles van sin minificar y el TTFB incluye la compilación de la ruta
+@pytest.mark.benchmark
+class TestWebVitalsBudgets:
+    
+    def test_login_page_within_budget(self, driver):
+        login_page = LoginPage(driver)
+        samples = [login_page.measure_page_load("/", login_page.email_input) for _ in range(PAGE_LOADS)]
+        self._assert_within_budget("/", "web_vitals_login", samples)
+        login_page.take_screenshot("web_vitals_01_login")
+    
+    def test_notes_dashboard_within_budget(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
+        samples = [
+            dashboard_page.measure_page_load("/notes", dashboard_page.new_idea_button)
+            for _ in range(PAGE_LOADS)
+        ]
+        self._assert_within_budget("/notes", "web_vitals_notes", samples)
+        dashboard_page.take_screenshot("web_vitals_02_notes")
+    
+    def _assert_within_budget(self, page, report_name, samples):
+        vitals = median_page_load(samples)
+        write_benchmark_report(report_name, {
+            "page": page,
+            "budgets_file": BUDGETS_PATH,
+            "median": vitals,
+            "samples": samples,
+        })
+        violations = check_budgets(page, vitals, load_budgets())
+        assert not violations, "Presupuesto de rendimiento superado:\n" + "\n".join(violations)
@@ -0,0 +1,70 @@
+import os
+import time
+import pytest
+from tests.pages.dashboard_page import DashboardPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import summarize, format_summary, write_benchmark_report
+
+NOTE_COUNT = int(os.environ.get("NOTEDEA_STORE_NOTE_COUNT", "200"))
+UPDATES = int(os.environ.get("NOTEDEA_STORE_UPDATES", "10"))
+UPDATE_P95_BUDGET = float(os.environ.get("NOTEDEA_STORE_UPDATE_P95_BUDGET_MS", "1000")) / 1000
+
+class TestSharedNotesStore:
+    
+    def test_single_subscription_with_editor_open(self, authenticated_driver):
+        dashboard_page = DashboardPage(authenticated_driver)
+        
+        dashboard_page.click_new_idea()
+        dashboard_page.fill_title("Nota con el editor abierto")
+        dashboard_page.fill_content("El editor y el dashboard comparten la misma suscripción")
+        assert dashboard_page.wait_for_auto_save(), "No se completó el auto-guardado"
+        
+        stats = dashboard_page.get_notes_store_stats()
+        print(f"🔌 Store de notas: {stats}")
+        dashboard_page.take_screenshot("shared_notes_store_01_editor_open")
+        
+        assert stats is not None, "La app no expone las estadísticas del store de notas"
+        assert stats["subscriptions"] == 1, f"Suscripciones a Firebase abiertas: {stats['subscriptions']}"
+        assert stats["listeners"] >= 1
+    
+    @pytest.mark.benchmark
+    def test_benchmark_update_cost_with_editor_open(self, authenticated_driver, auth_session):
+        dashboard_page = DashboardPage(authenticated_driver)
+        auth_session.seed_notes(authenticated_driver, TestDataGenerator.generate_notes(NOTE_COUNT))
+        dashboard_page.click_note_card(0)
+        
+        before = dashboard_page.get_notes_store_stats()
+        samples, fan_out = [], []
+        for update in range(UPDATES):
+            # La nota más antigua sube al principio de la lista mientras el editor sigue abierto
+            title = f"Actualizada {update} con el editor abierto"
+            start = time.perf_counter()
+            auth_session.notes_request(authenticated_driver, "PATCH", {
+                "title": title,
+                "updatedAt": int(time.time() * 1000),
+            }, note_id=f"seed-{NOTE_COUNT - 1 - update:05d}")
+            assert dashboard_page.wait_for_first_note_title(title), f"No se reflejó la actualización {update}"
+            samples.append(time.perf_counter() - start)
+            fan_out.append(dashboard_page.get_notes_store_stats()["lastUpdateMs"] / 1000)
+        after = dashboard_page.get_notes_store_stats()
+        
+        results = {
+            "note_count": NOTE_COUNT,
+            "update": summarize(samples),
+            "fan_out": summarize(fan_out),
+            "store_updates": after["updates"] - before["updates"],
+            "subscriptions": after["subscriptions"],
+            "listeners": after["listeners"],
+        }
+        print(format_summary("Escritura → lista actualizada con el editor abierto", results["update"]))
+        print(format_summary("Reparto de la actualización a los consumidores", results["fan_out"]))
+        dashboard_page.take_screenshot("shared_notes_store_02_updates")
+        auth_session.clear_notes(authenticated_driver, timeout=60)
+        write_benchmark_report("shared_notes_store", results)
+        
+        assert results["subscriptions"] == 1
+        # Cada escritura remota produce una sola actualización del store, no una por consumidor
+        assert results["store_updates"] == UPDATES, f"Actualizaciones del store: {results['store_updates']}"
+        assert results["update"]["p95"] <= UPDATE_P95_BUDGET, (
+            f"p95 de actualización con el editor abierto: {results['update']['p95']:.2f}s"
+        )
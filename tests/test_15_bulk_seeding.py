@@ -0,0 +1,38 @@
+import os
+import time
+import pytest
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.benchmark import write_benchmark_report
+
+SEED_COUNT = int(os.environ.get("NOTEDEA_BULK_SEED_COUNT", "5000"))
+SEED_BUDGET = float(os.environ.get("NOTEDEA_BULK_SEED_BUDGET_MS", "10000")) / 1000
+
+@pytest.mark.benchmark
+class TestBulkSeeding:
+    
+    def test_benchmark_bulk_seed_and_teardown(self, authenticated_driver, auth_session, note_seeder):
+        notes = TestDataGenerator.generate_realistic_notes(SEED_COUNT, seed=SEED_COUNT)
+        payload_bytes = sum(len(note["content"].encode()) for note in notes.values())
+        
+        start = time.perf_counter()
+        note_seeder.seed(notes)
+        seed_time = time.perf_counter() - start
+        assert note_seeder.count() == SEED_COUNT
+        auth_session.wait_for_note_count(authenticated_driver, SEED_COUNT, timeout=60)
+        
+        start = time.perf_counter()
+        note_seeder.teardown()
+        teardown_time = time.perf_counter() - start
+        assert note_seeder.count() == 0
+        
+        print(f"🌱 {SEED_COUNT} notas ({payload_bytes / 1e6:.1f} MB) sembradas en {seed_time:.2f}s "
+              f"y borradas en {teardown_time:.2f}s")
+        write_benchmark_report("bulk_seeding", {
+            "note_count": SEED_COUNT,
+            "payload_bytes": payload_bytes,
+            "seed_time": seed_time,
+            "teardown_time": teardown_time,
+            "notes_per_second": SEED_COUNT / seed_time if seed_time else 0.0,
+        })
+        
+        assert seed_time <= SEED_BUDGET, f"Sembrar {SEED_COUNT} notas tardó {seed_time:.2f}s"
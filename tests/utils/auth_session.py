@@ -0,0 +1,197 @@
+import json
+import os
+import urllib.request
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.pages.login_page import LoginPage
+from tests.utils.note_seeder import NoteSeeder
+
+FIREBASE_DB_NAME = "firebaseLocalStorageDb"
+FIREBASE_STORE_NAME = "firebaseLocalStorage"
+
+# Lee el estado de persistencia de Firebase Auth (IndexedDB y claves firebase:* de localStorage)
+CAPTURE_AUTH_STATE_SCRIPT = """
+const dbName = arguments[0];
+const storeName = arguments[1];
+const done = arguments[arguments.length - 1];
+
+const localItems = {};
+for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (key.startsWith('firebase:')) {
+        localItems[key] = localStorage.getItem(key);
+    }
+}
+
+const request = indexedDB.open(dbName);
+request.onerror = () => done({ records: [], localStorage: localItems });
+request.onsuccess = () => {
+    const db = request.result;
+    if (!db.objectStoreNames.contains(storeName)) {
+        db.close();
+        done({ records: [], localStorage: localItems });
+        return;
+    }
+    const getAll = db.transaction(storeName, 'readonly').objectStore(storeName).getAll();
+    getAll.onsuccess = () => {
+        db.close();
+        done({ records: getAll.result, localStorage: localItems });
+    };
+    getAll.onerror = () => done({ records: [], localStorage: localItems });
+};
+"""
+
+# Escribe el estado capturado en el origen actual antes de que la app cargue Firebase
+INJECT_AUTH_STATE_SCRIPT = """
+const dbName = arguments[0];
+const storeName = arguments[1];
+const state = arguments[2];
+const done = arguments[arguments.length - 1];
+
+Object.entries(state.localStorage).forEach(([key, value]) => localStorage.setItem(key, value));
+
+const request = indexedDB.open(dbName, 1);
+request.onupgradeneeded = () => {
+    request.result.createObjectStore(storeName, { keyPath: 'fbase_key' });
+};
+request.onerror = () => done(false);
+request.onsuccess = () => {
+    const db = request.result;
+    const tx = db.transaction(storeName, 'readwrite');
+    state.records.forEach((record) => tx.objectStore(storeName).put(record));
+    tx.oncomplete = () => {
+        db.close();
+        done(true);
+    };
+    tx.onerror = () => done(false);
+};
+"""
+
+# Sin lista (cargando o vacía) no hay tarjetas; con lista, se espera a la primera página completa
+LOADED_NOTE_COUNT_SCRIPT = """
+const count = arguments[0];
+const list = document.querySelector("[data-testid='notes-list']");
+if (!list) {
+    return count === 0 && document.querySelectorAll("[data-testid^='note-card-']").length === 0;
+}
+return Number(list.dataset.loadedCount) === Math.min(count, Number(list.dataset.pageSize));
+"""
+
+
+class AuthSessionCache:
+    """Registra un usuario una sola vez por worker y reutiliza su sesión de Firebase Auth"""
+
+    def __init__(self, base_url, email, password, emulator=None):
+        self.base_url = base_url
+        self.email = email
+        self.password = password
+        self.emulator = emulator
+        self.database_url = os.environ.get("NEXT_PUBLIC_FIREBASE_DATABASE_URL", "").rstrip("/")
+        self.state = None
+        self._backend_checked = False
+
+    def sign_up(self, driver):
+        login_page = LoginPage(driver)
+        login_page.navigate_to_login()
+        login_page.toggle_to_signup()
+        login_page.fill_email(self.email)
+        login_page.fill_password(self.password)
+        login_page.click_submit()
+        login_page.wait_for_redirect_to_dashboard()
+
+        self.state = self.capture(driver)
+        if not self.state["records"] and not self.state["localStorage"]:
+            raise Exception("No se encontró el estado de persistencia de Firebase Auth tras el registro")
+        print(f"✅ Sesión de {self.email} capturada para reutilizarla entre tests")
+
+    def capture(self, driver):
+        driver.set_script_timeout(10)
+        return driver.execute_async_script(CAPTURE_AUTH_STATE_SCRIPT, FIREBASE_DB_NAME, FIREBASE_STORE_NAME)
+
+    def inject(self, driver):
+        # Un recurso estático del mismo origen basta para acceder a su almacenamiento sin cargar la app
+        driver.get(f"{self.base_url}/favicon.ico")
+        driver.set_script_timeout(10)
+        if not driver.execute_async_script(INJECT_AUTH_STATE_SCRIPT, FIREBASE_DB_NAME, FIREBASE_STORE_NAME, self.state):
+            raise Exception("No se pudo inyectar la sesión de Firebase Auth")
+
+    def open_dashboard(self, driver):
+        self.inject(driver)
+        driver.get(f"{self.base_url}/notes")
+        WebDriverWait(driver, 15).until(lambda d: d.find_elements(By.ID, "new-idea-button"))
+        self.check_backend(driver)
+        self.clear_notes(driver)
+
+    def check_backend(self, driver):
+        """Con --firebase-emulator, aborta la ejecución si la app no se arrancó contra los emuladores:
+        los tests irían contra el proyecto real mientras la suite limpia el emulador"""
+        if not self.emulator or self._backend_checked:
+            return
+        backend = driver.execute_script("return window.__notedeaFirebaseBackend || null") or {}
+        if backend.get("databaseEmulatorHost") != self.emulator.app_database_host or not backend.get("authEmulatorUrl"):
+            pytest.exit(
+                "La app no usa los emuladores de Firebase (base de datos: "
+                f"{backend.get('databaseEmulatorHost') or 'proyecto real'}, se esperaba "
+                f"{self.emulator.app_database_host}). Arráncala con npm run dev:emulator.",
+                returncode=3,
+            )
+        self._backend_checked = True
+
+    def clear_notes(self, driver, timeout=10):
+        # El usuario es compartido por todos los tests del worker: se parte siempre de notes/{userId} vacío
+        if not self.emulator and not self.database_url:
+            print("⚠️ NEXT_PUBLIC_FIREBASE_DATABASE_URL no configurada, no se limpian las notas")
+            return
+
+        self.notes_request(driver, "DELETE")
+
+        # Esperar a que la suscripción del dashboard refleje el borrado
+        self.wait_for_note_count(driver, 0, timeout)
+
+    def note_seeder(self, driver, **kwargs):
+        """NoteSeeder para el usuario de la sesión, contra el emulador o la base configurada"""
+        if not self.emulator and not self.database_url:
+            raise Exception("NEXT_PUBLIC_FIREBASE_DATABASE_URL no configurada, no se pueden sembrar notas")
+
+        user = self._session_user(driver)
+        if self.emulator:
+            return NoteSeeder.for_emulator(self.emulator, user["uid"], **kwargs)
+        return NoteSeeder.for_database(self.database_url, user["uid"], user["stsTokenManager"]["accessToken"], **kwargs)
+
+    def seed_notes(self, driver, notes, timeout=60):
+        """Escribe en lotes las notas {id: datos} del usuario actual y espera a que el dashboard las muestre"""
+        self.note_seeder(driver).seed(notes)
+        self.wait_for_note_count(driver, len(notes), timeout)
+
+    def notes_request(self, driver, method, data=None, note_id=None):
+        user = self._session_user(driver)
+        path = f"notes/{user['uid']}" + (f"/{note_id}" if note_id else "")
+        if self.emulator:
+            return self.emulator.database_request(method, path, data)
+
+        token = user["stsTokenManager"]["accessToken"]
+        body = json.dumps(data).encode() if data is not None else None
+        request = urllib.request.Request(f"{self.database_url}/{path}.json?auth={token}", data=body, method=method)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read() or b"null")
+
+    def wait_for_note_count(self, driver, count, timeout=10):
+        # La lista está paginada y virtualizada: se compara con las notas cargadas, no con las tarjetas del DOM
+        WebDriverWait(driver, timeout).until(lambda d: d.execute_script(LOADED_NOTE_COUNT_SCRIPT, count))
+
+    def _session_user(self, driver):
+        # Firebase refresca el token al cargar la app, por eso se vuelve a leer del navegador
+        user = self._current_user(self.capture(driver))
+        if not user:
+            raise Exception("No hay una sesión de Firebase Auth en el navegador")
+        return user
+
+    def _current_user(self, state):
+        for record in state["records"]:
+            if record.get("fbase_key", "").startswith("firebase:authUser:"):
+                return record["value"]
+        for key, value in state["localStorage"].items():
+            if key.startswith("firebase:authUser:"):
+                return json.loads(value)
+        return None
@@ -0,0 +1,41 @@
+import json
+import os
+from datetime import datetime
+from tests.utils.step_timer import percentile
+
+BENCHMARK_DIR = os.environ.get("NOTEDEA_BENCHMARK_DIR", "reports/benchmarks")
+
+
+def summarize(samples):
+    if not samples:
+        return {"count": 0}
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "mean": sum(samples) / len(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def format_summary(label, stats, unit="ms", scale=1000):
+    if not stats.get("count"):
+        return f"{label}: sin muestras"
+    return (
+        f"{label}: n={stats['count']} min={stats['min'] * scale:.0f}{unit} "
+        f"p50={stats['p50'] * scale:.0f}{unit} p95={stats['p95'] * scale:.0f}{unit} "
+        f"max={stats['max'] * scale:.0f}{unit}"
+    )
+
+
+def write_benchmark_report(name, data):
+    # Con NOTEDEA_BENCHMARK_LABEL (p. ej. "antes"/"despues") se conservan varias ejecuciones para compararlas
+    label = os.environ.get("NOTEDEA_BENCHMARK_LABEL")
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    path = os.path.join(BENCHMARK_DIR, f"{name}.{label}.json" if label else f"{name}.json")
+    with open(path, "w") as f:
+        json.dump({"benchmark": name, "label": label, "generated_at": datetime.now().isoformat(), **data}, f, indent=2)
+    print(f"📊 Resultados del benchmark guardados en {path}")
+    return path
@@ -0,0 +1,154 @@
+import time
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from tests.utils.driver_events import close_driver_events
+from tests.utils.network_conditions import restore_network
+
+
+class BrowserPool:
+    """Pool de instancias de WebDriver precalentadas que se reutilizan entre tests.
+    factory(slot) crea un navegador; slot identifica el hueco que ocupa mientras vive (p. ej. su caché de disco)."""
+
+    def __init__(self, factory, base_url, size=1, max_uses=10, rss_probe=None):
+        self.factory = factory
+        self.base_url = base_url
+        self.size = size
+        self.max_uses = max_uses
+        self.rss_probe = rss_probe
+
+        self._idle = []
+        self._uses = {}
+        self._slots = {}
+
+        self.cold_starts = 0
+        self.cold_start_time = 0.0
+        self.reuses = 0
+        self.reset_time = 0.0
+        self.recycled = 0
+        self.peak_rss = 0
+
+    def warm_up(self):
+        while len(self._idle) < self.size:
+            self._idle.append(self._create())
+
+    def acquire(self):
+        if self._idle:
+            driver = self._idle.pop()
+            # Un navegador del calentamiento que aún no se ha usado no ahorra ningún arranque
+            if self._uses.get(id(driver), 0) > 0:
+                self.reuses += 1
+            return driver
+        return self._create()
+
+    def release(self, driver):
+        self._sample_rss(driver)
+        if self._uses.get(id(driver), 0) >= self.max_uses:
+            print(f"♻️ Reciclando navegador tras {self.max_uses} usos")
+            self._discard(driver)
+            return
+
+        start = time.perf_counter()
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"⚠️ Navegador no responde, se descarta: {e}")
+            self._discard(driver)
+            return
+        finally:
+            self.reset_time += time.perf_counter() - start
+
+        self._idle.append(driver)
+
+    def reset(self, driver):
+        # Cerrar alertas pendientes que bloquearían cualquier otro comando
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        # Un test puede haber cortado o limitado la red
+        restore_network(driver)
+        # Primero se sale de la app: con la página cargada, Firebase Auth o la cola de escrituras
+        # podrían volver a escribir en IndexedDB o localStorage después de borrarlos
+        driver.get("about:blank")
+        # Borrar cookies, localStorage e IndexedDB (sesión de Firebase Auth) del origen de la app
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": self.base_url,
+            "storageTypes": "all",
+        })
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        if getattr(driver, "_notedea_events", None):
+            driver._notedea_events.clear()
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+
+    def close(self):
+        while self._idle:
+            self._quit(self._idle.pop())
+
+    def stats(self):
+        return {
+            "cold_starts": self.cold_starts,
+            "cold_start_time": self.cold_start_time,
+            "reuses": self.reuses,
+            "reset_time": self.reset_time,
+            "recycled": self.recycled,
+            "peak_rss": self.peak_rss,
+        }
+
+    def _create(self):
+        start = time.perf_counter()
+        # El hueco libre más bajo: un navegador nuevo hereda la caché del que sustituye
+        slot = min(set(range(len(self._slots) + 1)) - set(self._slots.values()))
+        driver = self.factory(slot)
+        self.cold_start_time += time.perf_counter() - start
+        self.cold_starts += 1
+        self._uses[id(driver)] = 0
+        self._slots[id(driver)] = slot
+        return driver
+
+    def _discard(self, driver):
+        self.recycled += 1
+        self._quit(driver)
+
+    def _sample_rss(self, driver):
+        if not self.rss_probe:
+            return
+        try:
+            self.peak_rss = max(self.peak_rss, self.rss_probe(driver) or 0)
+        except Exception:
+            pass
+
+    def _quit(self, driver):
+        self._sample_rss(driver)
+        self._uses.pop(id(driver), None)
+        self._slots.pop(id(driver), None)
+        close_driver_events(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def merge_pool_stats(all_stats):
+    merged = {}
+    for stats in all_stats:
+        for key, value in stats.items():
+            if key.startswith("peak_"):
+                merged[key] = max(merged.get(key, 0), value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def format_pool_summary(stats, profile):
+    cold_starts = stats.get("cold_starts", 0)
+    average_cold_start = stats.get("cold_start_time", 0.0) / cold_starts if cold_starts else 0.0
+    time_saved = stats.get("reuses", 0) * average_cold_start - stats.get("reset_time", 0.0)
+    peak_rss = stats.get("peak_rss", 0)
+    return (
+        f"Pool de navegadores: {cold_starts} arranques en frío "
+        f"({stats.get('cold_start_time', 0.0):.1f}s), {stats.get('reuses', 0)} reutilizaciones, "
+        f"{stats.get('recycled', 0)} reciclados, reset total {stats.get('reset_time', 0.0):.1f}s, "
+        f"tiempo ahorrado ~{time_saved:.1f}s\n"
+        f"Perfil {profile}: arranque medio {average_cold_start:.2f}s, "
+        f"RSS pico {f'{peak_rss / (1024 * 1024):.0f} MB' if peak_rss else 'no disponible'}"
+    )
@@ -0,0 +1,133 @@
+import os
+from selenium.webdriver.chrome.options import Options
+
+DEFAULT_PROFILE = "debug-headed"
+
+SHARED_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "notedea-tests", "chrome-disk-cache")
+
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+PROFILES = {
+    # Ventana visible con todos los recursos, igual que la configuración original de la suite
+    "debug-headed": {
+        "headless": False,
+        "window_size": "1920,1080",
+        "block_images": False,
+        "block_fonts": False,
+        "trim_background": False,
+        "shared_disk_cache": False,
+        "arguments": [],
+    },
+    "fast-headless": {
+        "headless": True,
+        "window_size": "1920,1080",
+        "block_images": True,
+        "block_fonts": True,
+        "trim_background": True,
+        "shared_disk_cache": True,
+        "arguments": [],
+    },
+    "low-memory": {
+        "headless": True,
+        "window_size": "1280,800",
+        "block_images": True,
+        "block_fonts": True,
+        "trim_background": True,
+        "shared_disk_cache": True,
+        "arguments": [
+            "--renderer-process-limit=1",
+            "--disable-site-isolation-trials",
+            "--js-flags=--max-old-space-size=256",
+            "--disk-cache-size=52428800",
+        ],
+    },
+}
+
+
+def get_profile(name):
+    if name not in PROFILES:
+        raise ValueError(f"Perfil de navegador desconocido: {name} (opciones: {', '.join(PROFILES)})")
+    return PROFILES[name]
+
+
+def disk_cache_dir(slot=0):
+    # Chrome no admite varios procesos sobre la misma caché de disco: un directorio por worker y hueco del pool,
+    # que se conserva entre los navegadores que ocupan ese hueco a lo largo de la ejecución
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return os.path.join(SHARED_DISK_CACHE_DIR, f"{worker}-{slot}")
+
+
+def build_chrome_options(name, cache_slot=0):
+    profile = get_profile(name)
+
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"--window-size={profile['window_size']}")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if profile["headless"]:
+        chrome_options.add_argument("--headless=new")
+
+    if profile["block_images"]:
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+
+    if profile["trim_background"]:
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--no-first-run")
+
+    if profile["shared_disk_cache"]:
+        cache_dir = disk_cache_dir(cache_slot)
+        os.makedirs(cache_dir, exist_ok=True)
+        chrome_options.add_argument(f"--disk-cache-dir={cache_dir}")
+
+    for argument in profile["arguments"]:
+        chrome_options.add_argument(argument)
+
+    return chrome_options
+
+
+def apply_runtime_settings(driver, name):
+    # Las fuentes no tienen preferencia de Chrome: se bloquean por URL a través de CDP
+    if get_profile(name)["block_fonts"]:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": FONT_URL_PATTERNS})
+        # network_conditions parte de esta lista al añadir o quitar bloqueos durante un test
+        driver._notedea_blocked_urls = list(FONT_URL_PATTERNS)
+
+
+def process_tree_rss(pid):
+    """Memoria residente actual (VmRSS) de un proceso y sus descendientes en bytes; None fuera de Linux.
+    Se suma lo que ocupan a la vez: sumar los picos de cada proceso (VmHWM) sobrestimaría el pico real."""
+    if not os.path.exists(f"/proc/{pid}"):
+        return None
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
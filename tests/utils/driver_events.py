@@ -0,0 +1,215 @@
+import json
+import threading
+import time
+import uuid
+import trio
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+DOM_BINDING = "__notedeaDomEvent"
+EVENT_BUFFER_SIZE = 1000
+MAX_EVENTS = 5000
+
+# Vigila con un MutationObserver que aparezca un elemento (y opcionalmente un texto) y avisa a Python por
+# el binding de CDP. Sin binding (conexión CDP no disponible) deja el aviso en window para leerlo por polling.
+DOM_WATCH_SCRIPT = """
+const watchId = arguments[0];
+const selector = arguments[1];
+const text = arguments[2];
+const bindingName = arguments[3];
+const matches = () => Array.from(document.querySelectorAll(selector))
+    .some((element) => text === null || element.textContent.includes(text));
+const emit = () => {
+    if (typeof window[bindingName] === 'function') {
+        window[bindingName](JSON.stringify({ watch: watchId }));
+    }
+    window.__notedeaDomEvents = (window.__notedeaDomEvents || []).concat([watchId]);
+};
+if (matches()) {
+    emit();
+    return true;
+}
+const observer = new MutationObserver(() => {
+    if (matches()) {
+        observer.disconnect();
+        delete window.__notedeaDomWatches[watchId];
+        emit();
+    }
+});
+observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true, attributes: true });
+window.__notedeaDomWatches = window.__notedeaDomWatches || {};
+window.__notedeaDomWatches[watchId] = observer;
+return false;
+"""
+
+DOM_UNWATCH_SCRIPT = """
+const watches = window.__notedeaDomWatches || {};
+if (watches[arguments[0]]) {
+    watches[arguments[0]].disconnect();
+    delete watches[arguments[0]];
+}
+"""
+
+
+def _remote_value(remote_object):
+    if remote_object.value is not None:
+        return str(remote_object.value)
+    return remote_object.description or remote_object.type_
+
+
+class DriverEvents:
+    """Diálogos, mensajes de consola y cambios del DOM empujados por CDP a Python según ocurren.
+    La conexión vive en un hilo con su propio bucle de trio; las esperas se resuelven con el evento,
+    sin intervalos de polling. Si la conexión no está disponible, las esperas vuelven a sondear."""
+
+    def __init__(self, driver, connect_timeout=10):
+        self.driver = driver
+        self.events = []
+        # Número de secuencia del próximo evento: crece siempre, aunque se recorte o vacíe el registro
+        self._next_seq = 0
+        self.error = None
+        self._condition = threading.Condition()
+        self._ready = threading.Event()
+        self._trio_token = None
+        self._cancel_scope = None
+        self._thread = threading.Thread(target=self._run, name="notedea-driver-events", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(connect_timeout):
+            self.error = TimeoutException("La conexión CDP no respondió")
+        if self.error:
+            print(f"⚠️ Eventos del navegador no disponibles, se usará polling: {self.error}")
+
+    @property
+    def available(self):
+        return self._ready.is_set() and self.error is None
+
+    def _run(self):
+        try:
+            trio.run(self._listen)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._ready.set()
+
+    async def _listen(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            await session.execute(devtools.page.enable())
+            await session.execute(devtools.runtime.enable())
+            await session.execute(devtools.runtime.add_binding(DOM_BINDING))
+            receiver = session.listen(
+                devtools.page.JavascriptDialogOpening,
+                devtools.runtime.ConsoleAPICalled,
+                devtools.runtime.ExceptionThrown,
+                devtools.runtime.BindingCalled,
+                buffer_size=EVENT_BUFFER_SIZE,
+            )
+            with trio.CancelScope() as cancel_scope:
+                self._cancel_scope = cancel_scope
+                self._trio_token = trio.lowlevel.current_trio_token()
+                self._ready.set()
+                async for event in receiver:
+                    self._record(self._to_event(event, devtools))
+
+    def _to_event(self, event, devtools):
+        if isinstance(event, devtools.page.JavascriptDialogOpening):
+            return {"type": "dialog", "kind": event.type_.value, "message": event.message}
+        if isinstance(event, devtools.runtime.ConsoleAPICalled):
+            return {"type": "console", "level": event.type_, "text": " ".join(_remote_value(arg) for arg in event.args)}
+        if isinstance(event, devtools.runtime.ExceptionThrown):
+            details = event.exception_details
+            text = details.exception.description if details.exception else details.text
+            return {"type": "console", "level": "exception", "text": text}
+        if event.name == DOM_BINDING:
+            return {"type": "dom", "watch": json.loads(event.payload)["watch"]}
+        return None
+
+    def _record(self, event):
+        if event is None:
+            return
+        event["time"] = time.perf_counter()
+        with self._condition:
+            event["seq"] = self._next_seq
+            self._next_seq += 1
+            self.events.append(event)
+            del self.events[:-MAX_EVENTS]
+            self._condition.notify_all()
+
+    def mark(self):
+        """Secuencia del próximo evento: las esperas con since=mark() ignoran los eventos anteriores"""
+        with self._condition:
+            return self._next_seq
+
+    def clear(self):
+        with self._condition:
+            self.events.clear()
+
+    def wait_for(self, predicate, timeout=10, since=0):
+        """Primer evento desde `since` que cumple predicate, o None si no llega en timeout segundos"""
+        def find():
+            return next((event for event in self.events if event["seq"] >= since and predicate(event)), None)
+
+        with self._condition:
+            return self._condition.wait_for(find, timeout)
+
+    def wait_for_dialog(self, timeout=10, since=0):
+        """Espera a que se abra un alert/confirm/prompt y devuelve el evento"""
+        if self.available:
+            return self.wait_for(lambda event: event["type"] == "dialog", timeout, since)
+        try:
+            alert = WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            return {"type": "dialog", "kind": None, "message": alert.text}
+        except TimeoutException:
+            return None
+
+    def console_messages(self, levels=None, since=0):
+        with self._condition:
+            return [
+                event for event in self.events
+                if event["seq"] >= since and event["type"] == "console" and (levels is None or event["level"] in levels)
+            ]
+
+    def watch_dom(self, selector, text=None):
+        """Empieza a vigilar un elemento CSS (con el texto indicado); devuelve el id para wait_for_dom"""
+        watch_id = uuid.uuid4().hex
+        self.driver.execute_script(DOM_WATCH_SCRIPT, watch_id, selector, text, DOM_BINDING)
+        return watch_id
+
+    def wait_for_dom(self, watch_id, timeout=10):
+        if self.available:
+            found = self.wait_for(lambda event: event["type"] == "dom" and event["watch"] == watch_id, timeout)
+        else:
+            try:
+                found = WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                    lambda driver: watch_id in (driver.execute_script("return window.__notedeaDomEvents || []"))
+                )
+            except TimeoutException:
+                found = None
+        if not found:
+            self.driver.execute_script(DOM_UNWATCH_SCRIPT, watch_id)
+        return found is not None
+
+    def close(self):
+        if self._cancel_scope and self._trio_token:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except trio.RunFinishedError:
+                pass
+        self._thread.join(timeout=5)
+
+
+def get_driver_events(driver):
+    # Una conexión por navegador, compartida por todas las páginas y tests que lo usan
+    events = getattr(driver, "_notedea_events", None)
+    if events is None:
+        events = DriverEvents(driver)
+        driver._notedea_events = events
+    return events
+
+
+def close_driver_events(driver):
+    events = getattr(driver, "_notedea_events", None)
+    if events is not None:
+        events.close()
+        driver._notedea_events = None
@@ -0,0 +1,123 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "notedea-tests", "chromedriver.json")
+
+CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+
+def _version_of(executable):
+    try:
+        output = subprocess.run(
+            [executable, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+)\.(\d+)\.(\d+)\.(\d+)", output)
+    return match.group(0) if match else None
+
+
+def _major(version):
+    return version.split(".")[0] if version else None
+
+
+class ChromeDriverResolver:
+    """Localiza un chromedriver compatible con el Chrome instalado sin instalar nada durante los tests"""
+
+    def __init__(self, cache_file=CACHE_FILE):
+        self.cache_file = cache_file
+        self.diagnostics = []
+
+    def find_browser_version(self):
+        binary = os.environ.get("NOTEDEA_CHROME_BINARY")
+        candidates = [binary] if binary else CHROME_CANDIDATES
+        for candidate in candidates:
+            path = candidate if os.path.isfile(candidate) else shutil.which(candidate)
+            if not path:
+                continue
+            version = _version_of(path)
+            if version:
+                return version
+        self.diagnostics.append(f"Chrome no encontrado (buscado: {', '.join(candidates)})")
+        return None
+
+    def resolve(self, options):
+        browser_version = self.find_browser_version()
+
+        cached = self._load_cache()
+        if cached and self._is_compatible(cached["driver_path"], cached["driver_version"], browser_version, "caché"):
+            print(f"✅ ChromeDriver desde caché: {cached['driver_path']} ({cached['driver_version']})")
+            return cached["driver_path"]
+
+        for source, path in self._candidates(options):
+            if not path:
+                continue
+            driver_version = _version_of(path)
+            if self._is_compatible(path, driver_version, browser_version, source):
+                self._save_cache(path, driver_version, browser_version)
+                print(f"✅ ChromeDriver resuelto ({source}): {path} ({driver_version})")
+                return path
+
+        raise Exception(
+            "No se encontró un ChromeDriver compatible. Instálalo antes de ejecutar la suite "
+            "o indica su ruta en NOTEDEA_CHROMEDRIVER.\n  - " + "\n  - ".join(self.diagnostics)
+        )
+
+    def _candidates(self, options):
+        yield "NOTEDEA_CHROMEDRIVER", os.environ.get("NOTEDEA_CHROMEDRIVER")
+        yield "PATH", shutil.which("chromedriver")
+        try:
+            yield "Selenium Manager", self._selenium_manager_offline(options)
+        except Exception as e:
+            self.diagnostics.append(f"Selenium Manager: {e}")
+
+    def _selenium_manager_offline(self, options):
+        # Con --offline Selenium Manager solo devuelve drivers que ya estén en su caché: sin él descargaría
+        # chromedriver (o Chrome) si hay red y se quedaría esperando en un CI sin conexión
+        args = [str(SeleniumManager.get_binary()), "--browser", options.capabilities["browserName"], "--offline"]
+        if getattr(options, "binary_location", None):
+            args += ["--browser-path", str(options.binary_location)]
+        return SeleniumManager.run(args)["driver_path"]
+
+    def _is_compatible(self, path, driver_version, browser_version, source):
+        if not os.path.isfile(path):
+            self.diagnostics.append(f"{source}: {path} no existe")
+            return False
+        if not driver_version:
+            self.diagnostics.append(f"{source}: no se pudo obtener la versión de {path}")
+            return False
+        if browser_version and _major(driver_version) != _major(browser_version):
+            self.diagnostics.append(
+                f"{source}: {path} es ChromeDriver {driver_version}, Chrome instalado es {browser_version}"
+            )
+            return False
+        return True
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cache(self, driver_path, driver_version, browser_version):
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, "w") as f:
+            json.dump({
+                "driver_path": driver_path,
+                "driver_version": driver_version,
+                "browser_version": browser_version,
+                "resolved_at": datetime.now().isoformat(),
+            }, f, indent=2)
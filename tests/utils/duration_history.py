@@ -0,0 +1,108 @@
+import heapq
+import os
+import sqlite3
+import time
+from tests.utils.step_timer import percentile
+
+DURATIONS_DB = os.environ.get("NOTEDEA_DURATIONS_DB", ".pytest_cache/notedea_durations.sqlite3")
+# Media móvil exponencial: pesa más la última ejecución sin olvidar las anteriores
+SMOOTHING = 0.5
+DEFAULT_ESTIMATE = 5.0
+
+
+class DurationHistory:
+    """Duración de cada test (setup + call + teardown) acumulada entre ejecuciones en una base SQLite local"""
+
+    def __init__(self, path=DURATIONS_DB):
+        self.path = path
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS durations ("
+            " nodeid TEXT PRIMARY KEY, mean REAL NOT NULL, last REAL NOT NULL,"
+            " runs INTEGER NOT NULL, updated_at REAL NOT NULL)"
+        )
+        return connection
+
+    def load(self):
+        """{nodeid: duración estimada en segundos}"""
+        if not os.path.exists(self.path):
+            return {}
+        with self._connect() as connection:
+            return dict(connection.execute("SELECT nodeid, mean FROM durations"))
+
+    def record(self, durations):
+        if not durations:
+            return
+        now = time.time()
+        with self._connect() as connection:
+            for nodeid, duration in durations.items():
+                connection.execute(
+                    "INSERT INTO durations (nodeid, mean, last, runs, updated_at) VALUES (?, ?, ?, 1, ?)"
+                    " ON CONFLICT(nodeid) DO UPDATE SET"
+                    " mean = ? * excluded.last + (1 - ?) * mean, last = excluded.last,"
+                    " runs = runs + 1, updated_at = excluded.updated_at",
+                    (nodeid, duration, duration, now, SMOOTHING, SMOOTHING),
+                )
+
+
+def estimate_durations(nodeids, history):
+    """Duración prevista de cada test; los que no tienen historial toman la mediana de su módulo o la global"""
+    known = [history[nodeid] for nodeid in nodeids if nodeid in history]
+    fallback = percentile(known, 50) if known else DEFAULT_ESTIMATE
+
+    by_module = {}
+    for nodeid in nodeids:
+        if nodeid in history:
+            by_module.setdefault(nodeid.split("::")[0], []).append(history[nodeid])
+
+    return {
+        nodeid: history[nodeid] if nodeid in history else (
+            percentile(by_module[nodeid.split("::")[0]], 50) if nodeid.split("::")[0] in by_module else fallback
+        )
+        for nodeid in nodeids
+    }
+
+
+def predict_makespan(estimates, workers):
+    """Simula el reparto de los más largos primero al worker más libre; devuelve (makespan, carga por worker)"""
+    loads = [(0.0, worker) for worker in range(max(workers, 1))]
+    for duration in sorted(estimates, reverse=True):
+        load, worker = heapq.heappop(loads)
+        heapq.heappush(loads, (load + duration, worker))
+    per_worker = [load for load, _ in sorted(loads, key=lambda entry: entry[1])]
+    return max(per_worker), per_worker
+
+
+def format_schedule_summary(prediction, actual, wall_time):
+    lines = [
+        f"Planificación por historial: makespan previsto {prediction['makespan']:.1f}s, "
+        f"real {max(actual.values(), default=0.0):.1f}s (reloj {wall_time:.1f}s), "
+        f"{prediction['known']}/{prediction['tests']} tests con historial"
+    ]
+    for worker, busy in sorted(actual.items()):
+        lines.append(f"  {worker}: {busy:.1f}s ocupados")
+    return "\n".join(lines)
+
+
+class RunDurations:
+    """Duraciones de la ejecución en curso, por test y por worker (con xdist, en el proceso principal)"""
+
+    def __init__(self):
+        self.tests = {}
+        self.workers = {}
+        self.skipped = set()
+
+    def add(self, report):
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        self.tests[report.nodeid] = self.tests.get(report.nodeid, 0.0) + report.duration
+        self.workers[worker] = self.workers.get(worker, 0.0) + report.duration
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+
+    def per_test(self):
+        # Los tests saltados no dicen nada de su duración real
+        return {nodeid: duration for nodeid, duration in self.tests.items() if nodeid not in self.skipped}
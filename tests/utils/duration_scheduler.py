@@ -0,0 +1,91 @@
+from xdist.scheduler import LoadScheduling, LoadFileScheduling
+from tests.utils.duration_history import estimate_durations, predict_makespan
+
+# Cada worker tiene como mucho el test en curso y el siguiente; el resto se reparte según van terminando
+MAX_QUEUED_PER_WORKER = 2
+
+
+def _record_prediction(config, collection, history, unit_estimates, workers):
+    makespan, per_worker = predict_makespan(unit_estimates, workers)
+    config._duration_schedule = {
+        "tests": len(collection),
+        "known": sum(1 for nodeid in collection if nodeid in history),
+        "workers": workers,
+        "makespan": makespan,
+        "per_worker": per_worker,
+    }
+
+
+class DurationScheduling(LoadScheduling):
+    """Reparto de xdist de los tests más largos primero según su duración histórica (LPT).
+    Los cortos quedan para el final y rellenan los huecos de los workers que terminan antes."""
+
+    def __init__(self, config, log, history):
+        super().__init__(config, log)
+        self.history = history
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = estimate_durations(self.collection, self.history)
+        self.pending[:] = sorted(
+            range(len(self.collection)), key=lambda index: estimates[self.collection[index]], reverse=True
+        )
+        _record_prediction(self.config, self.collection, self.history, list(estimates.values()), len(self.nodes))
+        if not self.collection:
+            return
+
+        # Ronda a ronda, un test por worker: los más largos arrancan a la vez en workers distintos
+        for _ in range(MAX_QUEUED_PER_WORKER):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            queued = len(self.node2pending[node])
+            if queued < MAX_QUEUED_PER_WORKER:
+                self._send_tests(node, MAX_QUEUED_PER_WORKER - queued)
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
+
+
+class DurationFileScheduling(LoadFileScheduling):
+    """Como --dist loadfile (cada fichero entero en un mismo worker), pero con los ficheros más largos
+    primero según la suma de las duraciones históricas de sus tests."""
+
+    def __init__(self, config, log, history):
+        super().__init__(config, log)
+        self.history = history
+        self._ordered = False
+
+    def _assign_work_unit(self, node):
+        # schedule() llena la cola en orden de colección y reparte a continuación: se ordena en el primer reparto
+        if not self._ordered:
+            self._ordered = True
+            estimates = estimate_durations(self.collection, self.history)
+            totals = {
+                scope: sum(estimates[nodeid] for nodeid in nodeids) for scope, nodeids in self.workqueue.items()
+            }
+            for scope in sorted(totals, key=totals.get, reverse=True):
+                self.workqueue.move_to_end(scope)
+            _record_prediction(self.config, self.collection, self.history, list(totals.values()), len(self.nodes))
+        super()._assign_work_unit(node)
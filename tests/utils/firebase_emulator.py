@@ -0,0 +1,203 @@
+import json
+import os
+import socket
+import subprocess
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FIREBASE_JSON = os.path.join(ROOT_DIR, "firebase.json")
+
+
+def _wait_for_port(host, port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.25)
+    return False
+
+
+def _is_port_open(host, port):
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+class LatencyProxy:
+    """Proxy TCP que añade un retardo configurable a cada envío en ambos sentidos"""
+
+    def __init__(self, listen_host, listen_port, target_host, target_port, latency_ms=0):
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.target_host = target_host
+        self.target_port = target_port
+        self.latency_ms = latency_ms
+        self._server = None
+        self._running = False
+
+    def start(self):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((self.listen_host, self.listen_port))
+        self._server.listen()
+        self._running = True
+        threading.Thread(target=self._accept_loop, name="db-latency-proxy", daemon=True).start()
+        print(f"✅ Proxy de latencia {self.listen_host}:{self.listen_port} → "
+              f"{self.target_host}:{self.target_port} (+{self.latency_ms} ms)")
+
+    def stop(self):
+        self._running = False
+        if self._server:
+            self._server.close()
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            try:
+                upstream = socket.create_connection((self.target_host, self.target_port))
+            except OSError:
+                client.close()
+                continue
+            threading.Thread(target=self._pump, args=(client, upstream), daemon=True).start()
+            threading.Thread(target=self._pump, args=(upstream, client), daemon=True).start()
+
+    def _pump(self, source, destination):
+        # La mitad del retardo en cada sentido: latency_ms es el extra por ida y vuelta
+        delay = self.latency_ms / 2000
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                if delay:
+                    time.sleep(delay)
+                destination.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, destination):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
+
+
+class FirebaseEmulator:
+    """Arranca los emuladores de Auth y Realtime Database y los limpia entre tests"""
+
+    def __init__(self, project_id, namespace, app_database_host, latency_ms=0):
+        with open(FIREBASE_JSON) as f:
+            emulators = json.load(f)["emulators"]
+        self.project_id = project_id
+        self.namespace = namespace
+        self.auth_host = emulators["auth"]["host"]
+        self.auth_port = emulators["auth"]["port"]
+        self.database_host = emulators["database"]["host"]
+        self.database_port = emulators["database"]["port"]
+        self.cli = os.environ.get("NOTEDEA_FIREBASE_CLI", "firebase")
+
+        # La app se conecta al proxy, que reenvía al emulador con la latencia configurada
+        self.app_database_host = app_database_host
+        proxy_host, proxy_port = app_database_host.split(":")
+        self.proxy = LatencyProxy(proxy_host, int(proxy_port), self.database_host, self.database_port, latency_ms)
+
+        self.seed_data = None
+        self._process = None
+
+    @classmethod
+    def from_env(cls):
+        project_id = os.environ.get("NEXT_PUBLIC_FIREBASE_PROJECT_ID", "demo-notedea")
+        database_url = os.environ.get("NEXT_PUBLIC_FIREBASE_DATABASE_URL", "")
+        hostname = urllib.parse.urlparse(database_url).hostname or ""
+        namespace = urllib.parse.parse_qs(urllib.parse.urlparse(database_url).query).get("ns", [None])[0]
+        return cls(
+            project_id=project_id,
+            namespace=namespace or hostname.split(".")[0] or f"{project_id}-default-rtdb",
+            app_database_host=os.environ.get("NEXT_PUBLIC_FIREBASE_DATABASE_EMULATOR_HOST", "127.0.0.1:9010"),
+            latency_ms=int(os.environ.get("NOTEDEA_DB_LATENCY_MS", "0")),
+        )
+
+    def start(self, timeout=60):
+        if _is_port_open(self.auth_host, self.auth_port) and _is_port_open(self.database_host, self.database_port):
+            print("✅ Emuladores de Firebase ya en ejecución, se reutilizan")
+        else:
+            print("Iniciando emuladores de Firebase (auth, database)...")
+            self._process = subprocess.Popen(
+                [self.cli, "emulators:start", "--only", "auth,database", "--project", self.project_id],
+                cwd=ROOT_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+            if not (_wait_for_port(self.auth_host, self.auth_port, timeout)
+                    and _wait_for_port(self.database_host, self.database_port, timeout)):
+                self.stop()
+                raise Exception(
+                    f"Los emuladores de Firebase no respondieron en {timeout}s "
+                    f"(¿está instalado '{self.cli}'? configúralo con NOTEDEA_FIREBASE_CLI)"
+                )
+            print("✅ Emuladores de Firebase listos")
+
+        self.proxy.start()
+        self.wipe_accounts()
+        self.wipe_database()
+
+    def stop(self):
+        self.proxy.stop()
+        if self._process:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+
+    def database_request(self, method, path, data=None):
+        # "Bearer owner" es el token de administrador del emulador: ignora las reglas de seguridad
+        url = (
+            f"http://{self.database_host}:{self.database_port}/{path.strip('/')}.json"
+            f"?ns={urllib.parse.quote(self.namespace)}"
+        )
+        body = json.dumps(data).encode() if data is not None else None
+        request = urllib.request.Request(url, data=body, method=method, headers={
+            "Authorization": "Bearer owner",
+            "Content-Type": "application/json",
+        })
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read() or b"null")
+
+    def seed(self, data):
+        self.seed_data = data
+        self.database_request("PUT", "", data)
+
+    def seed_from_file(self, path):
+        with open(path) as f:
+            self.seed(json.load(f))
+        print(f"✅ Emulador sembrado desde {path}")
+
+    def reset(self):
+        # Un único PUT sobre la raíz deja la base en el estado sembrado (o vacía)
+        if self.seed_data is not None:
+            self.database_request("PUT", "", self.seed_data)
+        else:
+            self.wipe_database()
+
+    def wipe_database(self):
+        self.database_request("DELETE", "")
+
+    def wipe_accounts(self):
+        url = f"http://{self.auth_host}:{self.auth_port}/emulator/v1/projects/{self.project_id}/accounts"
+        request = urllib.request.Request(url, method="DELETE")
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
@@ -0,0 +1,58 @@
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from tests.utils.benchmark import summarize
+
+
+def request_json(method, url, payload=None, headers=None, timeout=120):
+    """Devuelve (status, cabeceras, cuerpo decodificado, latencia); status es None si no hubo respuesta"""
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={
+        "Content-Type": "application/json",
+        **(headers or {}),
+    })
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            status, response_headers = response.status, response.headers
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status, response_headers = e.code, e.headers
+    except (urllib.error.URLError, OSError):
+        return None, {}, None, time.perf_counter() - start
+    latency = time.perf_counter() - start
+    try:
+        body = json.loads(body or b"null")
+    except ValueError:
+        body = body.decode(errors="replace")
+    return status, response_headers, body, latency
+
+
+def post_json(url, payload, headers=None, timeout=120):
+    status, _, _, latency = request_json("POST", url, payload, headers, timeout)
+    return status, latency
+
+
+def run_load(url, payloads, concurrency, total_requests, headers=None):
+    """Lanza total_requests peticiones POST con la concurrencia indicada y resume throughput, latencias y errores"""
+    jobs = [payloads[i % len(payloads)] for i in range(total_requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda payload: post_json(url, payload, headers), jobs))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for status, latency in results if status == 200]
+    errors = [status for status, _ in results if status != 200]
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "elapsed": elapsed,
+        "throughput": total_requests / elapsed if elapsed else 0.0,
+        "error_rate": len(errors) / total_requests if total_requests else 0.0,
+        "error_statuses": sorted({str(status) for status in errors}),
+        "latency": summarize(latencies),
+    }
@@ -0,0 +1,45 @@
+# Patrones de la conexión de Realtime Database: WebSocket (/.ws) y long polling (/.lp)
+DATABASE_URL_PATTERNS = ["*/.ws?*", "*/.lp?*"]
+
+PRESETS = {
+    "slow-3g": {"latency_ms": 400, "download_kbps": 400, "upload_kbps": 400},
+    "fast-3g": {"latency_ms": 150, "download_kbps": 1600, "upload_kbps": 750},
+    "flaky": {"latency_ms": 800, "download_kbps": 250, "upload_kbps": 100},
+}
+
+
+def set_network_conditions(driver, offline=False, latency_ms=0, download_kbps=None, upload_kbps=None):
+    """Emula condiciones de red con CDP; sin argumentos deja la red sin limitar"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+        "offline": offline,
+        "latency": latency_ms,
+        # -1 desactiva el límite de ancho de banda; CDP lo espera en bytes por segundo
+        "downloadThroughput": download_kbps * 1024 / 8 if download_kbps else -1,
+        "uploadThroughput": upload_kbps * 1024 / 8 if upload_kbps else -1,
+    })
+
+
+def apply_preset(driver, name):
+    set_network_conditions(driver, **PRESETS[name])
+
+
+def block_urls(driver, patterns):
+    # Se conservan los bloqueos propios del perfil (p. ej. fuentes) que aplicó apply_runtime_settings
+    base = getattr(driver, "_notedea_blocked_urls", [])
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": base + list(patterns)})
+
+
+def cut_database_connection(driver):
+    """Corta solo la conexión con Realtime Database; el resto de la app (y las recargas) siguen funcionando"""
+    block_urls(driver, DATABASE_URL_PATTERNS)
+    # El bloqueo no afecta al WebSocket ya abierto: un instante offline hace que Firebase lo cierre,
+    # y al volver online sus reintentos de conexión quedan bloqueados
+    set_network_conditions(driver, offline=True)
+    set_network_conditions(driver)
+
+
+def restore_network(driver):
+    block_urls(driver, [])
+    set_network_conditions(driver)
@@ -0,0 +1,144 @@
+import http.client
+import json
+import queue
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CONNECTIONS = 4
+
+
+class HttpConnectionPool:
+    """Conexiones keep-alive reutilizables hacia un mismo host de Realtime Database"""
+
+    def __init__(self, base_url, size=DEFAULT_CONNECTIONS, timeout=60):
+        parsed = urllib.parse.urlparse(base_url)
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _connect(self):
+        connection_cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return connection_cls(self.netloc, timeout=self.timeout)
+
+    def request(self, method, path, body=None, headers=None):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+
+        # Una conexión reutilizada puede haber sido cerrada por el servidor: se reintenta una vez con otra nueva
+        for attempt in range(2):
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if attempt:
+                    raise
+                connection = self._connect()
+
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+        if response.status >= 400:
+            raise Exception(f"{method} {path.split('?')[0]} respondió {response.status}: {data[:200]!r}")
+        return json.loads(data or b"null")
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(base_url, size=DEFAULT_CONNECTIONS):
+    # Un pool por host y proceso: las conexiones se conservan entre tests
+    with _pools_lock:
+        if base_url not in _pools:
+            _pools[base_url] = HttpConnectionPool(base_url, size)
+        return _pools[base_url]
+
+
+def close_connection_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+class NoteSeeder:
+    """Escribe y borra notas de un usuario con actualizaciones multi-ruta sobre notes/{userId}.
+    Recuerda las notas que ha creado para borrarlas todas de una vez en teardown()."""
+
+    def __init__(self, base_url, user_id, query=None, headers=None,
+                 batch_size=DEFAULT_BATCH_SIZE, connections=DEFAULT_CONNECTIONS):
+        self.pool = get_connection_pool(base_url, connections)
+        self.user_id = user_id
+        self.query = urllib.parse.urlencode(query or {})
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.batch_size = batch_size
+        self.connections = connections
+        self.created = set()
+
+    @classmethod
+    def for_emulator(cls, emulator, user_id, **kwargs):
+        # "Bearer owner" es el token de administrador del emulador: ignora las reglas de seguridad
+        return cls(
+            f"http://{emulator.database_host}:{emulator.database_port}",
+            user_id,
+            query={"ns": emulator.namespace},
+            headers={"Authorization": "Bearer owner"},
+            **kwargs,
+        )
+
+    @classmethod
+    def for_database(cls, database_url, user_id, id_token, **kwargs):
+        return cls(database_url, user_id, query={"auth": id_token}, **kwargs)
+
+    def _path(self):
+        return f"/notes/{self.user_id}.json?{self.query}"
+
+    def _patch_in_batches(self, updates):
+        items = list(updates.items())
+        batches = [dict(items[i:i + self.batch_size]) for i in range(0, len(items), self.batch_size)]
+        body = lambda batch: json.dumps(batch).encode()
+        if len(batches) <= 1:
+            for batch in batches:
+                self.pool.request("PATCH", self._path(), body(batch), self.headers)
+            return
+        with ThreadPoolExecutor(max_workers=self.connections) as executor:
+            list(executor.map(lambda batch: self.pool.request("PATCH", self._path(), body(batch), self.headers), batches))
+
+    def seed(self, notes):
+        """Escribe las notas {id: datos}; devuelve sus ids"""
+        self._patch_in_batches({
+            note_id: {**note, "userId": self.user_id} for note_id, note in notes.items()
+        })
+        self.created.update(notes)
+        return list(notes)
+
+    def delete(self, note_ids):
+        # En una actualización multi-ruta, null borra la ruta
+        note_ids = list(note_ids)
+        self._patch_in_batches({note_id: None for note_id in note_ids})
+        self.created.difference_update(note_ids)
+
+    def count(self):
+        # shallow=true devuelve solo las claves, sin descargar el contenido de las notas
+        notes = self.pool.request("GET", f"{self._path()}&shallow=true", headers=self.headers)
+        return len(notes or {})
+
+    def teardown(self):
+        if self.created:
+            self.delete(self.created)
@@ -0,0 +1,138 @@
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def build_enhanced_content(prompt):
+    title_match = re.search(r"Título original: (.*)", prompt)
+    content_match = re.search(r"Contenido original:\n(.*?)\n\nPor favor", prompt, re.S)
+    title = title_match.group(1).strip() if title_match else "Idea"
+    content = content_match.group(1).strip() if content_match else prompt.strip()
+    return (
+        f"# {title}\n\n"
+        f"## Resumen\n\n{content}\n\n"
+        "## Puntos clave\n\n"
+        "- Objetivo claro y medible\n"
+        "- Público al que va dirigido\n"
+        "- Próximos pasos concretos\n"
+    )
+
+
+class OpenAIStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        stub = self.server.stub
+        stub.record_request()
+
+        prompt = body.get("messages", [{}])[-1].get("content", "")
+        tokens = re.findall(r"\S+\s*", build_enhanced_content(prompt))
+
+        time.sleep(stub.first_token_ms / 1000)
+        if body.get("stream"):
+            self._stream(body, tokens, stub)
+        else:
+            time.sleep(len(tokens) * stub.token_ms / 1000)
+            self._send_json({
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(tokens),
+                          "total_tokens": len(prompt.split()) + len(tokens)},
+            })
+
+    def _send_json(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, body, tokens, stub):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def chunk(delta, finish_reason=None):
+            payload = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+            self.wfile.flush()
+
+        chunk({"role": "assistant", "content": ""})
+        for token in tokens:
+            chunk({"content": token})
+            time.sleep(stub.token_ms / 1000)
+        chunk({}, finish_reason="stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+class OpenAIStub:
+    """Servidor local compatible con /v1/chat/completions de OpenAI, con latencia y streaming configurables"""
+
+    def __init__(self, host="127.0.0.1", port=8787, first_token_ms=300, token_ms=10):
+        self.host = host
+        self.port = port
+        self.first_token_ms = first_token_ms
+        self.token_ms = token_ms
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            port=int(os.environ.get("NOTEDEA_OPENAI_STUB_PORT", "8787")),
+            first_token_ms=int(os.environ.get("NOTEDEA_OPENAI_STUB_LATENCY_MS", "300")),
+            token_ms=int(os.environ.get("NOTEDEA_OPENAI_STUB_TOKEN_MS", "10")),
+        )
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}/v1"
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), OpenAIStubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        threading.Thread(target=self._server.serve_forever, name="openai-stub", daemon=True).start()
+        print(f"✅ Stub de OpenAI escuchando en {self.base_url} "
+              f"(primer token {self.first_token_ms} ms, {self.token_ms} ms/token)")
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
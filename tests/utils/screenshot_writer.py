@@ -0,0 +1,118 @@
+import base64
+import hashlib
+import itertools
+import os
+import queue
+import threading
+from datetime import datetime
+
+POLICIES = ("always", "on-failure", "sampled")
+
+
+class ScreenshotWriter:
+    """Captura en el hilo del test y delega decodificación, deduplicación y escritura a un hilo de fondo"""
+
+    def __init__(self, directory="screenshots", policy="always", sample_every=3):
+        if policy not in POLICIES:
+            raise ValueError(f"Política de screenshots desconocida: {policy} (opciones: {', '.join(POLICIES)})")
+        self.directory = directory
+        self.policy = policy
+        self.sample_every = sample_every
+
+        self._queue = queue.Queue()
+        # Los contadores los actualizan el hilo del test y el de fondo
+        self._lock = threading.Lock()
+        self._last_hash = {}
+        self._captures_per_test = {}
+        self._sequence = itertools.count(1)
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+        self.written = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.errors = 0
+
+    def capture(self, driver, name, force=False):
+        test_id = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0]
+        if not force and not self._should_capture(test_id):
+            with self._lock:
+                self.skipped += 1
+            return None
+
+        # El contador evita que dos capturas con el mismo nombre en el mismo segundo se pisen
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.directory, f"{name}_{timestamp}_{next(self._sequence):04d}.png")
+        self._queue.put((test_id, path, driver.get_screenshot_as_base64(), force))
+        return path
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def summary(self):
+        with self._lock:
+            written, duplicates, skipped, errors = self.written, self.duplicates, self.skipped, self.errors
+        return (
+            f"Screenshots ({self.policy}): {written} escritos, "
+            f"{duplicates} duplicados omitidos, {skipped} omitidos por política"
+            + (f", {errors} errores" if errors else "")
+        )
+
+    def _should_capture(self, test_id):
+        if self.policy == "on-failure":
+            return False
+        if self.policy == "sampled":
+            count = self._captures_per_test.get(test_id, 0)
+            self._captures_per_test[test_id] = count + 1
+            return count % self.sample_every == 0
+        return True
+
+    def _run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            test_id, path, encoded, force = item
+            try:
+                png = base64.b64decode(encoded)
+                digest = hashlib.sha1(png).hexdigest()
+                # Un frame idéntico al anterior del mismo test no aporta nada, salvo si se pidió expresamente
+                if not force and self._last_hash.get(test_id) == digest:
+                    with self._lock:
+                        self.duplicates += 1
+                    continue
+                self._last_hash[test_id] = digest
+                with open(path, "wb") as f:
+                    f.write(png)
+                with self._lock:
+                    self.written += 1
+            except Exception as e:
+                # Cualquier error deja el hilo vivo: si muriera, las capturas siguientes se perderían sin aviso
+                print(f"⚠️ No se pudo guardar el screenshot {path}: {e}")
+                with self._lock:
+                    self.errors += 1
+
+
+_writer = None
+
+
+def get_screenshot_writer():
+    global _writer
+    if _writer is None:
+        _writer = ScreenshotWriter(
+            policy=os.environ.get("NOTEDEA_SCREENSHOTS", "always"),
+            sample_every=int(os.environ.get("NOTEDEA_SCREENSHOT_SAMPLE_EVERY", "3")),
+        )
+    return _writer
+
+
+def close_screenshot_writer():
+    global _writer
+    if _writer is None:
+        return None
+    _writer.close()
+    summary = _writer.summary()
+    _writer = None
+    return summary
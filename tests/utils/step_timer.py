@@ -0,0 +1,139 @@
+import functools
+import time
+from selenium.webdriver.remote.webelement import WebElement
+
+
+class StepRecorder:
+    """Acumula la línea de tiempo de pasos de cada test y los agregados por método"""
+
+    def __init__(self):
+        self.timelines = {}
+        self.current_test = None
+        self._test_start = None
+        self._depth = 0
+
+    def start_test(self, test_id):
+        self.current_test = test_id
+        self._test_start = time.perf_counter()
+        self.timelines[test_id] = []
+
+    def finish_test(self):
+        self.current_test = None
+        self._depth = 0
+
+    def timed(self, name, func, *args, **kwargs):
+        if self.current_test is None:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._depth -= 1
+            self.timelines[self.current_test].append({
+                "step": name,
+                "start": start - self._test_start,
+                "duration": time.perf_counter() - start,
+                "depth": depth,
+            })
+
+    def timeline(self, test_id):
+        return sorted(self.timelines.get(test_id, []), key=lambda step: step["start"])
+
+    def merge(self, timelines):
+        self.timelines.update(timelines)
+
+    def aggregates(self):
+        durations = {}
+        for steps in self.timelines.values():
+            for step in steps:
+                durations.setdefault(step["step"], []).append(step["duration"])
+        return {
+            name: {
+                "count": len(values),
+                "total": sum(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "max": max(values),
+            }
+            for name, values in sorted(durations.items())
+        }
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(index)]
+
+
+recorder = StepRecorder()
+
+
+def timed_method(name, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        return recorder.timed(name, method, *args, **kwargs)
+    return wrapper
+
+
+def instrument_class(cls):
+    # Envuelve los métodos públicos definidos en la propia clase (los heredados ya están envueltos)
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not callable(value):
+            continue
+        setattr(cls, attr, timed_method(f"{cls.__name__}.{attr}", value))
+    return cls
+
+
+class TimedWebElement(WebElement):
+    def click(self):
+        return recorder.timed("WebElement.click", super().click)
+
+    def send_keys(self, *value):
+        return recorder.timed("WebElement.send_keys", super().send_keys, *value)
+
+    def clear(self):
+        return recorder.timed("WebElement.clear", super().clear)
+
+
+def instrument_driver(driver):
+    if getattr(driver, "_notedea_timed", False):
+        return driver
+
+    execute_script = driver.execute_script
+    execute_async_script = driver.execute_async_script
+    driver.execute_script = lambda *args: recorder.timed("driver.execute_script", execute_script, *args)
+    driver.execute_async_script = lambda *args: recorder.timed(
+        "driver.execute_async_script", execute_async_script, *args
+    )
+    # Selenium crea los elementos con esta clase, así los clics también quedan medidos
+    driver._web_element_cls = TimedWebElement
+    driver._notedea_timed = True
+    return driver
+
+
+def render_timeline_html(steps):
+    rows = "".join(
+        f"<tr><td>{step['start']:.3f}</td><td style='padding-left:{step['depth'] * 16}px'>{step['step']}</td>"
+        f"<td>{step['duration'] * 1000:.0f}</td></tr>"
+        for step in steps
+    )
+    return (
+        "<table class='step-timeline'><thead><tr><th>Inicio (s)</th><th>Paso</th><th>Duración (ms)</th></tr>"
+        f"</thead><tbody>{rows}</tbody></table>"
+    )
+
+
+def render_aggregates_html(aggregates):
+    rows = "".join(
+        f"<tr><td>{name}</td><td>{stats['count']}</td><td>{stats['p50'] * 1000:.0f}</td>"
+        f"<td>{stats['p95'] * 1000:.0f}</td><td>{stats['max'] * 1000:.0f}</td><td>{stats['total']:.1f}</td></tr>"
+        for name, stats in sorted(aggregates.items(), key=lambda item: -item[1]["total"])
+    )
+    return (
+        "<h2>Tiempos por método</h2><table class='step-aggregates'><thead><tr><th>Método</th><th>Llamadas</th>"
+        "<th>p50 (ms)</th><th>p95 (ms)</th><th>Máx (ms)</th><th>Total (s)</th></tr>"
+        f"</thead><tbody>{rows}</tbody></table>"
+    )
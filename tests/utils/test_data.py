@@ -1,13 +1,31 @@
+import math
+import os
 import random
 import string
+import time
 from datetime import datetime
 
+# Mezcla de formatos de las notas reales: la mayoría texto o Markdown sencillo, algunas con código o tablas
+MARKDOWN_STYLES = [
+    ("plain", 40),
+    ("headings", 25),
+    ("lists", 15),
+    ("code", 10),
+    ("rich", 10),
+]
+# Longitud del contenido log-normal: mediana ~600 caracteres con una cola de notas muy largas
+NOTE_LENGTH_MEDIAN = 600
+NOTE_LENGTH_SIGMA = 1.2
+NOTE_LENGTH_BOUNDS = (20, 50000)
+
 class TestDataGenerator:
     @staticmethod
     def generate_email():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         random_string = ''.join(random.choices(string.ascii_lowercase, k=5))
-        return f"test_{timestamp}_{random_string}@example.com"
+        # El id del worker evita colisiones de usuarios (y de notes/{userId}) entre procesos paralelos
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return f"test_{timestamp}_{worker_id}_{random_string}@example.com"
     
     @staticmethod
     def generate_password(length=8):
@@ -26,7 +44,7 @@ class TestDataGenerator:
         return f"{random.choice(titles)} {timestamp}"
     
     @staticmethod
-    def generate_note_content(min_length=50):
+    def generate_note_content(min_length=50, rng=random):
         content_templates = [
             "Esta es una idea innovadora que podría cambiar la forma en que pensamos sobre el desarrollo de software. "
             "Incluye aspectos técnicos, metodológicos y estratégicos que pueden ser aplicados en diferentes contextos.",
@@ -41,13 +59,88 @@ class TestDataGenerator:
             "y la automatización de tareas repetitivas para incrementar la productividad."
         ]
         
-        content = random.choice(content_templates)
+        content = rng.choice(content_templates)
         
         while len(content) < min_length:
-            content += " " + random.choice(content_templates)
+            content += " " + rng.choice(content_templates)
         
         return content
     
+    @staticmethod
+    def generate_notes(count, content_length=200):
+        """Notas listas para escribir en notes/{userId}, con updatedAt escalonado (la primera es la más reciente)"""
+        now_ms = int(time.time() * 1000)
+        return {
+            f"seed-{index:05d}": {
+                "title": f"Nota sembrada {index}",
+                "content": TestDataGenerator.generate_note_content(content_length),
+                "createdAt": now_ms - index * 1000,
+                "updatedAt": now_ms - index * 1000,
+            }
+            for index in range(count)
+        }
+    
+    @staticmethod
+    def generate_markdown_note(length, style="headings", rng=random):
+        """Contenido Markdown de aproximadamente `length` caracteres en el estilo indicado"""
+        blocks = {
+            "plain": lambda n: TestDataGenerator.generate_note_content(0, rng),
+            "headings": lambda n: f"## Apartado {n}\n\n" + TestDataGenerator.generate_note_content(0, rng),
+            "lists": lambda n: "\n".join(
+                f"- [{rng.choice(' x')}] Tarea {n}.{item}: {rng.choice(['revisar', 'diseñar', 'probar', 'publicar'])}"
+                for item in range(rng.randint(2, 6))
+            ),
+            "code": lambda n: f"Ejemplo {n}:\n\n```python\ndef paso_{n}(datos):\n    return [d * {n} for d in datos]\n```",
+            "rich": lambda n: (
+                f"> Cita {n} sobre la idea\n\n| Métrica | Valor |\n| --- | --- |\n| Usuarios | {rng.randint(1, 9999)} |\n\n"
+                f"Más detalles en [el documento {n}](https://example.com/docs/{n}) con **énfasis** y *matices*."
+            ),
+        }
+        parts = []
+        n = 0
+        while sum(len(part) + 2 for part in parts) < length:
+            # Las notas con formato alternan sus bloques característicos con párrafos normales
+            parts.append(blocks[style if n % 2 == 0 else "plain"](n))
+            n += 1
+        return "\n\n".join(parts)[:max(length, 1)]
+    
+    @staticmethod
+    def generate_realistic_notes(count, seed=None, prefix="seed"):
+        """Notas {id: datos} con longitudes y formatos Markdown variados; con `seed` el resultado es reproducible"""
+        rng = random.Random(seed)
+        styles, weights = zip(*MARKDOWN_STYLES)
+        now_ms = int(time.time() * 1000)
+        notes = {}
+        for index in range(count):
+            length = int(min(max(rng.lognormvariate(math.log(NOTE_LENGTH_MEDIAN), NOTE_LENGTH_SIGMA),
+                                 NOTE_LENGTH_BOUNDS[0]), NOTE_LENGTH_BOUNDS[1]))
+            style = rng.choices(styles, weights)[0]
+            notes[f"{prefix}-{index:05d}"] = {
+                "title": f"{rng.choice(['Idea', 'Proyecto', 'Borrador', 'Plan', 'Notas'])} {index}",
+                "content": TestDataGenerator.generate_markdown_note(length, style, rng),
+                "createdAt": now_ms - index * 1000,
+                "updatedAt": now_ms - index * 1000,
+            }
+        return notes
+    
+    @staticmethod
+    def generate_markdown_document(lines=5000):
+        """Documento Markdown largo con encabezados, párrafos, listas y bloques de código"""
+        sections = [
+            ["## Sección {n}", ""],
+            ["Párrafo {n} con **negrita**, *cursiva* y `código` en línea.", ""],
+            ["- Elemento {n}", "- Otro elemento", "- Último elemento", ""],
+            ["```python", "def funcion_{n}():", "    return {n}", "```", ""],
+            ["> Cita número {n}", ""],
+        ]
+        document = []
+        n = 0
+        while len(document) < lines:
+            for line in sections[n % len(sections)]:
+                document.append(line.format(n=n))
+            n += 1
+        return "\n".join(document[:lines])
+    
     @staticmethod
     def generate_short_content():
         return "Contenido muy corto"
@@ -0,0 +1,175 @@
+import json
+import os
+import re
+from tests.utils.benchmark import summarize
+
+TRACE_DIR = os.environ.get("NOTEDEA_TRACE_DIR", "reports/traces")
+
+# Categorías de la pestaña Performance de DevTools: tareas, layout/paint y contadores de memoria
+TRACE_CATEGORIES = ",".join([
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "toplevel",
+    "blink.user_timing",
+    "loading",
+])
+
+LONG_TASK_US = 50_000
+LAYOUT_EVENTS = {"Layout", "UpdateLayoutTree"}
+PAINT_EVENTS = {"Paint", "PaintImage", "RasterTask", "CompositeLayers"}
+
+
+def enable_performance_logging(chrome_options):
+    # Con traceCategories ChromeDriver graba la traza y la entrega en el log "performance"
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    chrome_options.add_experimental_option("perfLoggingPrefs", {
+        "enableNetwork": True,
+        "enablePage": False,
+        "traceCategories": TRACE_CATEGORIES,
+    })
+    return chrome_options
+
+
+def start_trace(driver):
+    """Descarta lo registrado antes del test (el navegador viene del pool) y activa las métricas de CDP"""
+    driver.execute_cdp_cmd("Performance.enable", {})
+    driver.get_log("performance")
+
+
+def collect_trace(driver):
+    """Devuelve (eventos de traza, eventos de red, métricas de CDP) registrados desde start_trace"""
+    trace_events, network_events = [], []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"] == "Tracing.dataCollected":
+            trace_events.extend(message["params"].get("value", []))
+        elif message["method"].startswith("Network."):
+            network_events.append(message)
+
+    metrics = {
+        metric["name"]: metric["value"]
+        for metric in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    }
+    return trace_events, network_events, metrics
+
+
+def write_trace(test_id, trace_events):
+    # Formato de Chrome: se abre en la pestaña Performance de DevTools o en ui.perfetto.dev
+    os.makedirs(TRACE_DIR, exist_ok=True)
+    path = os.path.join(TRACE_DIR, re.sub(r"[^\w.-]+", "_", test_id).strip("_") + ".json")
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace_events}, f)
+    return path
+
+
+def _renderer_main_threads(trace_events):
+    return {
+        (event["pid"], event["tid"])
+        for event in trace_events
+        if event.get("ph") == "M" and event.get("name") == "thread_name"
+        and event.get("args", {}).get("name") == "CrRendererMain"
+    }
+
+
+def build_waterfall(network_events):
+    requests = {}
+    for message in network_events:
+        params = message["params"]
+        request = requests.setdefault(params.get("requestId"), {})
+        if message["method"] == "Network.requestWillBeSent":
+            request.update({
+                "url": params["request"]["url"],
+                "method": params["request"]["method"],
+                "type": params.get("type"),
+                "start": params["timestamp"],
+            })
+        elif message["method"] == "Network.responseReceived":
+            request["status"] = params["response"]["status"]
+        elif message["method"] == "Network.loadingFinished":
+            request.update({"end": params["timestamp"], "bytes": params.get("encodedDataLength", 0)})
+        elif message["method"] == "Network.loadingFailed":
+            request.update({"end": params["timestamp"], "error": params.get("errorText")})
+
+    waterfall = [request for request in requests.values() if "start" in request]
+    if not waterfall:
+        return []
+    origin = min(request["start"] for request in waterfall)
+    for request in waterfall:
+        request["offset"] = request["start"] - origin
+        request["duration"] = request["end"] - request["start"] if "end" in request else None
+        del request["start"]
+        request.pop("end", None)
+    return sorted(waterfall, key=lambda request: request["offset"])
+
+
+def summarize_trace(trace_events, network_events, metrics):
+    main_threads = _renderer_main_threads(trace_events)
+    complete = [event for event in trace_events if event.get("ph") == "X" and "dur" in event]
+
+    long_tasks = [
+        event["dur"] / 1e6 for event in complete
+        if event["name"] == "RunTask" and event["dur"] >= LONG_TASK_US
+        and (not main_threads or (event["pid"], event["tid"]) in main_threads)
+    ]
+    heap_samples = [
+        event["args"]["data"]["jsHeapSizeUsed"] for event in trace_events
+        if event.get("name") == "UpdateCounters" and "jsHeapSizeUsed" in event.get("args", {}).get("data", {})
+    ]
+    waterfall = build_waterfall(network_events)
+
+    return {
+        "long_tasks": summarize(long_tasks),
+        "total_blocking_time": sum(duration - LONG_TASK_US / 1e6 for duration in long_tasks),
+        "layout": {
+            "count": sum(1 for event in complete if event["name"] in LAYOUT_EVENTS),
+            "total": sum(event["dur"] for event in complete if event["name"] in LAYOUT_EVENTS) / 1e6,
+        },
+        "paint": {
+            "count": sum(1 for event in complete if event["name"] in PAINT_EVENTS),
+            "total": sum(event["dur"] for event in complete if event["name"] in PAINT_EVENTS) / 1e6,
+        },
+        "js_heap": {
+            "peak": max(heap_samples) if heap_samples else None,
+            "used": metrics.get("JSHeapUsedSize"),
+            "total": metrics.get("JSHeapTotalSize"),
+        },
+        "dom_nodes": metrics.get("Nodes"),
+        "network": {
+            "requests": len(waterfall),
+            "bytes": sum(request.get("bytes", 0) for request in waterfall),
+            "failed": sum(1 for request in waterfall if "error" in request),
+        },
+        "waterfall": waterfall,
+    }
+
+
+def render_trace_summary_html(summary, trace_link=None, max_requests=25):
+    long_tasks = summary["long_tasks"]
+    heap = summary["js_heap"]
+    rows = [
+        ("Tareas largas (≥50 ms)", f"{long_tasks['count']}"
+         + (f", máx {long_tasks['max'] * 1000:.0f} ms" if long_tasks["count"] else "")),
+        ("Total blocking time", f"{summary['total_blocking_time'] * 1000:.0f} ms"),
+        ("Layout / estilos", f"{summary['layout']['count']} ({summary['layout']['total'] * 1000:.0f} ms)"),
+        ("Paint", f"{summary['paint']['count']} ({summary['paint']['total'] * 1000:.0f} ms)"),
+        ("Heap JS", f"{(heap['used'] or 0) / 1e6:.1f} MB (pico {(heap['peak'] or 0) / 1e6:.1f} MB)"),
+        ("Red", f"{summary['network']['requests']} peticiones, {summary['network']['bytes'] / 1024:.0f} KB, "
+                f"{summary['network']['failed']} fallidas"),
+    ]
+    table = "".join(f"<tr><th>{name}</th><td>{value}</td></tr>" for name, value in rows)
+
+    waterfall = summary["waterfall"][:max_requests]
+    span = max((request["offset"] + (request["duration"] or 0) for request in waterfall), default=0) or 1
+    bars = "".join(
+        f"<tr><td title='{request['url']}'>{request['url'][:80]}</td><td>{request.get('status', request.get('error', ''))}</td>"
+        f"<td style='width:300px'><div style='margin-left:{request['offset'] / span * 100:.1f}%;"
+        f"width:{max((request['duration'] or 0) / span * 100, 0.5):.1f}%;height:8px;background:#4f46e5'></div></td>"
+        f"<td>{(request['duration'] or 0) * 1000:.0f}</td></tr>"
+        for request in waterfall
+    )
+    link = f"<p><a href='{trace_link}'>Traza completa (DevTools / Perfetto)</a></p>" if trace_link else ""
+    return (
+        f"<table class='trace-summary'>{table}</table>"
+        "<table class='network-waterfall'><thead><tr><th>URL</th><th>Estado</th><th>Cascada</th><th>ms</th></tr>"
+        f"</thead><tbody>{bars}</tbody></table>{link}"
+    )
@@ -0,0 +1,52 @@
+import json
+import os
+from tests.utils.step_timer import percentile
+
+# Presupuestos medidos contra el build de producción (next build && next start), no contra next dev
+BUDGETS_PATH = os.environ.get(
+    "NOTEDEA_WEB_VITALS_BUDGETS",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "web_vitals_budgets.json"),
+)
+
+# Clave del fichero de presupuestos → (métrica de BasePage.measure_page_load, factor hasta la unidad del fichero)
+BUDGET_METRICS = {
+    "ttfb_ms": ("ttfb", 1000),
+    "dom_content_loaded_ms": ("dom_content_loaded", 1000),
+    "load_ms": ("load", 1000),
+    "fcp_ms": ("fcp", 1000),
+    "lcp_ms": ("lcp", 1000),
+    "tbt_ms": ("tbt", 1000),
+    "js_bytes": ("js_bytes", 1),
+}
+
+
+def load_budgets(path=BUDGETS_PATH):
+    with open(path) as f:
+        budgets = json.load(f)
+    for page, limits in budgets.items():
+        unknown = set(limits) - set(BUDGET_METRICS)
+        if unknown:
+            raise ValueError(f"Métricas desconocidas en el presupuesto de {page}: {', '.join(sorted(unknown))}")
+    return budgets
+
+
+def median_page_load(samples):
+    """Mediana de cada métrica sobre varias cargas; descarta las que el navegador no reportó"""
+    merged = {}
+    for metric, _ in BUDGET_METRICS.values():
+        values = [sample[metric] for sample in samples if sample.get(metric) is not None]
+        merged[metric] = percentile(values, 50) if values else None
+    return merged
+
+
+def check_budgets(page, vitals, budgets):
+    """Devuelve una lista de incumplimientos legibles; vacía si la página está dentro de presupuesto"""
+    violations = []
+    for key, limit in budgets.get(page, {}).items():
+        metric, scale = BUDGET_METRICS[key]
+        value = vitals.get(metric)
+        if value is None:
+            violations.append(f"{page}: {metric} no disponible (presupuesto {limit})")
+        elif value * scale > limit:
+            violations.append(f"{page}: {metric} = {value * scale:.0f} > {limit}")
+    return violations